@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hot-Path Benchmark Suite
+Times the calculation and reporting hot paths on representative sections
+(200-1000 mm, DB12-DB32 bars) and batch sizes from 1 to 100k columns.
+
+Every benchmark reports throughput, latency percentiles and the peak
+Python/NumPy allocation (tracemalloc, measured on a separate call so it
+does not skew the timings) after one untimed warm-up call. Results are
+JSON so runs of two versions can be compared.
+
+Usage:
+    python benchmarks/bench_hotpaths.py --output bench.json
+    python benchmarks/bench_hotpaths.py --quick --only batch
+    python benchmarks/bench_hotpaths.py --compare baseline.json
+Exits with status 1 when --compare finds a p50 slower than --max-slowdown.
+"""
+
+import argparse
+import datetime
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from column_engine import ColumnDesignEngine, DEFAULT_INPUTS, REBAR_KEYS, HAS_NUMPY  # noqa: E402
+
+
+# Representative section grid
+SECTION_SIZES = list(range(200, 1001, 100))  # mm
+BAR_SIZES = ["DB12", "DB16", "DB20", "DB25", "DB32"]
+BAR_COUNTS = [2, 3, 4, 5]
+
+# Batch sizes (columns per call)
+BATCH_SIZES = [1, 10, 100, 1000, 10000, 100000]
+QUICK_BATCH_SIZES = [1, 10, 100, 1000, 10000]
+
+# Dense curves hold ~250 points per section and direction, so stop earlier
+MAX_CURVE_BATCH = 10000
+
+# Benchmark groups selectable with --only
+GROUPS = ('scalar', 'batch', 'curves', 'report')
+
+
+def representative_sections():
+    """Input dicts covering the section sizes, bar sizes and bar counts"""
+    sections = []
+    for size, bar, count in itertools.product(SECTION_SIZES, BAR_SIZES, BAR_COUNTS):
+        Ag = size * size
+        sections.append({**DEFAULT_INPUTS,
+                         'width': float(size), 'height': float(size),
+                         'rebar_x': bar, 'rebar_y': bar, 'corner_rebar': bar,
+                         'num_bars_x': count, 'num_bars_y': count,
+                         # About 30% of the squash load, with a small eccentricity
+                         'P': round(0.3 * 0.85 * DEFAULT_INPUTS['fc'] * Ag / 1000),
+                         'Mx': round(0.02 * Ag * size / 1e6, 1),
+                         'My': round(0.015 * Ag * size / 1e6, 1)})
+    return sections
+
+
+def batch_columns(sections, n):
+    """Struct-of-arrays input for perform_calculations_batch, cycling through the sections"""
+    import numpy as np
+    index = np.arange(n) % len(sections)
+    columns = {}
+    for key in DEFAULT_INPUTS:
+        values = [section[key] for section in sections]
+        dtype = str if key in REBAR_KEYS else float
+        columns[key] = np.asarray(values, dtype=dtype)[index]
+    return columns
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(q / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[rank]
+
+
+def measure(fn, repeat, items_per_call=1, setup=None):
+    """Time repeat calls of fn after one warm-up call, then measure peak memory on one more"""
+    if setup:
+        setup()
+    fn()  # Imports and first-use initialisation are not part of the timing
+
+    times = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    if setup:
+        setup()
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    times.sort()
+    total = sum(times)
+    return {
+        'calls': repeat,
+        'items_per_call': items_per_call,
+        'throughput_per_s': repeat * items_per_call / total if total > 0 else None,
+        'mean_ms': total / repeat * 1000,
+        'p50_ms': percentile(times, 50) * 1000,
+        'p90_ms': percentile(times, 90) * 1000,
+        'p99_ms': percentile(times, 99) * 1000,
+        'min_ms': times[0] * 1000,
+        'max_ms': times[-1] * 1000,
+        'peak_memory_mb': peak / 1e6
+    }
+
+
+def _cycle(items):
+    """Callable returning the next item on every call"""
+    iterator = itertools.cycle(items)
+    return lambda: next(iterator)
+
+
+def bench_scalar(sections, repeat):
+    """perform_calculations and the cached/uncached calculate_pm_interaction"""
+    engine = ColumnDesignEngine()
+    results = [engine.perform_calculations(section) for section in sections]
+    next_section = _cycle(sections)
+    next_results = _cycle(results)
+
+    benchmarks = {
+        'perform_calculations': measure(lambda: engine.perform_calculations(next_section()), repeat),
+        'calculate_pm_interaction_cold': measure(
+            lambda: engine.calculate_pm_interaction(next_results(), 'x'), repeat,
+            setup=engine.pm_cache.clear),
+    }
+    for r in results:
+        engine.calculate_pm_interaction(r, 'x')
+    benchmarks['calculate_pm_interaction_warm'] = measure(
+        lambda: engine.calculate_pm_interaction(next_results(), 'x'), repeat)
+
+    # Exact ray ratios for the ACI combinations of each section's loads
+    from column_loads import factored_loads
+    cases = [factored_loads({'D': [0.6 * r['P'], 0.6 * r['Mx'], 0.6 * r['My']],
+                             'L': [0.3 * r['P'], 0.3 * r['Mx'], 0.3 * r['My']],
+                             'W': [0.0, 0.5 * r['Mx'], 0.5 * r['My']]})[1] for r in results]
+    next_case = _cycle(list(zip(results, cases)))
+
+    def capacity_ratios():
+        r, loads = next_case()
+        return engine.capacity_ratios(r, 'x', loads[:, 0], loads[:, 1])
+    benchmarks['capacity_ratios[12]'] = measure(capacity_ratios, repeat, items_per_call=12)
+    return benchmarks
+
+
+def bench_batch(sections, repeat, batch_sizes):
+    """perform_calculations_batch and storey moment magnification for every batch size"""
+    from column_slenderness import magnify_storey
+    engine = ColumnDesignEngine()
+    benchmarks = {}
+    for n in batch_sizes:
+        columns = batch_columns(sections, n)
+        calls = max(3, min(repeat, 1000000 // (n * 10) or 1))
+        benchmarks[f'perform_calculations_batch[{n}]'] = measure(
+            lambda: engine.perform_calculations_batch(columns), calls, items_per_call=n)
+        benchmarks[f'magnify_storey[{n}]'] = measure(
+            lambda: magnify_storey(columns, columns['P'], columns['Mx'], columns['My'],
+                                   Mx_sway=columns['Mx'], sway=True, k_sway=1.5), calls, items_per_call=n)
+    return benchmarks
+
+
+def bench_curves(sections, repeat, batch_sizes):
+    """calculate_pm_interaction_batch for batch sizes up to MAX_CURVE_BATCH"""
+    engine = ColumnDesignEngine()
+    benchmarks = {}
+    for n in batch_sizes:
+        if n > MAX_CURVE_BATCH:
+            continue
+        columns = batch_columns(sections, n)
+        batch = {**columns, **engine.perform_calculations_batch(columns)}
+        calls = max(3, min(repeat, 100000 // (n * 10) or 1))
+        benchmarks[f'calculate_pm_interaction_batch[{n}]'] = measure(
+            lambda: engine.calculate_pm_interaction_batch(batch, 'x'), calls, items_per_call=n)
+    return benchmarks
+
+
+class _TextSink:
+    """Stand-in for the report Text widget: keeps the last inserted text"""
+
+    def __init__(self):
+        self.text = ''
+
+    def delete(self, *args):
+        self.text = ''
+
+    def insert(self, index, text):
+        self.text += text
+
+
+def _headless_app(engine):
+    """Application object with just the state the report methods use (no Tk window)"""
+    from professional_column_design import ProfessionalColumnDesign
+    app = ProfessionalColumnDesign.__new__(ProfessionalColumnDesign)
+    app.engine = engine
+    app.last_results = None
+    app.results_text = _TextSink()
+    app.report_images = None
+    app.section_preview_drawing = None
+    app.pm_diagrams_drawing = None
+    return app
+
+
+def bench_report(sections, repeat):
+    """Report text, section/P-M images (vector and PNG) and PDF export"""
+    from column_report import (render_section_png, render_pm_png, section_drawing,
+                               pm_drawing, export_schedule_pdf)
+    engine = ColumnDesignEngine()
+    results = [engine.perform_calculations(section) for section in sections]
+    next_results = _cycle(results)
+    repeat = max(3, repeat // 10)
+    benchmarks = {}
+
+    app = _headless_app(engine)
+    # The GUI's results carry the P-M checks the report text prints
+    next_app_results = _cycle([app.perform_calculations(section) for section in sections])
+
+    def full_report():
+        app.last_results = next_app_results()
+        app.report_images = None  # Measure the uncached path
+        # generate_full_report hands this work to a background task; time it directly
+        app.results_text.delete()
+        app.results_text.insert('end', app.format_full_report())
+
+    benchmarks['generate_full_report'] = measure(full_report, repeat)
+
+    def section_preview():
+        app.last_results = next_results()
+        app.report_images = None
+        app.generate_section_preview_image()
+
+    benchmarks['generate_section_preview_image'] = measure(section_preview, repeat)
+    benchmarks['section_drawing'] = measure(lambda: section_drawing(next_results(), engine), repeat)
+    benchmarks['pm_drawing'] = measure(lambda: pm_drawing(next_results(), engine), repeat)
+    benchmarks['render_section_png'] = measure(lambda: render_section_png(next_results(), engine), repeat)
+    benchmarks['render_pm_png'] = measure(lambda: render_pm_png(next_results(), engine), repeat)
+
+    # export_to_pdf needs a file dialog, so its document is built by the schedule exporter
+    fd, filename = tempfile.mkstemp(suffix='.pdf')
+    os.close(fd)
+    next_section = _cycle(sections)
+    try:
+        benchmarks['export_pdf[1]'] = measure(
+            lambda: export_schedule_pdf([next_section()], filename, workers=1, engine=engine), repeat)
+        schedule = sections[:50]
+        benchmarks[f'export_pdf[{len(schedule)}]'] = measure(
+            lambda: export_schedule_pdf(schedule, filename, workers=1, engine=engine), 3,
+            items_per_call=len(schedule))
+        benchmarks[f'export_pdf[{len(schedule)}]']['file_size_kb'] = os.path.getsize(filename) / 1024
+    finally:
+        os.remove(filename)
+    return benchmarks
+
+
+def environment():
+    """Versions and host details recorded with every run"""
+    info = {
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count()
+    }
+    for module in ('numpy', 'matplotlib', 'reportlab'):
+        try:
+            info[module] = __import__(module).__version__
+        except Exception:
+            info[module] = None
+    try:
+        info['git_commit'] = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                                            capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        info['git_commit'] = None
+    return info
+
+
+def compare(report, baseline, max_slowdown):
+    """Print p50 ratios against a baseline run; return the benchmarks that got slower"""
+    regressions = []
+    for name, current in report['benchmarks'].items():
+        previous = baseline.get('benchmarks', {}).get(name)
+        if not previous or not previous.get('p50_ms'):
+            continue
+        ratio = current['p50_ms'] / previous['p50_ms']
+        flag = '  SLOWER' if ratio > max_slowdown else ''
+        print(f"{name:45s} {previous['p50_ms']:10.3f} -> {current['p50_ms']:10.3f} ms  x{ratio:5.2f}{flag}")
+        if ratio > max_slowdown:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the calculation and reporting hot paths")
+    parser.add_argument('--repeat', type=int, default=200, help="calls per benchmark (scaled down for slow ones)")
+    parser.add_argument('--quick', action='store_true', help="fewer calls, batches up to 10k")
+    parser.add_argument('--only', choices=GROUPS, action='append', help="run only these groups")
+    parser.add_argument('--output', default=None, help="write the JSON report to this file")
+    parser.add_argument('--json', action='store_true', help="print machine-readable JSON only")
+    parser.add_argument('--compare', default=None, help="baseline JSON report to compare against")
+    parser.add_argument('--max-slowdown', type=float, default=1.25, help="p50 ratio that counts as a regression")
+    args = parser.parse_args(argv)
+
+    repeat = min(args.repeat, 20) if args.quick else args.repeat
+    batch_sizes = QUICK_BATCH_SIZES if args.quick else BATCH_SIZES
+    groups = args.only or GROUPS
+    sections = representative_sections()
+
+    if not HAS_NUMPY:
+        groups = [g for g in groups if g not in ('batch', 'curves')]
+
+    benchmarks = {}
+    for group in groups:
+        start = time.perf_counter()
+        if group == 'scalar':
+            benchmarks.update(bench_scalar(sections, repeat))
+        elif group == 'batch':
+            benchmarks.update(bench_batch(sections, repeat, batch_sizes))
+        elif group == 'curves':
+            benchmarks.update(bench_curves(sections, repeat, batch_sizes))
+        elif group == 'report':
+            benchmarks.update(bench_report(sections, repeat))
+        if not args.json:
+            print(f"[{group}] done in {time.perf_counter() - start:.1f} s", file=sys.stderr)
+
+    report = {
+        'benchmark': 'hotpaths',
+        'environment': environment(),
+        'sections': len(sections),
+        'benchmarks': benchmarks
+    }
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for name, b in benchmarks.items():
+            print(f"{name:45s} p50 {b['p50_ms']:10.3f} ms  p99 {b['p99_ms']:10.3f} ms  "
+                  f"{b['throughput_per_s']:14,.0f}/s  peak {b['peak_memory_mb']:8.2f} MB")
+
+    regressions = []
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            regressions = compare(report, json.load(f), args.max_slowdown)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
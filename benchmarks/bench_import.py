@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Import-Time Benchmark
+Measures how long `import professional_column_design` takes in a fresh
+interpreter and checks that no heavy optional library is loaded eagerly.
+
+Usage:
+    python benchmarks/bench_import.py --repeat 10 --max-ms 300
+Exits with status 1 when the median exceeds --max-ms or a heavy module
+(numpy, matplotlib, reportlab) is imported at startup.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must only be imported when a feature first needs them
+HEAVY_MODULES = ('numpy', 'matplotlib', 'reportlab')
+
+PROBE = """
+import sys, time, json
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'loaded': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure_import(module, repeat):
+    """Import time (s) of a module in `repeat` fresh interpreters, plus heavy modules seen"""
+    times = []
+    loaded = set()
+    code = PROBE.format(module=module, heavy=HEAVY_MODULES)
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', code], cwd=REPO_ROOT,
+                                capture_output=True, text=True, check=True).stdout
+        sample = json.loads(output.strip().splitlines()[-1])
+        times.append(sample['seconds'])
+        loaded.update(sample['loaded'])
+    return times, sorted(loaded)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark application import time")
+    parser.add_argument('--module', default='professional_column_design', help="module to import")
+    parser.add_argument('--repeat', type=int, default=10, help="fresh interpreters to time")
+    parser.add_argument('--max-ms', type=float, default=None, help="fail if the median exceeds this")
+    parser.add_argument('--json', action='store_true', help="print machine-readable JSON only")
+    args = parser.parse_args(argv)
+
+    times, loaded = measure_import(args.module, args.repeat)
+    report = {
+        'benchmark': 'import',
+        'module': args.module,
+        'repeat': args.repeat,
+        'median_ms': statistics.median(times) * 1000,
+        'min_ms': min(times) * 1000,
+        'max_ms': max(times) * 1000,
+        'heavy_modules_loaded': loaded
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"import {args.module}: median {report['median_ms']:.1f} ms "
+              f"(min {report['min_ms']:.1f}, max {report['max_ms']:.1f}, n={args.repeat})")
+        if loaded:
+            print(f"Heavy modules imported at startup: {', '.join(loaded)}")
+
+    failed = bool(loaded) or (args.max_ms is not None and report['median_ms'] > args.max_ms)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Column Schedule Batch Runner
+Designs thousands of independent column/load-case rows on a process pool
+using the headless engine.
+
+Rows are sent to workers in chunks to keep inter-process traffic low, the
+output order always matches the input order, and a failing row (or a
+crashed worker) is reported as a row error instead of aborting the run.
+A crashed worker takes the whole pool down; the chunks it interrupted
+are resubmitted on a fresh pool, so only the chunk that crashed fails.
+Unreadable CSV cells fail their row only.
+
+Usage:
+    python column_batch.py schedule.csv -o results.csv --workers 32
+    python column_batch.py schedule.csv --pdf schedule.pdf
+    python column_batch.py schedule.csv --slenderness sway
+    python column_batch.py schedule.csv --project schedule.cdp
+    python column_batch.py schedule.cdp -o results.csv
+    python column_batch.py schedule.csv --store results.db
+
+With --slenderness, moments are magnified per ACI 318M-25 6.6.4 before
+the interaction check. Optional columns: storey and case (rows sharing
+both form one ΣPu / ΣPc group), Mx_sway, My_sway, M1_M2_x, M1_M2_y, k,
+k_sway and beta_dns. M1/M2 follows the ACI sign convention (negative for
+single curvature); it defaults to -1.
+
+The schedule may also be a project file (.cdp, see column_project), whose
+'columns' table holds the rows; --project writes the rows and results to
+one. --store appends the run to a SQLite result store (column_store) for
+filtered queries.
+"""
+
+import argparse
+import csv
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from column_engine import ColumnDesignEngine, DEFAULT_INPUTS, REBAR_KEYS
+
+
+# Rows per task sent to a worker
+DEFAULT_CHUNK_SIZE = 256
+
+# Integer-valued inputs (everything else numeric is a float)
+INTEGER_KEYS = ('num_bars_x', 'num_bars_y', 'tie_legs')
+
+# Optional per-row inputs for moment magnification (storey and case are labels)
+SLENDERNESS_KEYS = ('storey', 'case', 'Mx_sway', 'My_sway', 'M1_M2_x', 'M1_M2_y',
+                    'k', 'k_sway', 'beta_dns')
+
+# Magnifiers added to rows by magnify_rows
+MAGNIFIER_KEYS = ('delta_x', 'delta_y', 'delta_s_x', 'delta_s_y')
+
+# Design (magnified) moments added to rows by magnify_rows; Mx and My stay first-order
+DESIGN_MOMENT_KEYS = ('Mcx', 'Mcy')
+
+# Row error for a column whose magnifier denominator is not positive
+UNSTABLE_ERROR = "Pu ≥ 0.75Pc, column unstable"
+
+# Scalar results written for every row
+RESULT_KEYS = ('Ag', 'As_provided', 'steel_ratio', 'Pu_capacity', 'utilization',
+               'max_spacing', 'tie_spacing_ok', 'ld_required', 'utilization_x',
+               'utilization_y', 'governing_utilization', 'Mcx', 'Mcy', 'delta_x', 'delta_y',
+               'delta_s_x', 'delta_s_y')
+
+# One engine per worker process, so curves are cached across chunks
+_worker_engine = None
+
+
+def _get_worker_engine():
+    global _worker_engine
+    if _worker_engine is None:
+        _worker_engine = ColumnDesignEngine()
+    return _worker_engine
+
+
+def design_row(engine, row, check_curves=True):
+    """Design one schedule row: calculations plus the P-M curve check
+
+    The curve check uses the row's design moments Mcx and Mcy (from
+    magnify_rows) when it has them, else the input Mx and My.
+    """
+    inputs = {**DEFAULT_INPUTS, **{k: v for k, v in row.items() if k in DEFAULT_INPUTS}}
+    results = engine.perform_calculations(inputs)
+    results['Mcx'] = row.get('Mcx', inputs['Mx'])
+    results['Mcy'] = row.get('Mcy', inputs['My'])
+    if check_curves:
+        from column_loads import check_load_combinations
+        check = check_load_combinations(engine, inputs, [[inputs['P'], results['Mcx'], results['Mcy']]], exact=True)
+        results['utilization_x'] = float(check['utilization_x'][0])
+        results['utilization_y'] = float(check['utilization_y'][0])
+        results['governing_utilization'] = max(results['utilization'], check['governing_utilization'])
+    for key in MAGNIFIER_KEYS:
+        if key in row:
+            results[key] = row[key]
+    return {key: results[key] for key in RESULT_KEYS if key in results}
+
+
+def _design_chunk(start, rows, check_curves):
+    """Worker task: design a chunk of rows, catching errors per row"""
+    engine = _get_worker_engine()
+    output = []
+    for offset, row in enumerate(rows):
+        entry = {'index': start + offset, 'id': row.get('id')}
+        # Rows already known to fail (for example unstable columns) are not designed
+        if row.get('error'):
+            entry['results'] = None
+            entry['error'] = row['error']
+            output.append(entry)
+            continue
+        try:
+            entry['results'] = design_row(engine, row, check_curves)
+            entry['error'] = None
+        except Exception as e:
+            entry['results'] = None
+            entry['error'] = f"{type(e).__name__}: {e}"
+        output.append(entry)
+    return output
+
+
+def _failed_chunk(start, rows, error):
+    """Output entries reporting the same error for every row of a chunk"""
+    return [{'index': start + offset, 'id': row.get('id'), 'results': None, 'error': error}
+            for offset, row in enumerate(rows)]
+
+
+def _run_pool(chunks, pending, workers, check_curves, done):
+    """Design the pending chunks on one process pool, storing their output in done
+
+    Returns the BrokenProcessPool error if a worker died; the chunks it
+    interrupted (or never started) are then missing from done.
+    """
+    broken = None
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [(i, executor.submit(_design_chunk, *chunks[i], check_curves)) for i in pending]
+        # Collect in submission order so the output order is deterministic
+        for i, future in futures:
+            try:
+                done[i] = future.result()
+            except BrokenProcessPool as e:
+                broken = e
+            except Exception as e:
+                done[i] = _failed_chunk(*chunks[i], f"Worker failed: {type(e).__name__}: {e}")
+    return broken
+
+
+def run_schedule(rows, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, check_curves=True):
+    """Design every row of a column schedule in parallel
+
+    rows is a sequence of input dicts (missing keys take the GUI defaults,
+    an optional 'id' is echoed back). Returns one entry per row, in input
+    order, with 'index', 'id', 'results' and 'error'.
+    """
+    rows = list(rows)
+    workers = workers or os.cpu_count() or 1
+    chunks = [(start, rows[start:start + chunk_size]) for start in range(0, len(rows), chunk_size)]
+
+    # Small jobs are not worth the process start-up cost
+    if workers == 1 or len(chunks) <= 1:
+        output = []
+        for start, chunk in chunks:
+            output.extend(_design_chunk(start, chunk, check_curves))
+        return output
+
+    # A dead worker breaks its pool: resubmit the unfinished chunks on a new
+    # one. When nothing finished, the first chunk runs alone, so a chunk that
+    # kills its worker is the only one blamed and every round makes progress.
+    done = {}
+    pending = list(range(len(chunks)))
+    while pending:
+        broken = _run_pool(chunks, pending, workers, check_curves, done)
+        remaining = [i for i in pending if i not in done]
+        if broken is not None and len(remaining) == len(pending):
+            first = remaining[0]
+            error = _run_pool(chunks, [first], 1, check_curves, done)
+            if error is not None:
+                done[first] = _failed_chunk(*chunks[first], f"Worker failed: {type(error).__name__}: {error}")
+            remaining = remaining[1:]
+        pending = remaining
+    return [entry for i in range(len(chunks)) for entry in done[i]]
+
+
+def magnify_rows(rows, sway=False):
+    """Copies of the rows with the magnified design moments Mcx and Mcy added
+
+    All rows are magnified in one vectorized pass; each row is one column
+    under one load case, and rows with the same storey and case labels
+    share the sway-magnifier sums. The input Mx and My are kept
+    (first-order), so stored rows can be re-run; the magnifiers
+    (MAGNIFIER_KEYS) are added too. Unstable rows (Pu ≥ 0.75 Pc) get no
+    design moments but an 'error', which run_schedule reports as a failure;
+    rows that already have an error are returned unchanged.
+    """
+    from column_slenderness import DEFAULT_BETA_DNS, DEFAULT_M1_M2, magnify_storey
+    rows = list(rows)
+    if not rows:
+        return rows
+
+    def values(key, default):
+        return [row.get(key, default) for row in rows]
+
+    columns = {key: values(key, DEFAULT_INPUTS[key]) for key in ('width', 'height', 'length', 'fc')}
+    storey = [f"{row.get('storey', '')}|{row.get('case', '')}" for row in rows]
+    magnified = magnify_storey(columns, values('P', DEFAULT_INPUTS['P']),
+                               values('Mx', DEFAULT_INPUTS['Mx']), values('My', DEFAULT_INPUTS['My']),
+                               values('Mx_sway', 0.0), values('My_sway', 0.0),
+                               values('M1_M2_x', DEFAULT_M1_M2), values('M1_M2_y', DEFAULT_M1_M2), sway,
+                               values('k', 1.0), values('k_sway', 1.0), values('beta_dns', DEFAULT_BETA_DNS),
+                               storey=storey)
+    output = []
+    for i, row in enumerate(rows):
+        if row.get('error'):
+            output.append(row)
+            continue
+        magnifiers = {key: float(magnified[key][i]) for key in MAGNIFIER_KEYS}
+        if magnified['unstable'][i]:
+            output.append({**row, **magnifiers, 'error': UNSTABLE_ERROR})
+        else:
+            output.append({**row, 'Mcx': float(magnified['Mx'][i]), 'Mcy': float(magnified['My'][i]), **magnifiers})
+    return output
+
+
+def read_schedule_csv(filename):
+    """Read schedule rows from a CSV whose headers are input keys (plus optional 'id')
+
+    A row with an unreadable value is kept with an 'error' (and whatever
+    was read before it), which run_schedule reports for that row only.
+    """
+    rows = []
+    with open(filename, newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        for record in reader:
+            # The id is read first so that a failed row can still be identified
+            row = {'id': record['id'].strip()} if record.get('id') else {}
+            for key, value in record.items():
+                if key is None or value is None or value == '':
+                    continue
+                try:
+                    if key in ('id', 'storey', 'case') or key in REBAR_KEYS:
+                        row[key] = value.strip()
+                    elif key in INTEGER_KEYS:
+                        row[key] = int(float(value))
+                    elif key in DEFAULT_INPUTS or key in SLENDERNESS_KEYS:
+                        row[key] = float(value)
+                except (ValueError, OverflowError):
+                    row['error'] = f"Line {reader.line_num}: invalid {key} value {value.strip()!r}"
+                    break
+            rows.append(row)
+    return rows
+
+
+def read_schedule(filename):
+    """Schedule rows from a CSV or from the 'columns' table of a project file"""
+    from column_project import PROJECT_EXTENSION
+    if not filename.lower().endswith(PROJECT_EXTENSION):
+        return read_schedule_csv(filename)
+
+    from column_project import ProjectFile
+    with ProjectFile(filename) as project:
+        records = project.page('columns', 0, project.rows('columns'))
+    # Missing values are stored as NaN (numbers) or '' (labels)
+    return [{key: value for key, value in record.items()
+             if value != '' and value == value}
+            for record in records]
+
+
+def write_results_project(filename, rows, output):
+    """Write the schedule rows and their results to a project file
+
+    The design moments go to the results table only, so the stored rows
+    are inputs that can be designed again.
+    """
+    from column_project import save_project
+    rows = [{key: value for key, value in row.items() if key not in DESIGN_MOMENT_KEYS} for row in rows]
+    results = [{'index': entry['index'], 'id': entry['id'] or '',
+                **{key: (entry['results'] or {}).get(key) for key in RESULT_KEYS},
+                'error': entry['error'] or ''}
+               for entry in output]
+    save_project(filename, {'columns': rows, 'results': results},
+                 meta={'source': 'column_batch', 'rows': len(rows)})
+
+
+def write_results_csv(filename, output):
+    """Write one line per row: id, every result key and the error message"""
+    with open(filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['index', 'id', *RESULT_KEYS, 'error'])
+        for entry in output:
+            results = entry['results'] or {}
+            writer.writerow([entry['index'], entry['id'] or '',
+                             *(results.get(key, '') for key in RESULT_KEYS),
+                             entry['error'] or ''])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Design a column schedule on a process pool")
+    parser.add_argument('schedule', help="CSV or project file with one column/load case per row")
+    parser.add_argument('-o', '--output', default='schedule_results.csv', help="results CSV")
+    parser.add_argument('-w', '--workers', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="rows per worker task")
+    parser.add_argument('--no-curves', action='store_true', help="skip the P-M curve check")
+    parser.add_argument('--pdf', default=None, help="also write one PDF report for the whole schedule")
+    parser.add_argument('--slenderness', choices=('nonsway', 'sway'), default=None,
+                        help="magnify moments for slenderness before the checks")
+    parser.add_argument('--project', default=None, help="also write rows and results to a project file (.cdp)")
+    parser.add_argument('--store', default=None, help="also add the run to a SQLite result store")
+    args = parser.parse_args(argv)
+
+    rows = read_schedule(args.schedule)
+    if args.slenderness:
+        rows = magnify_rows(rows, sway=args.slenderness == 'sway')
+    start = time.perf_counter()
+    output = run_schedule(rows, args.workers, args.chunk_size, not args.no_curves)
+    elapsed = time.perf_counter() - start
+    write_results_csv(args.output, output)
+
+    errors = sum(1 for entry in output if entry['error'])
+    print(f"Designed {len(output)} rows in {elapsed:.2f} s ({errors} errors) -> {args.output}")
+    if args.project:
+        write_results_project(args.project, rows, output)
+        print(f"Saved project -> {args.project}")
+    if args.store:
+        from column_store import ResultStore
+        with ResultStore(args.store) as store:
+            run_id = store.add_run(rows, output, source=os.path.abspath(args.schedule))
+        print(f"Stored run {run_id} -> {args.store}")
+
+    if args.pdf:
+        from column_report import export_schedule_pdf
+        report = export_schedule_pdf(rows, args.pdf, workers=args.workers)
+        print(f"Wrote {report['pages']} pages for {report['columns']} columns "
+              f"in {report['elapsed']:.2f} s -> {args.pdf}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Biaxial Bending Check
+Combines a section's cached P-Mx and P-My curves into biaxial utilizations
+with the Bresler reciprocal-load and load-contour methods.
+
+Both methods are closed-form once the uniaxial capacities are known, so
+every load case is checked in one vectorized pass. They are meant as a
+fast screen: cases that come close to the limit can then be sent to the
+fiber-section surface (column_fiber.FiberSection).
+
+Capacities are design strengths (φ applied) and use the same curves as
+check_load_combinations (tension side closed with a straight line to pure
+tension). Bresler's method takes uncapped capacities: P0 is the design
+axial strength φP0, and the uniaxial capacities come from the curves with
+the 0.80 φP0 plateau replaced by a chord to (0, φP0). The true uncapped
+curve lies outside that chord, so the chord is conservative. The cap
+itself is checked separately.
+"""
+
+import numpy as np
+
+from column_engine import design_tension
+from column_loads import curve_capacity_ratio, curve_moment_capacity
+
+
+# Bresler's reciprocal equation is only recommended when Pn ≥ 0.1 fc' Ag
+BRESLER_MIN_AXIAL_RATIO = 0.1
+
+# Load-contour exponent; Bresler reports 1.15-1.55 for rectangular
+# sections, the low end is the conservative choice
+DEFAULT_CONTOUR_ALPHA = 1.15
+
+# Screen utilization (%) above which a case should get the full-surface check
+SCREEN_LIMIT = 90.0
+
+# Load cases per block when intersecting with the curves, which keeps the
+# (loads × curve segments) temporaries to a few MB
+CHUNK_SIZE = 2048
+
+
+def bresler_reciprocal(ratio_x, ratio_y, P, P0):
+    """Bresler reciprocal-load utilization P / Pni
+
+    1/Pni = 1/Pnx + 1/Pny - 1/P0, where Pnx = P / ratio_x and Pny = P / ratio_y
+    are the uniaxial capacities at the load's eccentricities. That reduces
+    to ratio_x + ratio_y - P / P0. Returns NaN for non-compressive loads.
+    """
+    ratio_x = np.asarray(ratio_x, dtype=float)
+    ratio_y = np.asarray(ratio_y, dtype=float)
+    P = np.asarray(P, dtype=float)
+    utilization = ratio_x + ratio_y - P / P0
+    return np.where(P > 0, utilization, np.nan)
+
+
+def load_contour(Mx, My, Mnx0, Mny0, alpha=DEFAULT_CONTOUR_ALPHA):
+    """Load-contour utilization ((Mx/Mnx0)^α + (My/Mny0)^α)^(1/α)
+
+    Mnx0 and Mny0 are the uniaxial moment capacities at the load's axial
+    force; a zero capacity (axial load outside the curve) gives infinity.
+    """
+    Mx = np.abs(np.asarray(Mx, dtype=float))
+    My = np.abs(np.asarray(My, dtype=float))
+    Mnx0 = np.asarray(Mnx0, dtype=float)
+    Mny0 = np.asarray(Mny0, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rx = np.where(Mnx0 > 0, Mx / np.where(Mnx0 > 0, Mnx0, 1.0), np.where(Mx > 0, np.inf, 0.0))
+        ry = np.where(Mny0 > 0, My / np.where(Mny0 > 0, Mny0, 1.0), np.where(My > 0, np.inf, 0.0))
+        return (rx ** alpha + ry ** alpha) ** (1.0 / alpha)
+
+
+def uncapped_curve(M_curve, P_curve, P0):
+    """Curve points with the axial-cap plateau replaced by a chord to pure compression (0, P0)"""
+    M_curve = np.asarray(M_curve, dtype=float)
+    P_curve = np.array(P_curve, dtype=float)
+    if M_curve[-1] == 0:
+        P_curve[-1] = P0
+        return M_curve, P_curve
+    return np.append(M_curve, 0.0), np.append(P_curve, P0)
+
+
+def check_biaxial(engine, inputs, loads, names=None, alpha=DEFAULT_CONTOUR_ALPHA, screen_limit=SCREEN_LIMIT,
+                  unstable=None):
+    """Biaxial check of many (P, Mx, My) load cases against one section
+
+    Returns a dict of arrays (one value per load case, utilizations in %):
+    utilization_reciprocal (NaN where the load is not compressive),
+    reciprocal_valid (P ≥ 0.1 fc' Ag), utilization_contour, the larger of
+    the valid results as utilization, needs_full_check (utilization above
+    screen_limit), and the capacities Pnx, Pny (uncapped, as used by the
+    reciprocal method), Pni, Mnx0 and Mny0.
+    The governing case is reported as in check_load_combinations, and
+    unstable marks cases that fail outright, as there.
+    """
+    loads = np.asarray(loads, dtype=float).reshape(-1, 3)
+    checked = loads
+    if unstable is not None:
+        unstable = np.asarray(unstable, dtype=bool).reshape(-1)
+        checked = np.where(unstable[:, None], 0.0, loads)
+    if names is None:
+        names = [f"LC{i + 1}" for i in range(len(loads))]
+    P, Mx, My = checked[:, 0], checked[:, 1], checked[:, 2]
+
+    results = engine.perform_calculations(inputs)
+    P_tension = design_tension(results['fy'], results['As_provided'])
+
+    Mx_curve, Px_curve = engine.calculate_pm_interaction(results, 'x')
+    My_curve, Py_curve = engine.calculate_pm_interaction(results, 'y')
+
+    # Bresler's method takes the uncapped φP0 and uniaxial capacities; the
+    # 0.80 φP0 cap is the separate axial check below
+    limits = engine.pm_limits(results, 'x')
+    P0, P_cap = limits['P0'], limits['P_cap']
+    Mx_open, Px_open = uncapped_curve(Mx_curve, Px_curve, P0)
+    My_open, Py_open = uncapped_curve(My_curve, Py_curve, P0)
+
+    # Uniaxial capacities along each load's eccentricity and at its axial force
+    ratio_x, ratio_y = np.empty(len(loads)), np.empty(len(loads))
+    Mnx0, Mny0 = np.empty(len(loads)), np.empty(len(loads))
+    for start in range(0, len(loads), CHUNK_SIZE):
+        block = slice(start, start + CHUNK_SIZE)
+        ratio_x[block] = curve_capacity_ratio(Mx_open, Px_open, Mx[block], P[block], P_tension)
+        ratio_y[block] = curve_capacity_ratio(My_open, Py_open, My[block], P[block], P_tension)
+        Mnx0[block] = curve_moment_capacity(Mx_curve, Px_curve, P[block], P_tension)
+        Mny0[block] = curve_moment_capacity(My_curve, Py_curve, P[block], P_tension)
+
+    # Axial utilization against the cap, so loads beyond the curve's axial range fail
+    with np.errstate(divide='ignore'):
+        axial = np.where(P > 0, P / P_cap, -P / P_tension if P_tension > 0 else np.inf)
+    axial[P == 0] = 0.0
+
+    reciprocal = np.maximum(bresler_reciprocal(ratio_x, ratio_y, P, P0), axial)
+    valid = P >= BRESLER_MIN_AXIAL_RATIO * results['fc'] * results['Ag'] / 1000
+    contour = np.maximum(load_contour(Mx, My, Mnx0, Mny0, alpha), axial)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Pnx = np.where(ratio_x > 0, P / np.where(ratio_x > 0, ratio_x, 1.0), np.inf)
+        Pny = np.where(ratio_y > 0, P / np.where(ratio_y > 0, ratio_y, 1.0), np.inf)
+        Pni = np.where(reciprocal > 0, P / np.where(reciprocal > 0, reciprocal, 1.0), np.inf)
+
+    if unstable is not None:
+        reciprocal = np.where(unstable, np.inf, reciprocal)
+        contour = np.where(unstable, np.inf, contour)
+        Pni = np.where(unstable, 0.0, Pni)
+    utilization = np.where(valid, np.fmax(reciprocal, contour), contour) * 100
+    governing = int(np.argmax(utilization)) if len(loads) else -1
+    return {
+        'names': list(names),
+        'loads': loads,
+        'utilization_reciprocal': reciprocal * 100,
+        'reciprocal_valid': valid,
+        'utilization_contour': contour * 100,
+        'utilization': utilization,
+        'needs_full_check': utilization > screen_limit,
+        'alpha': alpha,
+        'P0': P0,
+        'P_cap': P_cap,
+        'Pnx': Pnx,
+        'Pny': Pny,
+        'Pni': Pni,
+        'Mnx0': Mnx0,
+        'Mny0': Mny0,
+        'governing_index': governing,
+        'governing_name': names[governing] if governing >= 0 else None,
+        'governing_utilization': float(utilization[governing]) if governing >= 0 else 0.0
+    }
@@ -0,0 +1,879 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Column Design Engine
+Headless ACI 318M-25 column calculations shared by the GUI and batch tools.
+
+This module deliberately imports nothing from tkinter, matplotlib or
+reportlab so it can run on machines without a display.
+"""
+
+import hashlib
+import math
+import sys
+from collections import OrderedDict
+
+from importlib.util import find_spec
+
+from column_rebar import DEFAULT_CATALOG
+
+# NumPy is only needed by the vectorized paths; it is imported on first use
+# so that importing the engine (and starting the GUI) stays fast.
+HAS_NUMPY = find_spec("numpy") is not None
+np = None
+
+
+def _load_numpy():
+    """Import NumPy on first use and bind it to the module-level name"""
+    global np
+    if np is None:
+        import numpy
+        np = numpy
+    return np
+
+
+# Inputs that hold rebar designations rather than numbers
+REBAR_KEYS = ('rebar_x', 'rebar_y', 'corner_rebar', 'tie_size')
+
+# Material constants used by the interaction analysis
+EPSILON_CU = 0.003  # Ultimate concrete strain
+ES = 200000  # Steel modulus (MPa)
+
+# Strength reduction factors (ACI 318M-25 Table 21.2.2): compression-controlled
+# (tied or spiral) up to εt = εty, tension-controlled from εty + 0.003,
+# linear in between; the axial cap is 0.80 φ P0 (tied) or 0.85 φ P0 (spiral)
+PHI_TIED = 0.65
+PHI_SPIRAL = 0.75
+PHI_TENSION = 0.90
+TENSION_CONTROLLED_STRAIN = 0.003  # εt - εty where φ reaches PHI_TENSION
+TIED_CAP = 0.80
+SPIRAL_CAP = 0.85
+
+# Dense neutral-axis sweep: c/h from nearly zero to well past the axial cap
+DENSE_PM_POINTS = 240
+DENSE_C_RATIO_MIN = 0.005
+DENSE_C_RATIO_MAX = 1.5
+
+# Adaptive neutral-axis refinement: relative tolerance on P (of the axial
+# cap) and M (of the largest moment), and a cap on section evaluations
+PM_TOLERANCE = 0.001
+PM_MAX_EVALUATIONS = 400
+PM_INITIAL_SEGMENTS = 8
+
+# Neutral-axis root finding: depth tolerance (fraction of the section
+# depth) and the first half-width of a warm-start bracket (fraction of c)
+PM_DEPTH_TOLERANCE = 1e-9
+WARM_START_STEP = 0.01
+
+# Inputs that fully define a section's interaction curve
+SECTION_KEYS = ('width', 'height', 'fc', 'fy', 'cover',
+                'rebar_x', 'rebar_y', 'corner_rebar', 'num_bars_x', 'num_bars_y')
+
+# Number of interaction curves kept per engine
+PM_CACHE_SIZE = 256
+
+# Default design inputs (same values the GUI starts with)
+DEFAULT_INPUTS = {
+    'width': 500.0, 'height': 500.0, 'length': 4.0,
+    'P': 2000.0, 'Mx': 100.0, 'My': 80.0,
+    'fc': 30.0, 'fy': 420.0,
+    'rebar_x': 'DB25', 'rebar_y': 'DB25', 'corner_rebar': 'DB25',
+    'num_bars_x': 3, 'num_bars_y': 3,
+    'tie_size': 'DB12', 'tie_spacing': 150.0, 'tie_legs': 2,
+    'end_spacing': 100.0, 'end_length': 600.0,
+    'cover': 50.0, 'dev_length_factor': 1.2
+}
+
+
+def brent_root(f, a, b, fa=None, fb=None, xtol=1e-12, rtol=4 * sys.float_info.epsilon, maxiter=100):
+    """Root of f in [a, b] by Brent's method
+
+    Combines bisection, secant and inverse quadratic interpolation steps,
+    so it never converges slower than bisection. f(a) and f(b) must differ
+    in sign; pass them in when they are already known. Returns
+    (root, function evaluations).
+    """
+    evaluations = 0
+    if fa is None:
+        fa, evaluations = f(a), evaluations + 1
+    if fb is None:
+        fb, evaluations = f(b), evaluations + 1
+    if fa == 0:
+        return a, evaluations
+    if fb == 0:
+        return b, evaluations
+    if (fa > 0) == (fb > 0):
+        raise ValueError("brent_root: f(a) and f(b) must have opposite signs")
+
+    c, f_c = a, fa
+    d = e = b - a
+    for _ in range(maxiter):
+        if (fb > 0) == (f_c > 0):
+            c, f_c = a, fa
+            d = e = b - a
+        if abs(f_c) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, f_c = fb, f_c, fb
+
+        tol = 2 * rtol * abs(b) + 0.5 * xtol
+        m = 0.5 * (c - b)
+        if abs(m) <= tol or fb == 0:
+            return b, evaluations
+
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # Secant step
+                p, q = 2 * m * s, 1 - s
+            else:
+                # Inverse quadratic interpolation
+                q, r = fa / f_c, fb / f_c
+                p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2 * p < min(3 * m * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+
+        a, fa = b, fb
+        b += d if abs(d) > tol else math.copysign(tol, m)
+        fb, evaluations = f(b), evaluations + 1
+    return b, evaluations
+
+
+def strength_reduction(epsilon_t, fy, phi_compression=PHI_TIED):
+    """φ for a net tensile strain εt in the extreme tension steel (scalar or array)"""
+    fraction = (epsilon_t - fy / ES) / TENSION_CONTROLLED_STRAIN
+    if isinstance(fraction, (int, float)):
+        fraction = min(max(fraction, 0.0), 1.0)
+    else:
+        fraction = _load_numpy().clip(fraction, 0.0, 1.0)
+    return phi_compression + (PHI_TENSION - phi_compression) * fraction
+
+
+def design_tension(fy, As):
+    """Design pure tension capacity φ fy As (kN), φ = 0.90"""
+    return PHI_TENSION * fy * As / 1000
+
+
+def section_signature(inputs):
+    """Stable hash of the section-defining inputs (size, materials, bars, cover)"""
+    parts = []
+    for key in SECTION_KEYS:
+        value = inputs[key]
+        if not isinstance(value, str):
+            value = repr(float(value))
+        parts.append(f"{key}={value}")
+    return hashlib.sha1("|".join(parts).encode('utf-8')).hexdigest()
+
+
+class InteractionCurveCache:
+    """Bounded LRU cache of interaction curves keyed by section signature"""
+
+    def __init__(self, maxsize=PM_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._curves = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Return the cached curve and mark it most recently used, or None"""
+        curve = self._curves.get(key)
+        if curve is None:
+            self.misses += 1
+            return None
+        self._curves.move_to_end(key)
+        self.hits += 1
+        return curve
+
+    def put(self, key, curve):
+        """Store a curve, evicting the least recently used one when full"""
+        self._curves[key] = curve
+        self._curves.move_to_end(key)
+        while len(self._curves) > self.maxsize:
+            self._curves.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Drop all curves and reset the counters"""
+        self._curves.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Counters for diagnostics"""
+        return {
+            'size': len(self._curves),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+    def __len__(self):
+        return len(self._curves)
+
+
+class ColumnDesignEngine:
+    """Design engine: input dict in, results dict out
+
+    The only state is the interaction-curve caches and the read-only rebar
+    catalog, so one engine can be shared by every load case of a project.
+    """
+
+    def __init__(self, pm_cache_size=PM_CACHE_SIZE, rebar_catalog=None, pm_tolerance=PM_TOLERANCE):
+        self.pm_cache = InteractionCurveCache(pm_cache_size)
+        self.pm_limits_cache = InteractionCurveCache(pm_cache_size)
+        self.rebar_catalog = DEFAULT_CATALOG if rebar_catalog is None else rebar_catalog
+        self.pm_tolerance = pm_tolerance
+
+    def get_rebar_area(self, rebar_size):
+        """Get area of single rebar in mm²"""
+        spec = self.rebar_catalog.get(rebar_size)
+        return spec.area if spec is not None else 314  # Default
+
+    def get_rebar_diameter(self, rebar_size):
+        """Get diameter of rebar in mm"""
+        spec = self.rebar_catalog.get(rebar_size)
+        if spec is not None:
+            return spec.diameter
+        if rebar_size.startswith("RB") or rebar_size.startswith("DB"):
+            return int(rebar_size[2:])
+        return 12  # Default
+
+    def get_rebar_strength(self, rebar_size):
+        """Get yield strength of rebar in MPa"""
+        spec = self.rebar_catalog.get(rebar_size)
+        if spec is not None:
+            return spec.fy
+        return 240 if rebar_size.startswith("RB") else 420  # Round bars, otherwise deformed
+
+    def perform_calculations(self, inputs):
+        """Perform complete structural calculations"""
+
+        # Basic section properties
+        Ag = inputs['width'] * inputs['height']  # mm²
+
+        # Reinforcement calculations
+        As_x = inputs['num_bars_x'] * self.get_rebar_area(inputs['rebar_x'])
+        As_y = inputs['num_bars_y'] * self.get_rebar_area(inputs['rebar_y'])
+        As_total = As_x + As_y
+
+        # Corner reinforcement (4 corner bars with selected size)
+        As_corner = 4 * self.get_rebar_area(inputs['corner_rebar'])
+
+        # Total reinforcement
+        As_provided = As_total + As_corner
+        steel_ratio = As_provided / Ag * 100
+
+        # Load calculations
+        P_N = inputs['P'] * 1000  # kN to N
+        Mx_Nm = inputs['Mx'] * 1000  # kN⋅m to N⋅m
+        My_Nm = inputs['My'] * 1000  # kN⋅m to N⋅m
+
+        # Eccentricities
+        ex = Mx_Nm / P_N * 1000 if P_N > 0 else 0  # mm
+        ey = My_Nm / P_N * 1000 if P_N > 0 else 0  # mm
+
+        # Slenderness
+        rx = inputs['height'] / math.sqrt(12)
+        ry = inputs['width'] / math.sqrt(12)
+        slenderness_x = (inputs['length'] * 1000) / rx
+        slenderness_y = (inputs['length'] * 1000) / ry
+
+        # Capacity calculations (simplified)
+        fc = inputs['fc']
+        fy = inputs['fy']
+
+        # Concrete contribution
+        Pn_concrete = 0.85 * fc * (Ag - As_provided)
+
+        # Steel contribution
+        Pn_steel = fy * As_provided
+
+        # Total nominal capacity
+        Pn_total = Pn_concrete + Pn_steel
+
+        # Reduced capacity (φ factor)
+        phi = 0.65  # For tied columns
+        Pu_capacity = phi * Pn_total / 1000  # kN
+
+        # Utilization
+        utilization = (inputs['P'] / Pu_capacity) * 100 if Pu_capacity > 0 else 999
+
+        # Tie spacing checks
+        max_spacing = min(16 * self.get_rebar_diameter(inputs['rebar_x']),
+                         48 * self.get_rebar_diameter(inputs['tie_size']),
+                         min(inputs['width'], inputs['height']))
+
+        tie_spacing_ok = inputs['tie_spacing'] <= max_spacing
+
+        # Development length calculation
+        db = self.get_rebar_diameter(inputs['rebar_x'])
+        ld_basic = 0.6 * fy * db / math.sqrt(fc)  # Basic development length
+        ld_required = ld_basic * inputs['dev_length_factor']
+
+        return {
+            # Input echo
+            **inputs,
+
+            # Calculated properties
+            'Ag': Ag,
+            'As_x': As_x,
+            'As_y': As_y,
+            'As_corner': As_corner,
+            'As_total': As_total,
+            'As_provided': As_provided,
+            'steel_ratio': steel_ratio,
+
+            # Loading
+            'ex': ex,
+            'ey': ey,
+            'slenderness_x': slenderness_x,
+            'slenderness_y': slenderness_y,
+
+            # Capacity
+            'Pn_concrete': Pn_concrete,
+            'Pn_steel': Pn_steel,
+            'Pn_total': Pn_total,
+            'Pu_capacity': Pu_capacity,
+            'utilization': utilization,
+
+            # Detailing checks
+            'max_spacing': max_spacing,
+            'tie_spacing_ok': tie_spacing_ok,
+            'ld_required': ld_required
+        }
+
+    def _rebar_lookup(self, names, lookup):
+        """Map an array of rebar designations through a scalar lookup, once per unique name"""
+        _load_numpy()
+        unique, inverse = np.unique(names, return_inverse=True)
+        values = np.array([lookup(str(name)) for name in unique], dtype=float)
+        return values[inverse.reshape(-1)]
+
+    def get_rebar_areas(self, names):
+        """Areas (mm²) for an array of rebar designations"""
+        return self._rebar_lookup(names, self.get_rebar_area)
+
+    def get_rebar_diameters(self, names):
+        """Diameters (mm) for an array of rebar designations"""
+        return self._rebar_lookup(names, self.get_rebar_diameter)
+
+    def perform_calculations_batch(self, columns):
+        """Vectorized perform_calculations over a struct-of-arrays
+
+        columns maps the same keys as the scalar inputs dict to arrays (or
+        scalars, which are broadcast). Missing keys fall back to DEFAULT_INPUTS.
+        Returns a dict of NumPy arrays that match the scalar path exactly.
+        """
+        if not HAS_NUMPY:
+            raise RuntimeError("NumPy is required for batch calculations. Install with: pip install numpy")
+        _load_numpy()
+
+        n = max((np.size(v) for v in columns.values()), default=0)
+
+        def column(key):
+            value = columns.get(key, DEFAULT_INPUTS[key])
+            if key in REBAR_KEYS:
+                return np.broadcast_to(np.asarray(value, dtype=str), (n,))
+            return np.broadcast_to(np.asarray(value, dtype=float), (n,))
+
+        width = column('width')
+        height = column('height')
+        length = column('length')
+        P = column('P')
+        fc = column('fc')
+        fy = column('fy')
+
+        # Basic section properties
+        Ag = width * height  # mm²
+
+        # Reinforcement calculations
+        As_x = column('num_bars_x') * self.get_rebar_areas(column('rebar_x'))
+        As_y = column('num_bars_y') * self.get_rebar_areas(column('rebar_y'))
+        As_total = As_x + As_y
+        As_corner = 4 * self.get_rebar_areas(column('corner_rebar'))
+        As_provided = As_total + As_corner
+        steel_ratio = As_provided / Ag * 100
+
+        # Eccentricities (zero where there is no compression)
+        P_N = P * 1000
+        loaded = P_N > 0
+        ex = np.zeros(n)
+        ey = np.zeros(n)
+        np.divide(column('Mx') * 1000, P_N, out=ex, where=loaded)
+        np.divide(column('My') * 1000, P_N, out=ey, where=loaded)
+        ex *= 1000
+        ey *= 1000
+
+        # Slenderness
+        slenderness_x = (length * 1000) / (height / math.sqrt(12))
+        slenderness_y = (length * 1000) / (width / math.sqrt(12))
+
+        # Capacity calculations (simplified)
+        Pn_concrete = 0.85 * fc * (Ag - As_provided)
+        Pn_steel = fy * As_provided
+        Pn_total = Pn_concrete + Pn_steel
+        phi = 0.65  # For tied columns
+        Pu_capacity = phi * Pn_total / 1000  # kN
+
+        # Utilization
+        utilization = np.full(n, 999.0)
+        positive = Pu_capacity > 0
+        utilization[positive] = (P[positive] / Pu_capacity[positive]) * 100
+
+        # Tie spacing checks
+        db = self.get_rebar_diameters(column('rebar_x'))
+        db_tie = self.get_rebar_diameters(column('tie_size'))
+        max_spacing = np.minimum(np.minimum(16 * db, 48 * db_tie), np.minimum(width, height))
+        tie_spacing_ok = column('tie_spacing') <= max_spacing
+
+        # Development length calculation
+        ld_basic = 0.6 * fy * db / np.sqrt(fc)
+        ld_required = ld_basic * column('dev_length_factor')
+
+        return {
+            'Ag': Ag,
+            'As_x': As_x,
+            'As_y': As_y,
+            'As_corner': As_corner,
+            'As_total': As_total,
+            'As_provided': As_provided,
+            'steel_ratio': steel_ratio,
+            'ex': ex,
+            'ey': ey,
+            'slenderness_x': slenderness_x,
+            'slenderness_y': slenderness_y,
+            'Pn_concrete': Pn_concrete,
+            'Pn_steel': Pn_steel,
+            'Pn_total': Pn_total,
+            'Pu_capacity': Pu_capacity,
+            'utilization': utilization,
+            'max_spacing': max_spacing,
+            'tie_spacing_ok': tie_spacing_ok,
+            'ld_required': ld_required
+        }
+
+    def calculate_pm_interaction(self, results, direction):
+        """Calculate P-M interaction points for given direction using proper analysis"""
+        M, P, _ = self._cached_pm_interaction(results, direction)
+        return list(M), list(P)
+
+    def pm_interaction_error(self, results, direction):
+        """Error bound and evaluation count of the (cached) interaction curve"""
+        return dict(self._cached_pm_interaction(results, direction)[2])
+
+    def _cached_pm_interaction(self, results, direction):
+        """Adaptive curve for one section and direction, through the LRU cache"""
+        key = (section_signature(results), direction, self.pm_tolerance)
+        curve = self.pm_cache.get(key)
+        if curve is None:
+            M, P, info = self.calculate_pm_interaction_adaptive(results, direction, self.pm_tolerance)
+            curve = (tuple(M), tuple(P), info)
+            self.pm_cache.put(key, curve)
+        return curve
+
+    def _pm_section_arrays(self, results, direction):
+        """Pick h, b and the two steel layers for bending about the given axis"""
+        _load_numpy()
+        if direction == 'x':
+            h, b, As_layer = results['height'], results['width'], results['As_x']
+        else:
+            h, b, As_layer = results['width'], results['height'], results['As_y']
+        As_layer = np.asarray(As_layer, dtype=float) + np.asarray(results['As_corner'], dtype=float) / 2
+        return np.asarray(h, dtype=float), np.asarray(b, dtype=float), As_layer
+
+    def pm_sweep(self, fc, fy, h, b, As_tension, As_compression, cover, c):
+        """Nominal (Pn kN, Mn kN⋅m) for neutral-axis depths c, broadcast over all arrays"""
+        _load_numpy()
+        d = h - cover  # Effective depth to tension steel
+        d_prime = cover  # Depth to compression steel
+
+        beta1 = np.where(fc <= 28, 0.85, np.maximum(0.85 - 0.05 * (fc - 28) / 7, 0.65))
+
+        # Strains and (elastic-perfectly-plastic) steel stresses
+        epsilon_s = EPSILON_CU * (d - c) / c
+        epsilon_s_prime = EPSILON_CU * (c - d_prime) / c
+        fs = np.clip(ES * epsilon_s, -fy, fy)
+        fs_prime = np.clip(ES * epsilon_s_prime, -fy, fy)
+
+        # Concrete stress block (cannot extend past the section)
+        a = np.minimum(beta1 * c, h)
+        Cc = 0.85 * fc * a * b
+
+        # Steel forces
+        Ts = As_tension * fs
+        Cs = As_compression * fs_prime
+
+        Pn = (Cc + Cs - Ts) / 1000
+        Mn = (Cc * (h/2 - a/2) + Cs * (h/2 - d_prime) + Ts * (d - h/2)) / 1000000
+        return Pn, Mn
+
+    def calculate_pm_interaction_batch(self, batch, direction, num_points=DENSE_PM_POINTS):
+        """Dense design P-M curves (φMn, φPn) for many sections at once
+
+        batch holds arrays of the section inputs (fc, fy, width, height, cover)
+        and the matching perform_calculations_batch results (As_x, As_y,
+        As_corner, Ag, As_provided). Returns (M, P) arrays of shape
+        (n, num_points + 2), each row ordered from the origin through pure
+        bending up the curve to the design axial cap.
+        """
+        if not HAS_NUMPY:
+            raise RuntimeError("NumPy is required for batch calculations. Install with: pip install numpy")
+        _load_numpy()
+
+        h, b, As_layer = self._pm_section_arrays(batch, direction)
+        n = np.size(h) if np.ndim(h) else 1
+        h = np.broadcast_to(h, (n,))[:, None]
+        b = np.broadcast_to(b, (n,))[:, None]
+        As_layer = np.broadcast_to(As_layer, (n,))[:, None]
+
+        def column(key):
+            return np.broadcast_to(np.asarray(batch[key], dtype=float), (n,))[:, None]
+
+        fc = column('fc')
+        fy = column('fy')
+
+        c = np.linspace(DENSE_C_RATIO_MIN, DENSE_C_RATIO_MAX, num_points)[None, :] * h
+        cover = column('cover')
+        Pn, Mn = self.pm_sweep(fc, fy, h, b, As_layer, As_layer, cover, c)
+
+        # Design strength: φ from the strain in the tension steel
+        phi = strength_reduction(EPSILON_CU * (h - cover - c) / c, fy)
+        Pn, Mn = phi * Pn, phi * np.abs(Mn)
+
+        # Tied column limit on pure compression
+        Pn_max = 0.85 * fc * (column('Ag') - column('As_provided')) + fy * column('As_provided')
+        P_cap = TIED_CAP * PHI_TIED * Pn_max / 1000
+
+        # φPn rises monotonically with c, so the P = 0 and P = cap crossings
+        # are found by counting samples below each level and interpolating
+        rows = np.arange(n)
+
+        def crossing(level):
+            idx = np.count_nonzero(Pn < level, axis=1)
+            i1 = np.clip(idx, 1, num_points - 1)
+            i0 = i1 - 1
+            P0, P1 = Pn[rows, i0], Pn[rows, i1]
+            span = np.where(P1 != P0, P1 - P0, 1.0)
+            t = np.clip((level.reshape(-1) - P0) / span, 0.0, 1.0)
+            return idx, Mn[rows, i0] + t * (Mn[rows, i1] - Mn[rows, i0])
+
+        idx_zero, M_zero = crossing(np.zeros((n, 1)))
+        idx_cap, M_cap = crossing(P_cap)
+
+        j = np.arange(num_points)[None, :]
+        below = j < idx_zero[:, None]
+        above = j >= idx_cap[:, None]
+        M_curve = np.where(below, M_zero[:, None], np.where(above, M_cap[:, None], Mn))
+        P_curve = np.where(below, 0.0, np.where(above, P_cap, Pn))
+
+        # Close the curve at the origin and on the compression axis
+        M_out = np.hstack([np.zeros((n, 1)), M_curve, np.zeros((n, 1))])
+        P_out = np.hstack([np.zeros((n, 1)), P_curve, P_cap])
+        return M_out, P_out
+
+    def calculate_pm_interaction_dense(self, results, direction, num_points=DENSE_PM_POINTS):
+        """Smooth design P-M curve for one section from a vectorized neutral-axis sweep"""
+        _load_numpy()
+        M, P = self.calculate_pm_interaction_batch(results, direction, num_points)
+        M, P = M[0], P[0]
+
+        # Drop the repeated points produced by the crossing clamps
+        keep = np.ones(M.size, dtype=bool)
+        keep[1:] = (np.diff(M) != 0) | (np.diff(P) != 0)
+        return M[keep].tolist(), P[keep].tolist()
+
+    def _pm_point(self, fc, fy, h, b, As_layer, cover, c):
+        """Nominal (Pn kN, |Mn| kN⋅m) at one neutral-axis depth (scalar pm_sweep)"""
+        d = h - cover  # Effective depth to tension steel
+        d_prime = cover  # Depth to compression steel
+        beta1 = 0.85 if fc <= 28 else max(0.85 - 0.05 * (fc - 28) / 7, 0.65)
+
+        fs = min(max(ES * EPSILON_CU * (d - c) / c, -fy), fy)
+        fs_prime = min(max(ES * EPSILON_CU * (c - d_prime) / c, -fy), fy)
+
+        a = min(beta1 * c, h)
+        Cc = 0.85 * fc * a * b
+        Ts = As_layer * fs
+        Cs = As_layer * fs_prime
+
+        Pn = (Cc + Cs - Ts) / 1000
+        Mn = (Cc * (h/2 - a/2) + Cs * (h/2 - d_prime) + Ts * (d - h/2)) / 1000000
+        return Pn, abs(Mn)
+
+    def _pm_design_point(self, fc, fy, h, b, As_layer, cover, c):
+        """Design (φPn kN, φ|Mn| kN⋅m) at one neutral-axis depth"""
+        Pn, Mn = self._pm_point(fc, fy, h, b, As_layer, cover, c)
+        phi = strength_reduction(EPSILON_CU * (h - cover - c) / c, fy)
+        return phi * Pn, phi * Mn
+
+    def _pm_parameters(self, results, direction):
+        """Scalar (fc, fy, h, b, As_layer, cover) for bending about the given axis"""
+        if direction == 'x':
+            h, b, As_layer = float(results['height']), float(results['width']), float(results['As_x'])
+        else:
+            h, b, As_layer = float(results['width']), float(results['height']), float(results['As_y'])
+        As_layer += float(results['As_corner']) / 2
+        return float(results['fc']), float(results['fy']), h, b, As_layer, float(results['cover'])
+
+    def pm_limits(self, results, direction):
+        """Pure-bending and axial-cap points of the design curve (cached per section)
+
+        Returns a dict with the neutral-axis depths c_zero (Pn = 0) and
+        c_cap (φPn = P_cap), their design moments M_zero and M_cap, the
+        uncapped design axial strength P0 = φ P0, the tied-column cap
+        P_cap = 0.80 φ P0, the design tension capacity P_tension = 0.90 fy As
+        (all kN) and the number of section evaluations.
+        """
+        key = (section_signature(results), direction)
+        limits = self.pm_limits_cache.get(key)
+        if limits is not None:
+            return limits
+
+        params = self._pm_parameters(results, direction)
+        fc, fy, h = params[:3]
+        Pn_max = 0.85 * fc * (results['Ag'] - results['As_provided']) + fy * results['As_provided']
+        P_cap = TIED_CAP * PHI_TIED * Pn_max / 1000
+        evaluations = 0
+
+        # φPn rises monotonically with c: bracket each axial level, then solve
+        def depth_for(level):
+            nonlocal evaluations
+            f = lambda c: self._pm_design_point(*params, c)[0] - level
+            lo, hi = 1e-6 * h, 1.5 * h
+            f_lo, f_hi = f(lo), f(hi)
+            evaluations += 2
+            while f_hi < 0 and hi < 1000 * h:
+                lo, f_lo = hi, f_hi
+                hi *= 2
+                f_hi = f(hi)
+                evaluations += 1
+            c, n = brent_root(f, lo, hi, f_lo, f_hi, xtol=PM_DEPTH_TOLERANCE * h)
+            evaluations += n
+            return c
+
+        c_zero = depth_for(0.0)
+        c_cap = depth_for(P_cap)
+        limits = {
+            'c_zero': c_zero,
+            'M_zero': self._pm_design_point(*params, c_zero)[1],
+            'c_cap': c_cap,
+            'M_cap': self._pm_design_point(*params, c_cap)[1],
+            'P0': PHI_TIED * Pn_max / 1000,
+            'P_cap': P_cap,
+            'P_tension': design_tension(fy, results['As_provided']),
+            'evaluations': evaluations + 2
+        }
+        self.pm_limits_cache.put(key, limits)
+        return limits
+
+    def capacity_ratio(self, results, direction, P, M, c_start=None):
+        """Load / capacity along the ray from the origin through the (M, P) load
+
+        Solves (Brent) for the neutral-axis depth where the section's
+        design strength (φMn, φPn) lies on the ray, so no curve has to be
+        built.
+        Matches the closed curve used by column_loads: the axial cap on top
+        and a straight line from pure bending to pure tension below P = 0.
+        c_start (the previous load case's depth) narrows the bracket.
+
+        Returns (ratio, c, evaluations); c is None when the ray meets the
+        cap or the tension line. The ratio is infinite for a non-finite load
+        and for a ray that never meets the section's capacity.
+        """
+        if not (math.isfinite(P) and math.isfinite(M)):
+            return math.inf, None, 0
+        limits = self.pm_limits(results, direction)
+        M = abs(M)
+        M_zero, M_cap, P_cap = limits['M_zero'], limits['M_cap'], limits['P_cap']
+
+        if P <= 0:
+            if M == 0 and P == 0:
+                return 0.0, None, 0
+            bending = M / M_zero if M_zero > 0 else math.inf
+            tension = -P / limits['P_tension'] if limits['P_tension'] > 0 else math.inf
+            return (bending if M else 0.0) + (tension if P else 0.0), None, 0
+        if P_cap <= 0 or M_zero <= 0:
+            return math.inf, None, 0
+        if M * P_cap <= P * M_cap:
+            return P / P_cap, None, 0
+
+        params = self._pm_parameters(results, direction)
+        evaluations = 0
+
+        def f(c):
+            nonlocal evaluations
+            evaluations += 1
+            Pn, Mn = self._pm_design_point(*params, c)
+            return Mn * P - Pn * M  # Positive below the ray, negative above
+
+        a, b = limits['c_zero'], limits['c_cap']
+        fa, fb = M_zero * P, M_cap * P - P_cap * M
+
+        # Walk out from the warm start until the root is bracketed
+        if c_start is not None and a < c_start < b:
+            f_start = f(c_start)
+            if f_start == 0:
+                Pn, Mn = self._pm_design_point(*params, c_start)
+                return (P + M) / (Pn + Mn), c_start, evaluations
+            step = WARM_START_STEP * c_start
+            if f_start > 0:
+                lo, f_lo = c_start, f_start
+                hi = min(c_start + step, b)
+                f_hi = fb if hi == b else f(hi)
+                while f_hi > 0:
+                    lo, f_lo = hi, f_hi
+                    step *= 2
+                    hi = min(hi + step, b)
+                    f_hi = fb if hi == b else f(hi)
+            else:
+                hi, f_hi = c_start, f_start
+                lo = max(c_start - step, a)
+                f_lo = fa if lo == a else f(lo)
+                while f_lo < 0:
+                    hi, f_hi = lo, f_lo
+                    step *= 2
+                    lo = max(lo - step, a)
+                    f_lo = fa if lo == a else f(lo)
+            a, b, fa, fb = lo, hi, f_lo, f_hi
+
+        c, n = brent_root(f, a, b, fa, fb, xtol=PM_DEPTH_TOLERANCE * params[2])
+        Pn, Mn = self._pm_design_point(*params, c)
+        # On the ray P / Pn = M / Mn; the sum stays well conditioned near Pn = 0
+        capacity = Pn + Mn
+        if not (capacity > 0 and math.isfinite(capacity)):
+            return math.inf, c, evaluations + 1
+        return max((P + M) / capacity, 0.0), c, evaluations + 1
+
+    def capacity_ratios(self, results, direction, P, M):
+        """capacity_ratio for many load cases, warm-starting each from its neighbour
+
+        Load cases are solved in order of their ray angle so consecutive
+        roots are close; the ratios are returned in input order.
+        """
+        P = [float(p) for p in P]
+        M = [abs(float(m)) for m in M]
+        order = sorted(range(len(P)), key=lambda i: math.atan2(P[i], M[i]))
+        ratios = [0.0] * len(P)
+        c = None
+        for i in order:
+            ratios[i], c_i, _ = self.capacity_ratio(results, direction, P[i], M[i], c)
+            if c_i is not None:
+                c = c_i
+        return ratios
+
+    def governing_utilization(self, results):
+        """Governing utilization (%) of the results' own load
+
+        The larger of the axial utilization P/φPn and the exact P-Mx and
+        P-My capacity ratios, as written by column_batch.design_row. The
+        design moments Mcx and Mcy (magnified) are checked when present.
+        """
+        ratio_x = self.capacity_ratio(results, 'x', results['P'], results.get('Mcx', results['Mx']))[0]
+        ratio_y = self.capacity_ratio(results, 'y', results['P'], results.get('Mcy', results['My']))[0]
+        return max(results['utilization'], ratio_x * 100, ratio_y * 100)
+
+    def calculate_pm_interaction_adaptive(self, results, direction, tolerance=PM_TOLERANCE,
+                                          max_evaluations=PM_MAX_EVALUATIONS):
+        """Design P-M curve (φMn, φPn) sampled densely only where it bends
+
+        The neutral-axis depths for pure bending (Pn = 0) and the axial cap
+        come from pm_limits. Between them the curve is split at its kinks
+        (steel yielding, the end of the φ transition, stress block reaching
+        the far face) and each interval is halved until its midpoint lies
+        within tolerance of the chord, measured relative to the axial cap and
+        the largest moment.
+
+        Returns (M, P, info) ordered like the dense curve (origin, pure
+        bending, ..., pure compression). info holds the largest accepted
+        chord deviation as error_P (kN), error_M (kN⋅m) and error (relative),
+        plus the number of section evaluations (pm_limits included). The
+        midpoints are kept as vertices, so the actual error of smooth
+        segments is well inside it.
+        """
+        fc, fy, h, b, As_layer, cover = params = self._pm_parameters(results, direction)
+        limits = self.pm_limits(results, direction)
+        c_zero, c_cap, P_cap = limits['c_zero'], limits['c_cap'], limits['P_cap']
+
+        evaluations = limits['evaluations']
+        samples = {}
+
+        def point(c):
+            nonlocal evaluations
+            if c not in samples:
+                evaluations += 1
+                samples[c] = self._pm_design_point(*params, c)
+            return samples[c]
+
+        # Kinks: either steel layer yielding in tension or compression, φ
+        # reaching 0.90 (φ starts changing where the tension steel yields), and a = h
+        d, d_prime = h - cover, cover
+        epsilon_y = fy / ES
+        beta1 = 0.85 if fc <= 28 else max(0.85 - 0.05 * (fc - 28) / 7, 0.65)
+        kinks = [EPSILON_CU * depth / (EPSILON_CU + epsilon_y) for depth in (d, d_prime)]
+        kinks.append(EPSILON_CU * d / (EPSILON_CU + epsilon_y + TENSION_CONTROLLED_STRAIN))
+        if epsilon_y < EPSILON_CU:
+            kinks += [EPSILON_CU * depth / (EPSILON_CU - epsilon_y) for depth in (d, d_prime)]
+        kinks.append(h / beta1)
+
+        step = (c_cap - c_zero) / PM_INITIAL_SEGMENTS
+        grid = [c_zero + i * step for i in range(PM_INITIAL_SEGMENTS)] + [c_cap]
+        grid = sorted(set(grid + [c for c in kinks if c_zero < c < c_cap]))
+        for c in grid:
+            point(c)
+
+        P_scale = P_cap if P_cap > 0 else 1.0
+        M_scale = max(samples[c][1] for c in grid) or 1.0
+
+        # Halve intervals whose midpoint strays from the chord
+        error_P = error_M = error = 0.0
+        pending = list(zip(grid[:-1], grid[1:]))
+        while pending:
+            c_a, c_b = pending.pop()
+            c_m = 0.5 * (c_a + c_b)
+            (P_a, M_a), (P_b, M_b), (P_m, M_m) = point(c_a), point(c_b), point(c_m)
+
+            # Normalized offset of the midpoint from the closest chord point
+            dM, dP = (M_b - M_a) / M_scale, (P_b - P_a) / P_scale
+            xM, xP = (M_m - M_a) / M_scale, (P_m - P_a) / P_scale
+            length2 = dM * dM + dP * dP
+            t = min(max((xM * dM + xP * dP) / length2, 0.0), 1.0) if length2 > 0 else 0.0
+            offset_M, offset_P = xM - t * dM, xP - t * dP
+            deviation = math.hypot(offset_M, offset_P)
+
+            if deviation > tolerance and evaluations < max_evaluations:
+                pending.extend([(c_a, c_m), (c_m, c_b)])
+            else:
+                error = max(error, deviation)
+                error_M = max(error_M, abs(offset_M) * M_scale)
+                error_P = max(error_P, abs(offset_P) * P_scale)
+
+        depths = sorted(c for c in samples if c_zero <= c <= c_cap)
+        M_points = [0.0] + [samples[c][1] for c in depths] + [0.0]
+        P_points = [0.0] + [samples[c][0] for c in depths] + [P_cap]
+        # The end points are exact by construction
+        P_points[1], P_points[-2] = 0.0, P_cap
+
+        info = {
+            'error': error,
+            'error_P': error_P,
+            'error_M': error_M,
+            'tolerance': tolerance,
+            'evaluations': evaluations,
+            'points': len(M_points)
+        }
+        return M_points, P_points, info
+
+    def run(self, inputs):
+        """Run the full headless design: calculations plus both interaction curves"""
+        results = self.perform_calculations(inputs)
+        results['pm_curve_x'] = self.calculate_pm_interaction(results, 'x')
+        results['pm_curve_y'] = self.calculate_pm_interaction(results, 'y')
+        return results
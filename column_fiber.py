@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fiber Section Analysis
+Strain-compatibility engine for rectangular columns under biaxial bending.
+
+The concrete is meshed into rectangular fibers and every bar is placed at
+its real coordinates, so the section can be integrated for any neutral-axis
+angle and depth. All fiber data is precomputed as NumPy arrays.
+"""
+
+import math
+
+import numpy as np
+
+from column_engine import ColumnDesignEngine, EPSILON_CU, ES
+
+
+# Default concrete mesh (fibers along width and height)
+DEFAULT_MESH = 20
+
+
+def bar_layout(inputs, engine=None):
+    """Bar coordinates (mm, origin at section centroid) as drawn in the section preview
+
+    Returns (x, y, area, name) lists: 4 corner bars, the intermediate
+    X-direction bars along the top and bottom faces and the intermediate
+    Y-direction bars along the left and right faces.
+    """
+    engine = engine or ColumnDesignEngine()
+    width = inputs['width']
+    height = inputs['height']
+    cover = inputs['cover']
+
+    x_left, x_right = -width/2 + cover, width/2 - cover
+    y_bottom, y_top = -height/2 + cover, height/2 - cover
+
+    xs, ys, names = [], [], []
+
+    # Corner bars (always 4)
+    for px, py in [(x_left, y_bottom), (x_right, y_bottom), (x_right, y_top), (x_left, y_top)]:
+        xs.append(px)
+        ys.append(py)
+        names.append(inputs['corner_rebar'])
+
+    # X-direction bars (along width, excluding corners)
+    num_x = int(inputs['num_bars_x'])
+    if num_x > 2:
+        x_spacing = (x_right - x_left) / (num_x - 1)
+        for i in range(1, num_x - 1):
+            px = x_left + i * x_spacing
+            xs += [px, px]
+            ys += [y_bottom, y_top]
+            names += [inputs['rebar_x']] * 2
+
+    # Y-direction bars (along height, excluding corners)
+    num_y = int(inputs['num_bars_y'])
+    if num_y > 2:
+        y_spacing = (y_top - y_bottom) / (num_y - 1)
+        for i in range(1, num_y - 1):
+            py = y_bottom + i * y_spacing
+            xs += [x_left, x_right]
+            ys += [py, py]
+            names += [inputs['rebar_y']] * 2
+
+    areas = [engine.get_rebar_area(name) for name in names]
+    return xs, ys, areas, names
+
+
+class FiberSection:
+    """Precomputed fiber model of a rectangular column section"""
+
+    def __init__(self, inputs, nx=DEFAULT_MESH, ny=DEFAULT_MESH, engine=None):
+        self.width = float(inputs['width'])
+        self.height = float(inputs['height'])
+        self.fc = float(inputs['fc'])
+        self.fy = float(inputs['fy'])
+        self.nx = int(nx)
+        self.ny = int(ny)
+
+        fc = self.fc
+        self.beta1 = 0.85 if fc <= 28 else max(0.85 - 0.05*(fc-28)/7, 0.65)
+
+        # Concrete fibers: centroids of an nx × ny grid
+        dx = self.width / self.nx
+        dy = self.height / self.ny
+        gx = -self.width/2 + dx * (np.arange(self.nx) + 0.5)
+        gy = -self.height/2 + dy * (np.arange(self.ny) + 0.5)
+        fx, fy_ = np.meshgrid(gx, gy, indexing='ij')
+        self.concrete_x = fx.ravel()
+        self.concrete_y = fy_.ravel()
+        self.concrete_area = np.full(self.concrete_x.size, dx * dy)
+
+        # Steel fibers: one per bar at its real coordinates
+        xs, ys, areas, _ = bar_layout(inputs, engine)
+        self.bar_x = np.array(xs, dtype=float)
+        self.bar_y = np.array(ys, dtype=float)
+        self.bar_area = np.array(areas, dtype=float)
+
+        # Section corners bound the extreme compression fiber
+        self.corner_x = np.array([-1, 1, 1, -1]) * self.width / 2
+        self.corner_y = np.array([-1, -1, 1, 1]) * self.height / 2
+
+        self.Ag = self.width * self.height
+        self.As = float(self.bar_area.sum())
+        self.P0 = (0.85 * fc * (self.Ag - self.As) + self.fy * self.As) / 1000  # kN
+        self.P_cap = 0.8 * self.P0  # Tied column limit (kN)
+
+    def _depths(self, x, y, theta, u_max):
+        """Distance of points from the extreme compression fiber, shape (angles, points)"""
+        return u_max[:, None] - (np.cos(theta)[:, None] * x[None, :] +
+                                 np.sin(theta)[:, None] * y[None, :])
+
+    def analyze(self, theta, c):
+        """Integrate stresses for neutral-axis angles theta (rad) and depths c (mm)
+
+        theta is the direction pointing toward the compression face
+        (0 = +x face, π/2 = +y face). theta and c broadcast against each
+        other; returns nominal (Pn kN, Mnx kN⋅m, Mny kN⋅m) in the broadcast
+        shape. Mnx is the moment about the x-axis (compression on +y).
+        """
+        theta, c = np.broadcast_arrays(np.asarray(theta, dtype=float), np.asarray(c, dtype=float))
+        shape = theta.shape
+        theta = theta.reshape(-1)
+        c = c.reshape(-1)
+
+        u_corners = (np.cos(theta)[:, None] * self.corner_x[None, :] +
+                     np.sin(theta)[:, None] * self.corner_y[None, :])
+        u_max = u_corners.max(axis=1)
+
+        # Concrete: Whitney stress block over fibers within β1·c of the extreme fiber
+        depth_c = self._depths(self.concrete_x, self.concrete_y, theta, u_max)
+        in_block = depth_c <= self.beta1 * c[:, None]
+        Fc = np.where(in_block, 0.85 * self.fc * self.concrete_area[None, :], 0.0)
+
+        # Steel: linear strain, elastic-perfectly-plastic, less displaced concrete
+        depth_s = self._depths(self.bar_x, self.bar_y, theta, u_max)
+        strain = EPSILON_CU * (c[:, None] - depth_s) / c[:, None]
+        stress = np.clip(ES * strain, -self.fy, self.fy)
+        displaced = np.where(depth_s <= self.beta1 * c[:, None], 0.85 * self.fc, 0.0)
+        Fs = (stress - displaced) * self.bar_area[None, :]
+
+        Pn = (Fc.sum(axis=1) + Fs.sum(axis=1)) / 1000
+        Mnx = (Fc @ self.concrete_y + Fs @ self.bar_y) / 1000000
+        Mny = (Fc @ self.concrete_x + Fs @ self.bar_x) / 1000000
+        return Pn.reshape(shape), Mnx.reshape(shape), Mny.reshape(shape)
+
+    def interaction_surface(self, n_angles=24, n_depths=60):
+        """Sample the nominal P-Mx-My surface, arrays of shape (n_angles, n_depths)"""
+        theta = np.linspace(0.0, 2 * math.pi, n_angles, endpoint=False)
+        diagonal = math.hypot(self.width, self.height)
+        c = np.geomspace(0.01 * diagonal, 3.0 * diagonal, n_depths)
+        return self.analyze(theta[:, None], c[None, :])
+
+    def uniaxial_curve(self, direction, n_depths=60):
+        """Nominal (M, P) points for bending about one axis, compression on the positive face"""
+        theta = math.pi / 2 if direction == 'x' else 0.0
+        h = self.height if direction == 'x' else self.width
+        c = np.geomspace(0.01 * h, 3.0 * h, n_depths)
+        Pn, Mnx, Mny = self.analyze(theta, c)
+        return (Mnx if direction == 'x' else Mny), Pn
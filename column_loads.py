@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Load Combinations
+Builds factored (P, Mx, My) combinations from service loads and checks all
+of them against one section's cached interaction curves in a single pass.
+
+Factored loads are compared with design strength: the engine's curves are
+φPn-φMn curves (φ per ACI 318M-25 21.2) and the tension side closes at
+the design tension capacity 0.90 fy As.
+"""
+
+import numpy as np
+
+from column_engine import design_tension
+
+
+# Service load types, in matrix column order
+LOAD_TYPES = ('D', 'L', 'W', 'E')
+
+# ACI 318M-25 Table 5.3.1 strength combinations (roof/snow/rain terms omitted).
+# Wind and earthquake are reversible, so both signs are generated.
+ACI_COMBINATIONS = [
+    ('1.4D',              {'D': 1.4}),
+    ('1.2D + 1.6L',       {'D': 1.2, 'L': 1.6}),
+    ('1.2D + 1.0L + 0.5W',  {'D': 1.2, 'L': 1.0, 'W': 0.5}),
+    ('1.2D + 1.0L - 0.5W',  {'D': 1.2, 'L': 1.0, 'W': -0.5}),
+    ('1.2D + 1.0W + 1.0L',  {'D': 1.2, 'L': 1.0, 'W': 1.0}),
+    ('1.2D - 1.0W + 1.0L',  {'D': 1.2, 'L': 1.0, 'W': -1.0}),
+    ('1.2D + 1.0E + 1.0L',  {'D': 1.2, 'L': 1.0, 'E': 1.0}),
+    ('1.2D - 1.0E + 1.0L',  {'D': 1.2, 'L': 1.0, 'E': -1.0}),
+    ('0.9D + 1.0W',       {'D': 0.9, 'W': 1.0}),
+    ('0.9D - 1.0W',       {'D': 0.9, 'W': -1.0}),
+    ('0.9D + 1.0E',       {'D': 0.9, 'E': 1.0}),
+    ('0.9D - 1.0E',       {'D': 0.9, 'E': -1.0}),
+]
+
+
+def combination_matrix(combinations=ACI_COMBINATIONS):
+    """Load factors as an (n_combinations, n_load_types) array"""
+    matrix = np.zeros((len(combinations), len(LOAD_TYPES)))
+    for i, (_, factors) in enumerate(combinations):
+        for load_type, factor in factors.items():
+            matrix[i, LOAD_TYPES.index(load_type)] = factor
+    return matrix
+
+
+def factored_loads(service_loads, combinations=ACI_COMBINATIONS):
+    """Factored (P, Mx, My) for every combination via one matrix multiply
+
+    service_loads maps a load type ('D', 'L', 'W', 'E') to its (P, Mx, My)
+    service values in kN and kN⋅m; missing types are zero.
+    Returns (names, loads) with loads of shape (n_combinations, 3).
+    """
+    service = np.zeros((len(LOAD_TYPES), 3))
+    for load_type, values in service_loads.items():
+        service[LOAD_TYPES.index(load_type)] = values
+    names = [name for name, _ in combinations]
+    return names, combination_matrix(combinations) @ service
+
+
+def parse_load_table(text):
+    """Parse 'name, P, Mx, My' lines (comma, tab or space separated)
+
+    Blank lines and lines starting with '#' are ignored. Lines with only
+    three numbers get a generated name. Returns (names, loads array).
+    """
+    names = []
+    rows = []
+    for line_no, line in enumerate(text.splitlines(), 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        fields = [f for f in line.replace(',', ' ').replace('\t', ' ').split(' ') if f]
+        if len(fields) == 3:
+            fields = [f"LC{len(rows) + 1}"] + fields
+        if len(fields) != 4:
+            raise ValueError(f"Line {line_no}: expected 'name, P, Mx, My'")
+        names.append(fields[0])
+        rows.append([float(v) for v in fields[1:]])
+    return names, np.array(rows, dtype=float).reshape(-1, 3)
+
+
+def _closed_boundary(M_curve, P_curve, P_tension):
+    """Curve points closed on the tension side: pure tension → pure moment → ... → pure compression"""
+    M_curve = np.asarray(M_curve, dtype=float)
+    P_curve = np.asarray(P_curve, dtype=float)
+    start = np.argmax(M_curve > 0) if np.any(M_curve > 0) else 0
+    Mb = np.concatenate([[0.0], M_curve[start:]])
+    Pb = np.concatenate([[-P_tension], P_curve[start:]])
+    return Mb, Pb
+
+
+def curve_capacity_ratio(M_curve, P_curve, M, P, P_tension):
+    """Load/capacity ratio along the ray from the origin through each (M, P) load
+
+    The curve runs from the origin through pure bending to pure compression;
+    the tension side is closed with a straight line from the pure-moment
+    point to pure tension (0, -P_tension). Curve and P_tension are design
+    strengths (φ applied), like the loads they are compared with. Moments
+    are taken as magnitudes. Vectorized over loads; returns an array of
+    ratios (1.0 = on the curve).
+    """
+    M = np.abs(np.asarray(M, dtype=float)).reshape(-1)
+    P = np.asarray(P, dtype=float).reshape(-1)
+    Mb, Pb = _closed_boundary(M_curve, P_curve, P_tension)
+
+    Ax, Ay = Mb[:-1][None, :], Pb[:-1][None, :]
+    dx, dy = np.diff(Mb)[None, :], np.diff(Pb)[None, :]
+    m, p = M[:, None], P[:, None]
+
+    det = dx * p - m * dy
+    valid_det = det != 0
+    safe_det = np.where(valid_det, det, 1.0)
+    t = (dx * Ay - Ax * dy) / safe_det   # Ray parameter at the boundary
+    s = (m * Ay - p * Ax) / safe_det     # Position along the segment
+
+    hit = valid_det & (s >= -1e-12) & (s <= 1 + 1e-12) & (t > 0)
+    t = np.where(hit, t, np.inf).min(axis=1)
+
+    ratio = np.where(np.isfinite(t), 1.0 / t, np.inf)
+    ratio[(M == 0) & (P == 0)] = 0.0
+    return ratio
+
+
+def curve_moment_capacity(M_curve, P_curve, P, P_tension):
+    """Moment capacity of the (closed) curve at each axial load P
+
+    The horizontal line through each P is intersected with the boundary
+    and the largest moment is returned; loads outside the curve's axial
+    range (above the cap or below pure tension) get 0.
+    """
+    P = np.asarray(P, dtype=float).reshape(-1)
+    Mb, Pb = _closed_boundary(M_curve, P_curve, P_tension)
+
+    P0, P1 = Pb[:-1][None, :], Pb[1:][None, :]
+    M0, M1 = Mb[:-1][None, :], Mb[1:][None, :]
+    p = P[:, None]
+
+    dP = P1 - P0
+    inside = (dP != 0) & (p >= np.minimum(P0, P1)) & (p <= np.maximum(P0, P1))
+    t = (p - P0) / np.where(dP != 0, dP, 1.0)
+    M = np.where(inside, M0 + t * (M1 - M0), 0.0)
+    return M.max(axis=1)
+
+
+def curves_capacity_ratio(M_curves, P_curves, M, P, P_tension):
+    """curve_capacity_ratio for many sections at once
+
+    M_curves and P_curves are (n_sections, k) arrays as returned by
+    calculate_pm_interaction_batch (each row starting at the origin);
+    P_tension has one value per section. Returns (n_sections, n_loads).
+    """
+    M_curves = np.asarray(M_curves, dtype=float)
+    P_curves = np.asarray(P_curves, dtype=float)
+    n = M_curves.shape[0]
+    M = np.abs(np.asarray(M, dtype=float)).reshape(1, -1, 1)
+    P = np.asarray(P, dtype=float).reshape(1, -1, 1)
+
+    # Replace the origin with pure tension to close each boundary
+    Mb = M_curves.copy()
+    Pb = P_curves.copy()
+    Mb[:, 0] = 0.0
+    Pb[:, 0] = -np.broadcast_to(np.asarray(P_tension, dtype=float), (n,))
+
+    Ax, Ay = Mb[:, None, :-1], Pb[:, None, :-1]
+    dx, dy = np.diff(Mb, axis=1)[:, None, :], np.diff(Pb, axis=1)[:, None, :]
+
+    det = dx * P - M * dy
+    valid_det = det != 0
+    safe_det = np.where(valid_det, det, 1.0)
+    t = (dx * Ay - Ax * dy) / safe_det
+    s = (M * Ay - P * Ax) / safe_det
+
+    hit = valid_det & (s >= -1e-12) & (s <= 1 + 1e-12) & (t > 0)
+    t = np.where(hit, t, np.inf).min(axis=2)
+
+    ratio = np.where(np.isfinite(t), 1.0 / t, np.inf)
+    ratio[:, (M.reshape(-1) == 0) & (P.reshape(-1) == 0)] = 0.0
+    return ratio
+
+
+def check_load_combinations(engine, inputs, loads, names=None, exact=False, unstable=None):
+    """Check many (P, Mx, My) load cases against one section
+
+    The section's P-Mx and P-My curves come from the engine's cache, so they
+    are computed at most once. With exact=True no curve is built: each ratio
+    is solved for directly along the load ray (engine.capacity_ratios).
+    Each load case is checked in each direction and the larger ratio governs.
+    unstable optionally marks cases whose moment magnifier is unbounded
+    (column_slenderness.magnify_storey); they fail with infinite utilization
+    and their moments are not checked.
+    """
+    loads = np.asarray(loads, dtype=float).reshape(-1, 3)
+    checked = loads
+    if unstable is not None:
+        unstable = np.asarray(unstable, dtype=bool).reshape(-1)
+        checked = np.where(unstable[:, None], 0.0, loads)
+    if names is None:
+        names = [f"LC{i + 1}" for i in range(len(loads))]
+
+    results = engine.perform_calculations(inputs)
+
+    P, Mx, My = checked[:, 0], checked[:, 1], checked[:, 2]
+    if exact:
+        ratio_x = np.array(engine.capacity_ratios(results, 'x', P, Mx), dtype=float)
+        ratio_y = np.array(engine.capacity_ratios(results, 'y', P, My), dtype=float)
+    else:
+        P_tension = design_tension(results['fy'], results['As_provided'])
+        Mx_curve, Px_curve = engine.calculate_pm_interaction(results, 'x')
+        My_curve, Py_curve = engine.calculate_pm_interaction(results, 'y')
+        ratio_x = curve_capacity_ratio(Mx_curve, Px_curve, Mx, P, P_tension)
+        ratio_y = curve_capacity_ratio(My_curve, Py_curve, My, P, P_tension)
+    if unstable is not None:
+        ratio_x = np.where(unstable, np.inf, ratio_x)
+        ratio_y = np.where(unstable, np.inf, ratio_y)
+    utilization = np.maximum(ratio_x, ratio_y) * 100
+
+    governing = int(np.argmax(utilization)) if len(loads) else -1
+    return {
+        'names': list(names),
+        'loads': loads,
+        'utilization_x': ratio_x * 100,
+        'utilization_y': ratio_y * 100,
+        'utilization': utilization,
+        'governing_index': governing,
+        'governing_name': names[governing] if governing >= 0 else None,
+        'governing_utilization': float(utilization[governing]) if governing >= 0 else 0.0
+    }
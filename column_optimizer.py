@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Reinforcement Optimizer
+Searches section size, bar sizes and bar counts for the lightest column that
+passes the capacity, steel-ratio and tie-spacing checks.
+
+Sections are visited lightest first and skipped when even the maximum
+steel ratio cannot carry the axial load, when they cannot beat the best
+design found so far, or when a bound on all their layouts fails. The
+heaviest layout is not such a bound: it may put its steel in the wrong
+direction. The bound is a synthetic layout with, in each direction, the
+largest face steel of any candidate, and the largest total steel; with
+symmetric faces the P-M curves only grow with face steel, so if the bound
+fails, every real layout fails too. Within a section, layouts are checked
+in ascending steel area (vectorized, a chunk at a time), so the first pass
+is the lightest.
+"""
+
+import itertools
+import time
+
+import numpy as np
+
+from column_engine import ColumnDesignEngine, design_tension
+from column_rebar import DEFAULT_CATALOG
+from column_loads import curves_capacity_ratio
+
+
+# Search space
+SECTION_SIZES = list(range(200, 1001, 50))  # mm
+BAR_SIZES = DEFAULT_CATALOG.longitudinal_names()
+BAR_COUNTS = list(range(2, 9))  # Bars per face, including corners
+
+# Code limits
+MIN_STEEL_RATIO = 1.0  # %
+MAX_STEEL_RATIO = 6.0  # %
+MIN_CLEAR_SPACING = 40.0  # mm, ACI 318M-25 25.2.3 (or 1.5 db if larger)
+
+# Unit masses for the objective
+CONCRETE_DENSITY = 2400.0  # kg/m³
+STEEL_DENSITY = 7850.0  # kg/m³
+
+
+def column_mass(Ag, As):
+    """Mass per metre of column (kg/m) for gross and steel areas in mm²"""
+    return (np.asarray(Ag) - np.asarray(As)) * 1e-6 * CONCRETE_DENSITY + np.asarray(As) * 1e-6 * STEEL_DENSITY
+
+
+class ColumnOptimizer:
+    """Pruned search for the lightest passing column design"""
+
+    def __init__(self, engine=None, sizes=None, bar_sizes=None, bar_counts=None,
+                 square_only=False, max_utilization=100.0, chunk_size=64):
+        self.engine = engine or ColumnDesignEngine()
+        self.sizes = sizes or SECTION_SIZES
+        self.bar_sizes = bar_sizes or self.engine.rebar_catalog.longitudinal_names()
+        self.bar_counts = bar_counts or BAR_COUNTS
+        self.square_only = square_only
+        self.max_utilization = max_utilization
+        self.chunk_size = chunk_size
+
+        # Bar arrangements are the same for every section, so build them once
+        self._combos = list(itertools.product(self.bar_sizes, self.bar_sizes, self.bar_sizes,
+                                              self.bar_counts, self.bar_counts))
+        self._combo_arrays = [np.array(v) for v in zip(*self._combos)]
+
+    def _sections(self, inputs):
+        """Candidate (width, height) pairs, lightest concrete first"""
+        if self.square_only:
+            pairs = [(s, s) for s in self.sizes]
+        else:
+            pairs = list(itertools.product(self.sizes, self.sizes))
+        pairs = [(w, h) for w, h in pairs if min(w, h) > 2 * inputs['cover']]
+        return sorted(pairs, key=lambda wh: (wh[0] * wh[1], abs(wh[0] - wh[1])))
+
+    def _steel_candidates(self, inputs, width, height):
+        """Every bar arrangement for one section that passes the detailing and axial checks
+
+        Returns (combos, batch) with batch holding the perform_calculations_batch
+        arrays of the survivors, ordered by steel area.
+        """
+        combos = self._combos
+        rebar_x, rebar_y, corner, num_x, num_y = self._combo_arrays
+
+        columns = {**inputs, 'width': width, 'height': height,
+                   'rebar_x': rebar_x, 'rebar_y': rebar_y, 'corner_rebar': corner,
+                   'num_bars_x': num_x, 'num_bars_y': num_y}
+        batch = self.engine.perform_calculations_batch(columns)
+
+        # Clear spacing between bars along each face
+        db_x = self.engine.get_rebar_diameters(rebar_x)
+        db_y = self.engine.get_rebar_diameters(rebar_y)
+        clear_x = (width - 2 * inputs['cover']) / (num_x - 1) - db_x
+        clear_y = (height - 2 * inputs['cover']) / (num_y - 1) - db_y
+
+        ok = ((batch['steel_ratio'] >= MIN_STEEL_RATIO) &
+              (batch['steel_ratio'] <= MAX_STEEL_RATIO) &
+              batch['tie_spacing_ok'] &
+              (batch['utilization'] <= self.max_utilization) &
+              (clear_x >= np.maximum(MIN_CLEAR_SPACING, 1.5 * db_x)) &
+              (clear_y >= np.maximum(MIN_CLEAR_SPACING, 1.5 * db_y)))
+
+        keep = np.flatnonzero(ok)
+        keep = keep[np.argsort(batch['As_provided'][keep], kind='stable')]
+        survivors = {key: np.broadcast_to(np.asarray(value), (len(combos),))[keep]
+                     for key, value in {**columns, **batch}.items()}
+        return [combos[i] for i in keep], survivors
+
+    def _utilization(self, batch, index, loads):
+        """Governing utilization (%) of every load case for the candidates at index"""
+        subset = {key: value[index] for key, value in batch.items()}
+        P_tension = design_tension(subset['fy'], subset['As_provided'])
+        utilization = subset['utilization']
+        for direction, M in (('x', loads[:, 1]), ('y', loads[:, 2])):
+            M_curves, P_curves = self.engine.calculate_pm_interaction_batch(subset, direction)
+            ratio = curves_capacity_ratio(M_curves, P_curves, M, loads[:, 0], P_tension)
+            utilization = np.maximum(utilization, ratio.max(axis=1) * 100)
+        return utilization
+
+    @staticmethod
+    def _bound(batch, index):
+        """One-row batch at least as strong as every candidate at index, direction by direction
+
+        Corner bars are folded into both faces (each face gets half, as in
+        the P-M layers), the axial utilization is the lowest of the
+        candidates and the total steel the highest.
+        """
+        half_corner = batch['As_corner'][index] / 2
+        bound = {key: value[index[-1:]] for key, value in batch.items()}
+        bound['As_x'] = np.array([(batch['As_x'][index] + half_corner).max()])
+        bound['As_y'] = np.array([(batch['As_y'][index] + half_corner).max()])
+        bound['As_corner'] = np.zeros(1)
+        bound['As_provided'] = np.array([batch['As_provided'][index].max()])
+        bound['utilization'] = np.array([batch['utilization'][index].min()])
+        return bound
+
+    def optimize(self, inputs, loads=None, progress=None):
+        """Find the lightest passing design
+
+        inputs is a complete design inputs dict; its size and bar fields are
+        the starting point and are replaced by the search. loads is an
+        optional (n, 3) array of (P, Mx, My) cases (default: the inputs' own
+        P, Mx, My). progress, if given, is called with the fraction of
+        sections searched before each one (it may raise to abort). Returns a
+        dict with the best inputs and results (None if nothing passes) and
+        search statistics.
+        """
+        start = time.perf_counter()
+        if loads is None:
+            loads = [[inputs['P'], inputs['Mx'], inputs['My']]]
+        loads = np.asarray(loads, dtype=float).reshape(-1, 3)
+
+        # The axial check uses the largest compression of all load cases
+        inputs = {**inputs, 'P': float(loads[:, 0].max())}
+
+        best = None
+        best_mass = np.inf
+        best_utilization = None
+        evaluations = 0
+        pruned_sections = 0
+        pruned_candidates = 0
+
+        sections = self._sections(inputs)
+        for index, (width, height) in enumerate(sections):
+            if progress is not None:
+                progress(index / len(sections))
+            Ag = width * height
+
+            # Even the minimum steel ratio cannot beat the best design found
+            if column_mass(Ag, MIN_STEEL_RATIO / 100 * Ag) >= best_mass:
+                pruned_sections += 1
+                continue
+
+            # Axial capacity with the maximum steel ratio is an upper bound
+            As_max = MAX_STEEL_RATIO / 100 * Ag
+            Pu_max = 0.65 * (0.85 * inputs['fc'] * (Ag - As_max) + inputs['fy'] * As_max) / 1000
+            if inputs['P'] / Pu_max * 100 > self.max_utilization:
+                pruned_sections += 1
+                continue
+
+            combos, batch = self._steel_candidates(inputs, float(width), float(height))
+            mass = column_mass(Ag, batch['As_provided'])
+            lighter = np.flatnonzero(mass < best_mass)
+            if lighter.size == 0:
+                continue
+
+            # If the per-direction bound fails, no lighter layout passes
+            evaluations += 1
+            bound = self._bound(batch, lighter)
+            if self._utilization(bound, np.zeros(1, dtype=int), loads)[0] > self.max_utilization:
+                pruned_sections += 1
+                pruned_candidates += lighter.size - 1
+                continue
+
+            # Walk up in steel area a chunk at a time; the first pass is the lightest
+            for chunk_start in range(0, lighter.size, self.chunk_size):
+                index = lighter[chunk_start:chunk_start + self.chunk_size]
+                utilization = self._utilization(batch, index, loads)
+                evaluations += index.size
+                passing = np.flatnonzero(utilization <= self.max_utilization)
+                if passing.size:
+                    i = index[passing[0]]
+                    rx, ry, rc, nx, ny = combos[i]
+                    best = {**inputs, 'width': float(width), 'height': float(height),
+                            'rebar_x': rx, 'rebar_y': ry, 'corner_rebar': rc,
+                            'num_bars_x': int(nx), 'num_bars_y': int(ny)}
+                    best_mass = float(mass[i])
+                    best_utilization = float(utilization[passing[0]])
+                    pruned_candidates += lighter.size - chunk_start - index.size
+                    break
+
+        best_results = None
+        if best is not None:
+            best_results = self.engine.perform_calculations(best)
+            best_results['governing_utilization'] = best_utilization
+
+        return {
+            'inputs': best,
+            'results': best_results,
+            'mass_per_m': best_mass if best is not None else None,
+            'evaluations': evaluations,
+            'pruned_sections': pruned_sections,
+            'pruned_candidates': pruned_candidates,
+            'elapsed': time.perf_counter() - start
+        }
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Polygon Sections
+Columns of any polygonal shape (rectangular, L, T, circular, hollow) with
+bars at arbitrary coordinates.
+
+The Whitney stress block is the part of the section beyond a line at
+depth β1·c from the extreme compression fiber. Its area and first moments
+are integrated in closed form with Green's theorem on the clipped polygon:
+each edge is clipped to the compression side, and the pieces of the
+clipping line are accounted for through the closed-boundary identities, so
+no meshing is needed and every (angle, depth) pair costs one pass over the
+edges.
+
+Vertices and bar coordinates are in mm in any origin; the section is moved
+to its gross centroid. Holes are given as separate vertex rings.
+"""
+
+import math
+
+import numpy as np
+
+from column_engine import (ColumnDesignEngine, EPSILON_CU, ES, PHI_SPIRAL, PHI_TIED, SPIRAL_CAP,
+                           TIED_CAP, design_tension, strength_reduction)
+from column_fiber import FiberSection
+from column_loads import curve_capacity_ratio
+
+
+# Sides of the polygon standing in for a circle
+CIRCLE_SEGMENTS = 72
+
+# Neutral-axis depths sampled per uniaxial curve
+PM_CURVE_DEPTHS = 160
+
+
+def signed_area(ring):
+    """Shoelace area of a vertex ring, positive when counter-clockwise"""
+    x, y = np.asarray(ring, dtype=float).T
+    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))
+
+
+def rectangle(width, height):
+    """Counter-clockwise rectangle centered on the origin"""
+    return [(-width/2, -height/2), (width/2, -height/2), (width/2, height/2), (-width/2, height/2)]
+
+
+def circle(diameter, segments=CIRCLE_SEGMENTS):
+    """Regular polygon with the same area as a circle of the given diameter"""
+    radius = diameter / 2 * math.sqrt(2 * math.pi / (segments * math.sin(2 * math.pi / segments)))
+    return [(radius * math.cos(2 * math.pi * i / segments), radius * math.sin(2 * math.pi * i / segments))
+            for i in range(segments)]
+
+
+def l_shape(width, height, leg_width, leg_height):
+    """L section: a width × leg_height bottom leg and a leg_width × height vertical leg"""
+    return [(0, 0), (width, 0), (width, leg_height), (leg_width, leg_height), (leg_width, height), (0, height)]
+
+
+def t_shape(flange_width, flange_thickness, web_width, depth):
+    """T section with the flange on top, symmetric about the vertical axis"""
+    f, w = flange_width / 2, web_width / 2
+    return [(-w, 0), (w, 0), (w, depth - flange_thickness), (f, depth - flange_thickness),
+            (f, depth), (-f, depth), (-f, depth - flange_thickness), (-w, depth - flange_thickness)]
+
+
+def circular_bars(count, diameter, cover, bar, tie_diameter=0.0, bar_diameter=0.0):
+    """Bars equally spaced on a circle inside a circular section of the given diameter"""
+    radius = diameter / 2 - cover - tie_diameter - bar_diameter / 2
+    return [(radius * math.cos(2 * math.pi * i / count), radius * math.sin(2 * math.pi * i / count), bar)
+            for i in range(count)]
+
+
+class PolygonSection(FiberSection):
+    """Polygonal column section integrated in closed form
+
+    Shares analyze()'s conventions, interaction_surface() and
+    uniaxial_curve() with FiberSection; bars is an iterable of (x, y, bar)
+    where bar is a catalog designation or an area in mm². spiral=True uses
+    the spiral-column cap of 0.85 P0 instead of the tied 0.80 P0, and
+    φ = 0.75 instead of 0.65 when compression-controlled. P_cap is nominal;
+    pm_curve and check_loads work with design strength (design_cap,
+    P_tension).
+    """
+
+    def __init__(self, outer, bars, fc, fy, holes=(), spiral=False, engine=None):
+        engine = engine or ColumnDesignEngine()
+        self.fc = float(fc)
+        self.fy = float(fy)
+        self.beta1 = 0.85 if self.fc <= 28 else max(0.85 - 0.05*(self.fc-28)/7, 0.65)
+
+        # Outer ring counter-clockwise, holes clockwise, so the signed
+        # Green's theorem sums subtract the holes
+        rings = []
+        for i, ring in enumerate([outer, *holes]):
+            ring = [(float(x), float(y)) for x, y in ring]
+            if (signed_area(ring) > 0) != (i == 0):
+                ring.reverse()
+            rings.append(ring)
+
+        Ag = sum(signed_area(ring) for ring in rings)
+        if Ag <= 0:
+            raise ValueError("Section area must be positive")
+
+        # Gross centroid: first moments of each ring (shoelace form)
+        Sx = Sy = 0.0
+        for ring in rings:
+            x, y = np.asarray(ring).T
+            x1, y1 = np.roll(x, -1), np.roll(y, -1)
+            cross = x * y1 - x1 * y
+            Sy += float(((x + x1) * cross).sum()) / 6
+            Sx += float(((y + y1) * cross).sum()) / 6
+        cx, cy = Sy / Ag, Sx / Ag
+
+        # Edges, moved to the centroid
+        x0, y0, x1, y1 = [], [], [], []
+        for ring in rings:
+            for (ax, ay), (bx, by) in zip(ring, ring[1:] + ring[:1]):
+                x0.append(ax - cx)
+                y0.append(ay - cy)
+                x1.append(bx - cx)
+                y1.append(by - cy)
+        self.edge_x0, self.edge_y0 = np.array(x0), np.array(y0)
+        self.edge_x1, self.edge_y1 = np.array(x1), np.array(y1)
+
+        # Vertices bound the extreme compression fiber
+        self.corner_x = np.array([x - cx for x, _ in rings[0]])
+        self.corner_y = np.array([y - cy for _, y in rings[0]])
+        self.width = float(self.corner_x.max() - self.corner_x.min())
+        self.height = float(self.corner_y.max() - self.corner_y.min())
+
+        bars = list(bars)
+        self.bar_x = np.array([x - cx for x, _, _ in bars], dtype=float)
+        self.bar_y = np.array([y - cy for _, y, _ in bars], dtype=float)
+        self.bar_area = np.array([engine.get_rebar_area(bar) if isinstance(bar, str) else float(bar)
+                                  for _, _, bar in bars], dtype=float)
+
+        self.centroid = (cx, cy)
+        self.Ag = Ag
+        self.As = float(self.bar_area.sum())
+        self.P0 = (0.85 * self.fc * (self.Ag - self.As) + self.fy * self.As) / 1000  # kN
+        self.P_cap = (SPIRAL_CAP if spiral else TIED_CAP) * self.P0
+        self.phi_compression = PHI_SPIRAL if spiral else PHI_TIED
+        self.design_cap = self.phi_compression * self.P_cap
+        self.P_tension = design_tension(self.fy, self.As)
+        self._curves = {}
+
+    @classmethod
+    def from_dict(cls, data, engine=None):
+        """Section from {'outer', 'holes', 'bars', 'fc', 'fy', 'spiral'} (e.g. loaded from JSON)"""
+        return cls(data['outer'], [tuple(bar) for bar in data['bars']], data['fc'], data['fy'],
+                   data.get('holes', ()), data.get('spiral', False), engine)
+
+    def stress_block(self, theta, c):
+        """Area (mm²) and first moments Qx, Qy (mm³) of the Whitney block
+
+        theta and c broadcast as in analyze(). In coordinates (u, v)
+        rotated by theta the block is u ≥ u0. Per clipped edge piece,
+        A = ∮ u dv, Qu = ∮ u²/2 dv and Qv = ∮ u v dv; along the clipping
+        line u = u0, and since ∮ dv = ∮ v dv = 0 its pieces contribute
+        -u0 ΣΔv, -u0²/2 ΣΔv and -u0 ΣΔ(v²/2) of the edge pieces.
+        """
+        theta, c = np.broadcast_arrays(np.asarray(theta, dtype=float), np.asarray(c, dtype=float))
+        shape = theta.shape
+        cos = np.cos(theta.reshape(-1))[:, None]
+        sin = np.sin(theta.reshape(-1))[:, None]
+
+        u_max = (cos * self.corner_x[None, :] + sin * self.corner_y[None, :]).max(axis=1)
+        u0 = (u_max - self.beta1 * c.reshape(-1))[:, None]
+
+        ua = cos * self.edge_x0 + sin * self.edge_y0
+        va = cos * self.edge_y0 - sin * self.edge_x0
+        ub = cos * self.edge_x1 + sin * self.edge_y1
+        vb = cos * self.edge_y1 - sin * self.edge_x1
+
+        # Clip every edge to u ≥ u0 (edges entirely outside shrink to a point)
+        a_in, b_in = ua >= u0, ub >= u0
+        du = ub - ua
+        t = (u0 - ua) / np.where(du != 0, du, 1.0)
+        v_cross = va + t * (vb - va)
+        us = np.where(a_in, ua, u0)
+        vs = np.where(a_in, va, v_cross)
+        ue = np.where(b_in, ub, u0)
+        ve = np.where(b_in, vb, v_cross)
+        outside = ~(a_in | b_in)
+        vs = np.where(outside, 0.0, vs)
+        ve = np.where(outside, 0.0, ve)
+
+        dv = ve - vs
+        sum_dv = dv.sum(axis=1)
+        u0 = u0[:, 0]
+        A = (0.5 * (us + ue) * dv).sum(axis=1) - u0 * sum_dv
+        Qu = (dv * (us * us + us * ue + ue * ue) / 6).sum(axis=1) - 0.5 * u0 * u0 * sum_dv
+        Qv = ((dv * (2 * us * vs + us * ve + ue * vs + 2 * ue * ve) / 6).sum(axis=1)
+              - u0 * (0.5 * (ve * ve - vs * vs)).sum(axis=1))
+
+        # Back to section axes: x = u cos - v sin, y = u sin + v cos
+        cos, sin = cos[:, 0], sin[:, 0]
+        Qx = cos * Qu - sin * Qv
+        Qy = sin * Qu + cos * Qv
+        return A.reshape(shape), Qx.reshape(shape), Qy.reshape(shape)
+
+    def analyze(self, theta, c):
+        """Integrate stresses for neutral-axis angles theta (rad) and depths c (mm)
+
+        Same conventions and return values as FiberSection.analyze; the
+        concrete is integrated exactly instead of over fibers.
+        """
+        theta, c = np.broadcast_arrays(np.asarray(theta, dtype=float), np.asarray(c, dtype=float))
+        shape = theta.shape
+        theta = theta.reshape(-1)
+        c = c.reshape(-1)
+
+        A, Qx, Qy = self.stress_block(theta, c)
+        stress_c = 0.85 * self.fc
+
+        u_max = (np.cos(theta)[:, None] * self.corner_x[None, :] +
+                 np.sin(theta)[:, None] * self.corner_y[None, :]).max(axis=1)
+        depth_s = self._depths(self.bar_x, self.bar_y, theta, u_max)
+        strain = EPSILON_CU * (c[:, None] - depth_s) / c[:, None]
+        stress = np.clip(ES * strain, -self.fy, self.fy)
+        displaced = np.where(depth_s <= self.beta1 * c[:, None], stress_c, 0.0)
+        Fs = (stress - displaced) * self.bar_area[None, :]
+
+        Pn = (stress_c * A + Fs.sum(axis=1)) / 1000
+        Mnx = (stress_c * Qy + Fs @ self.bar_y) / 1000000
+        Mny = (stress_c * Qx + Fs @ self.bar_x) / 1000000
+        return Pn.reshape(shape), Mnx.reshape(shape), Mny.reshape(shape)
+
+    def design_curve(self, theta, n_depths=PM_CURVE_DEPTHS):
+        """Design (φPn, φMnx, φMny) along one neutral-axis angle, depths from small to large
+
+        φ follows the net tensile strain of the bar farthest from the
+        compression face.
+        """
+        cos, sin = math.cos(theta), math.sin(theta)
+        u_corners = cos * self.corner_x + sin * self.corner_y
+        depth = float(u_corners.max() - u_corners.min())
+        c = np.geomspace(0.01 * depth, 3.0 * depth, n_depths)
+        Pn, Mnx, Mny = self.analyze(theta, c)
+        d_t = float((u_corners.max() - (cos * self.bar_x + sin * self.bar_y)).max()) if self.As else depth
+        phi = strength_reduction(EPSILON_CU * (d_t - c) / c, self.fy, self.phi_compression)
+        return phi * Pn, phi * Mnx, phi * Mny
+
+    def pm_curve(self, direction, n_depths=PM_CURVE_DEPTHS, negative=False):
+        """Uniaxial design curve in the engine's format: origin, pure bending, ..., (0, design_cap)
+
+        Compression is on the positive face (positive moments); negative=True
+        gives the branch for negative moments, with compression on the
+        negative face, as magnitudes. For unsymmetric sections (L, T) the
+        two branches differ.
+        """
+        key = (direction, n_depths, negative)
+        if key not in self._curves:
+            theta = (math.pi / 2 if direction == 'x' else 0.0) + (math.pi if negative else 0.0)
+            P, Mnx, Mny = self.design_curve(theta, n_depths)
+            M = np.abs(Mnx if direction == 'x' else Mny)
+            inside = (P > 0) & (P < self.design_cap)
+            M_zero = float(np.interp(0.0, P, M))
+            M_cap = float(np.interp(self.design_cap, P, M))
+            self._curves[key] = ([0.0, M_zero, *M[inside].tolist(), M_cap, 0.0],
+                                 [0.0, 0.0, *P[inside].tolist(), self.design_cap, self.design_cap])
+        M, P = self._curves[key]
+        return list(M), list(P)
+
+    def check_loads(self, loads, names=None):
+        """Check (P, Mx, My) load cases against both uniaxial curves
+
+        Each moment is checked against the branch for its sign. Returns the
+        same dict as column_loads.check_load_combinations.
+        """
+        loads = np.asarray(loads, dtype=float).reshape(-1, 3)
+        if names is None:
+            names = [f"LC{i + 1}" for i in range(len(loads))]
+
+        P, Mx, My = loads[:, 0], loads[:, 1], loads[:, 2]
+        ratio_x, ratio_y = (
+            np.where(M < 0,
+                     curve_capacity_ratio(*self.pm_curve(direction, negative=True), M, P, self.P_tension),
+                     curve_capacity_ratio(*self.pm_curve(direction), M, P, self.P_tension))
+            for direction, M in (('x', Mx), ('y', My)))
+        utilization = np.maximum(ratio_x, ratio_y) * 100
+
+        governing = int(np.argmax(utilization)) if len(loads) else -1
+        return {
+            'names': list(names),
+            'loads': loads,
+            'utilization_x': ratio_x * 100,
+            'utilization_y': ratio_y * 100,
+            'utilization': utilization,
+            'governing_index': governing,
+            'governing_name': names[governing] if governing >= 0 else None,
+            'governing_utilization': float(utilization[governing]) if governing >= 0 else 0.0
+        }
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Stage Profiler
+Lightweight per-stage timers and counters for the analysis and report
+paths, shown in the GUI's performance panel and dumpable to JSON.
+
+Profiling is off unless the COLUMN_DESIGN_PROFILE environment variable is
+set (or it is switched on from the Tools menu). When off, stage() returns
+one shared no-op context manager, timed() wrappers call straight through
+and count() returns immediately, so the instrumented code pays only a
+function call and a flag check.
+"""
+
+import datetime
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+
+# Environment variable that enables profiling at startup
+PROFILE_ENV = "COLUMN_DESIGN_PROFILE"
+
+_NULL_STAGE = nullcontext()
+
+
+class _Stage:
+    """Context manager that adds its elapsed time to one stage"""
+
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class StageProfiler:
+    """Cumulative call counts and times per named stage, plus free counters"""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._stages = {}
+        self._counters = {}
+        # Background analysis records from a worker thread as well
+        self._lock = threading.Lock()
+        self._sources = {}
+
+    def stage(self, name):
+        """Context manager timing one pass through a stage (no-op when disabled)"""
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name)
+
+    def timed(self, name):
+        """Decorator timing every call of a function as one stage"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(name, time.perf_counter() - start)
+            return wrapper
+        return decorator
+
+    def record(self, name, seconds):
+        """Add one call of the given duration to a stage"""
+        with self._lock:
+            entry = self._stages.get(name)
+            if entry is None:
+                entry = self._stages[name] = [0, 0.0, 0.0]
+            entry[0] += 1
+            entry[1] += seconds
+            if seconds > entry[2]:
+                entry[2] = seconds
+
+    def count(self, name, n=1):
+        """Increment a counter (no-op when disabled)"""
+        if self.enabled:
+            with self._lock:
+                self._counters[name] = self._counters.get(name, 0) + n
+
+    def add_source(self, name, stats):
+        """Register a callable whose dict of counters (e.g. cache stats) joins every snapshot"""
+        self._sources[name] = stats
+
+    def reset(self):
+        """Forget all timings and counters (sources stay registered)"""
+        with self._lock:
+            self._stages.clear()
+            self._counters.clear()
+
+    def snapshot(self):
+        """Current timings, counters and source stats as a JSON-ready dict"""
+        stages = {}
+        with self._lock:
+            items = [(name, list(entry)) for name, entry in self._stages.items()]
+            counters = dict(self._counters)
+        for name, (calls, total, longest) in items:
+            stages[name] = {
+                'calls': calls,
+                'total_ms': total * 1000,
+                'mean_ms': total / calls * 1000,
+                'max_ms': longest * 1000
+            }
+        sources = {}
+        for name, stats in self._sources.items():
+            try:
+                sources[name] = stats()
+            except Exception as e:
+                sources[name] = {'error': str(e)}
+        return {
+            'enabled': self.enabled,
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'stages': stages,
+            'counters': counters,
+            'sources': sources
+        }
+
+    def dump_json(self, filename):
+        """Write the current snapshot to a JSON file"""
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+
+# Shared profiler used by the application
+profiler = StageProfiler(enabled=os.environ.get(PROFILE_ENV, '') not in ('', '0'))
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Project Files
+Columnar storage for column definitions, load cases and results.
+
+A project file (.cdp) is a small JSON header followed by a binary body:
+
+    8 bytes   magic b"CDPROJ\\x00\\x01"
+    8 bytes   header length (little-endian uint64)
+    header    UTF-8 JSON, space-padded to a multiple of 64 bytes
+    body      one typed array per table field, each 64-byte aligned
+
+The header lists every table (for example 'columns', 'loads', 'results')
+with its row count and, per field, the NumPy dtype and byte offset.
+Strings with few distinct values (rebar designations, load-case names)
+are stored as int32 codes with the categories in the header; other
+strings are fixed-width UTF-8. Opening a file reads only the header and
+memory-maps the body, so only the fields actually read are paged in.
+"""
+
+import datetime
+import json
+import mmap
+import os
+import struct
+
+import numpy as np
+
+
+MAGIC = b"CDPROJ\x00\x01"
+FORMAT_VERSION = 1
+ALIGN = 64
+
+# String fields with at most this many distinct values are stored as codes
+CATEGORY_LIMIT = 256
+
+# Default project file extension
+PROJECT_EXTENSION = ".cdp"
+
+
+def _aligned(n):
+    return (n + ALIGN - 1) // ALIGN * ALIGN
+
+
+def _field_array(values):
+    """Typed array for one field given a list of Python values (None = missing)"""
+    present = [v for v in values if v is not None]
+    if present and all(isinstance(v, (bool, np.bool_)) for v in present):
+        if len(present) == len(values):
+            return np.array(values, dtype=bool)
+        return np.array([np.nan if v is None else float(v) for v in values])
+    if present and all(isinstance(v, (int, np.integer)) and not isinstance(v, (bool, np.bool_)) for v in present):
+        if len(present) == len(values):
+            array = np.array(values, dtype=np.int64)
+            if array.size == 0 or (array.min() >= -2**31 and array.max() < 2**31):
+                array = array.astype(np.int32)
+            return array
+        return np.array([np.nan if v is None else float(v) for v in values])
+    if present and all(isinstance(v, (int, float, np.integer, np.floating)) for v in present):
+        return np.array([np.nan if v is None else float(v) for v in values])
+    return np.array(['' if v is None else str(v) for v in values], dtype=object)
+
+
+def _as_columns(table):
+    """Struct-of-arrays form of a table given as a list of row dicts or a dict of arrays"""
+    if isinstance(table, dict):
+        columns = {key: np.asarray(value) for key, value in table.items()}
+    else:
+        rows = list(table)
+        keys = []
+        for row in rows:
+            keys.extend(key for key in row if key not in keys)
+        columns = {key: _field_array([row.get(key) for row in rows]) for key in keys}
+    lengths = {len(value) for value in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError("All fields of a table must have the same length")
+    return columns, (lengths.pop() if lengths else 0)
+
+
+def _encode(values):
+    """(array to write, header entry) for one field"""
+    values = np.asarray(values)
+    if values.dtype.kind in 'USO':
+        strings = [str(v) for v in values.tolist()]
+        categories = sorted(set(strings))
+        if len(categories) <= CATEGORY_LIMIT:
+            lookup = {name: i for i, name in enumerate(categories)}
+            codes = np.array([lookup[s] for s in strings], dtype='<i4')
+            return codes, {'dtype': codes.dtype.str, 'categories': categories}
+        encoded = [s.encode('utf-8') for s in strings]
+        width = max((len(s) for s in encoded), default=1) or 1
+        array = np.array(encoded, dtype=f'S{width}')
+        return array, {'dtype': array.dtype.str, 'encoding': 'utf-8'}
+    if values.dtype.kind == 'b':
+        array = values.astype('|b1')
+    else:
+        array = values.astype(values.dtype.newbyteorder('<'))
+    return array, {'dtype': array.dtype.str}
+
+
+def save_project(filename, tables, meta=None):
+    """Write tables ({name: list of row dicts or dict of arrays}) to a project file
+
+    The file is written to a temporary name and moved into place, so an
+    interrupted save never leaves a truncated project.
+    """
+    encoded = {}
+    header_tables = {}
+    for name, table in tables.items():
+        if table is None:
+            continue
+        columns, rows = _as_columns(table)
+        fields = {}
+        for key, values in columns.items():
+            array, entry = _encode(values)
+            encoded[(name, key)] = array
+            fields[key] = entry
+        header_tables[name] = {'rows': rows, 'fields': fields}
+
+    header = {
+        'format': 'column-design-project',
+        'version': FORMAT_VERSION,
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'meta': meta or {},
+        'tables': header_tables
+    }
+
+    # Offsets depend on the header size, which depends on the offsets'
+    # digits; lay out once with placeholders, then until the size settles
+    header_size = 0
+    while True:
+        offset = _aligned(16 + header_size)
+        for (name, key), array in encoded.items():
+            header_tables[name]['fields'][key]['offset'] = offset
+            offset = _aligned(offset + array.nbytes)
+        text = json.dumps(header, separators=(',', ':')).encode('utf-8')
+        if len(text) <= header_size:
+            break
+        header_size = _aligned(len(text))
+    text = text.ljust(_aligned(16 + header_size) - 16, b' ')
+
+    temp = f"{filename}.tmp"
+    with open(temp, 'wb') as f:
+        f.write(MAGIC)
+        f.write(struct.pack('<Q', len(text)))
+        f.write(text)
+        for (name, key), array in encoded.items():
+            f.seek(header_tables[name]['fields'][key]['offset'])
+            f.write(memoryview(np.ascontiguousarray(array)).cast('B'))
+        f.truncate(max(f.tell(), 16 + len(text)))
+    os.replace(temp, filename)
+
+
+class ProjectFile:
+    """Read-only, memory-mapped view of a project file"""
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._file = open(filename, 'rb')
+        try:
+            prefix = self._file.read(16)
+            if len(prefix) < 16 or prefix[:8] != MAGIC:
+                raise ValueError(f"Not a column design project file: {filename}")
+            (length,) = struct.unpack('<Q', prefix[8:])
+            self.header = json.loads(self._file.read(length).decode('utf-8'))
+            if self.header.get('version', 0) > FORMAT_VERSION:
+                raise ValueError(f"Project file version {self.header['version']} is newer than supported")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def close(self):
+        """Release the mapping (arrays still referencing it keep it alive until freed)"""
+        try:
+            self._map.close()
+        except BufferError:
+            pass
+        self._file.close()
+
+    @property
+    def meta(self):
+        return self.header.get('meta', {})
+
+    def tables(self):
+        """Table names in the file"""
+        return list(self.header['tables'])
+
+    def fields(self, table):
+        """Field names of a table"""
+        return list(self.header['tables'][table]['fields'])
+
+    def rows(self, table):
+        """Row count of a table (0 if the table is absent)"""
+        entry = self.header['tables'].get(table)
+        return entry['rows'] if entry else 0
+
+    def raw(self, table, field):
+        """Zero-copy array over the mapped body (category codes for categorical fields)"""
+        entry = self.header['tables'][table]['fields'][field]
+        return np.frombuffer(self._map, dtype=np.dtype(entry['dtype']),
+                             count=self.header['tables'][table]['rows'], offset=entry['offset'])
+
+    def column(self, table, field, start=0, stop=None):
+        """Decoded values of one field, optionally for a slice of rows only"""
+        entry = self.header['tables'][table]['fields'][field]
+        values = self.raw(table, field)[start:stop]
+        if 'categories' in entry:
+            return np.array(entry['categories'], dtype=object)[values]
+        if 'encoding' in entry:
+            return np.array([v.decode(entry['encoding']) for v in values.tolist()], dtype=object)
+        return values
+
+    def read(self, table, fields=None, start=0, stop=None):
+        """Dict of decoded arrays for the given fields (default: all) and rows"""
+        return {field: self.column(table, field, start, stop) for field in (fields or self.fields(table))}
+
+    def row(self, table, index):
+        """One row as a dict of Python values"""
+        return self.page(table, index, index + 1)[0]
+
+    def page(self, table, start, stop):
+        """Rows start..stop as a list of dicts of Python values"""
+        data = self.read(table, start=start, stop=stop)
+        count = len(next(iter(data.values()))) if data else 0
+        return [{field: values[i].item() if hasattr(values[i], 'item') else values[i]
+                 for field, values in data.items()} for i in range(count)]
+
+    def read_all(self):
+        """Every table as a dict of in-memory arrays (strings as object arrays), for editing and re-saving"""
+        return {table: {field: np.array(values) for field, values in self.read(table).items()}
+                for table in self.tables()}
+
+
+def set_row(tables, table, index, values):
+    """Overwrite one row of a read_all() table, growing the table if index is past its end"""
+    columns = tables.setdefault(table, {})
+    rows = len(next(iter(columns.values()))) if columns else 0
+    for key in list(columns) + [key for key in values if key not in columns]:
+        column = columns.get(key)
+        if column is None:
+            value = values[key]
+            column = np.array([('' if isinstance(value, str) else np.nan)] * rows,
+                              dtype=object if isinstance(value, str) else float)
+        if column.dtype.kind in 'US':
+            column = column.astype(object)
+        if len(column) <= index:
+            filler = {'O': '', 'b': False, 'f': np.nan}.get(column.dtype.kind, 0)
+            column = np.concatenate([column, np.array([filler] * (index + 1 - len(column)), dtype=column.dtype)])
+        if key in values:
+            value = values[key]
+            if column.dtype.kind in 'iub' and not isinstance(value, (bool, int, np.integer, np.bool_)):
+                column = column.astype(float)
+            column[index] = value
+        columns[key] = column
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Rebar Catalog
+Immutable table of bar designations (area, diameter, yield strength, unit
+mass) built once at load time and shared by the engine and the GUI.
+
+The default catalog holds the Thai RB/DB series used by the application.
+Custom catalogs (other regional series, bundled bars) are loaded from CSV
+or JSON files with the same fields:
+
+    name,area,diameter,fy,unit_mass,longitudinal,tie
+    D19,284,19,420,,1,0
+
+area is in mm², diameter in mm, fy in MPa and unit_mass in kg/m (computed
+from the area when blank). Whole area, diameter and fy values are kept as
+int, as in the default table, so loaded catalogs give the engine's getters
+the same types; bundle diameters are fractional floats. longitudinal and
+tie choose which combobox lists a bar appears in. Bundles of an existing bar are added with
+with_bundles() or a JSON "bundles" list such as [{"bar": "DB25", "count": 2}].
+"""
+
+import csv
+import json
+import math
+import os
+from collections import namedtuple
+from types import MappingProxyType
+
+
+# Steel density used for unit masses
+STEEL_DENSITY = 7850.0  # kg/m³
+
+RebarSpec = namedtuple('RebarSpec', 'name area diameter fy unit_mass longitudinal tie')
+RebarSpec.__doc__ = "One bar designation: area (mm²), diameter (mm), fy (MPa), unit mass (kg/m)"
+
+
+def unit_mass(area):
+    """Mass per metre (kg/m) of a bar of the given area (mm²)"""
+    return area * 1e-6 * STEEL_DENSITY
+
+
+def _flag(value, default):
+    """Parse a yes/no catalog field"""
+    if value is None or value == '':
+        return default
+    if isinstance(value, str):
+        return value.strip().lower() in ('1', 'true', 'yes', 'y')
+    return bool(value)
+
+
+def _number(value):
+    """Parse a catalog number, as int when it is whole"""
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+def make_spec(name, area, diameter, fy, unit_mass_kg=None, longitudinal=True, tie=False):
+    """RebarSpec with numeric fields coerced and the unit mass filled in"""
+    area = _number(area)
+    return RebarSpec(str(name).strip(), area, _number(diameter), _number(fy),
+                     float(unit_mass_kg) if unit_mass_kg not in (None, '') else unit_mass(area),
+                     _flag(longitudinal, True), _flag(tie, False))
+
+
+class RebarCatalog:
+    """Read-only name → RebarSpec mapping with O(1) lookup"""
+
+    __slots__ = ('_specs', 'name')
+
+    def __init__(self, specs, name="custom"):
+        table = {}
+        for spec in specs:
+            if spec.name in table:
+                raise ValueError(f"Duplicate rebar designation: {spec.name}")
+            table[spec.name] = spec
+        self._specs = MappingProxyType(table)
+        self.name = name
+
+    def __getitem__(self, bar):
+        return self._specs[bar]
+
+    def __contains__(self, bar):
+        return bar in self._specs
+
+    def __iter__(self):
+        return iter(self._specs)
+
+    def __len__(self):
+        return len(self._specs)
+
+    def get(self, bar, default=None):
+        """Spec for a designation, or default"""
+        return self._specs.get(bar, default)
+
+    def specs(self):
+        """All specs in catalog order"""
+        return list(self._specs.values())
+
+    def longitudinal_names(self):
+        """Designations offered for longitudinal bars, in catalog order"""
+        return [spec.name for spec in self._specs.values() if spec.longitudinal]
+
+    def tie_names(self):
+        """Designations offered for ties, in catalog order"""
+        return [spec.name for spec in self._specs.values() if spec.tie]
+
+    def with_bundles(self, bars=None, counts=(2, 3)):
+        """New catalog adding bundled bars ("2-DB25") of existing designations
+
+        A bundle has n times the bar area and the equivalent diameter of a
+        single bar of that area (ACI 318M-25 25.6.1.6); bundles are only
+        offered as longitudinal bars.
+        """
+        bundles = []
+        for bar in (bars or self.longitudinal_names()):
+            spec = self._specs[bar]
+            for n in counts:
+                bundles.append(make_spec(f"{n}-{bar}", n * spec.area, spec.diameter * math.sqrt(n),
+                                         spec.fy, n * spec.unit_mass, longitudinal=True, tie=False))
+        return RebarCatalog(self.specs() + bundles, self.name)
+
+    @classmethod
+    def from_file(cls, filename):
+        """Load a catalog from a CSV or JSON file (see the module docstring)"""
+        name = os.path.splitext(os.path.basename(filename))[0]
+        if filename.lower().endswith('.json'):
+            with open(filename, encoding='utf-8') as f:
+                data = json.load(f)
+            bars = data.get('bars', []) if isinstance(data, dict) else data
+            catalog = cls([make_spec(b['name'], b['area'], b['diameter'], b['fy'], b.get('unit_mass'),
+                                     b.get('longitudinal', True), b.get('tie', False)) for b in bars],
+                          data.get('name', name) if isinstance(data, dict) else name)
+            if isinstance(data, dict):
+                for bundle in data.get('bundles', []):
+                    catalog = catalog.with_bundles([bundle['bar']], [int(bundle['count'])])
+            return catalog
+
+        with open(filename, newline='', encoding='utf-8') as f:
+            rows = [row for row in csv.DictReader(f) if row.get('name')]
+        return cls([make_spec(row['name'], row['area'], row['diameter'], row['fy'], row.get('unit_mass'),
+                              row.get('longitudinal'), row.get('tie')) for row in rows], name)
+
+
+# Round bars (RB, fy = 240 MPa) and deformed bars (DB, fy = 420 MPa)
+DEFAULT_CATALOG = RebarCatalog([
+    RebarSpec("RB6", 28.3, 6, 240, unit_mass(28.3), False, True),
+    RebarSpec("RB9", 63.6, 9, 240, unit_mass(63.6), False, True),
+    RebarSpec("DB10", 78.5, 10, 420, unit_mass(78.5), False, True),
+    RebarSpec("DB12", 113, 12, 420, unit_mass(113), True, True),
+    RebarSpec("DB16", 201, 16, 420, unit_mass(201), True, True),
+    RebarSpec("DB20", 314, 20, 420, unit_mass(314), True, False),
+    RebarSpec("DB25", 491, 25, 420, unit_mass(491), True, False),
+    RebarSpec("DB32", 804, 32, 420, unit_mass(804), True, False),
+], name="default")
@@ -0,0 +1,673 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Report Images
+Renders the section drawing and P-M diagrams used by the reports and the
+PDF export, as in-memory PNG buffers or vector ReportLab drawings.
+
+Images are cached by a hash of the results they are drawn from, so
+generating a report and then exporting it renders each image only once
+and nothing is written to disk. Matplotlib is imported on first render
+and only its object-oriented API is used (no pyplot global state).
+
+The PDF reports use vector ReportLab drawings of the same figures
+(section_drawing, pm_drawing), which keeps files small and
+resolution-independent.
+
+export_schedule_pdf writes a whole column schedule into one PDF: rows are
+computed on a process pool and the story is generated lazily, so
+flowables are created just before ReportLab lays them out.
+"""
+
+import datetime
+import hashlib
+import io
+import math
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from column_engine import ColumnDesignEngine, InteractionCurveCache, SECTION_KEYS, DEFAULT_INPUTS
+
+
+# Design (magnified) moments a schedule row may carry (column_batch.magnify_rows)
+DESIGN_MOMENT_KEYS = ('Mcx', 'Mcy')
+
+# Resolution of report images
+REPORT_IMAGE_DPI = 150
+
+# Number of rendered images kept per cache
+REPORT_IMAGE_CACHE_SIZE = 32
+
+# Results each image depends on
+SECTION_IMAGE_KEYS = ('width', 'height', 'cover', 'rebar_x', 'rebar_y', 'corner_rebar',
+                      'num_bars_x', 'num_bars_y', 'tie_size', 'tie_spacing')
+PM_IMAGE_KEYS = SECTION_KEYS + ('P', 'Mx', 'My', 'Mcx', 'Mcy', 'utilization', 'governing_utilization')
+
+# Schedule PDF: summary rows per table and flowables kept ahead of the layout
+SUMMARY_ROWS_PER_TABLE = 40
+STORY_LOW_WATER = 16
+
+# One image cache per worker process, so repeated sections render once
+_worker_images = None
+
+
+def image_signature(kind, results, keys, dpi=REPORT_IMAGE_DPI):
+    """Stable hash of the results an image is drawn from"""
+    parts = [f"kind={kind}", f"dpi={dpi}"]
+    for key in keys:
+        value = results.get(key)
+        if value is None:
+            continue
+        if not isinstance(value, str):
+            value = repr(float(value))
+        parts.append(f"{key}={value}")
+    return hashlib.sha1("|".join(parts).encode('utf-8')).hexdigest()
+
+
+def _figure(figsize):
+    """Stand-alone Agg figure (no pyplot, safe to use off the Tk thread)"""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def _png_bytes(fig, dpi):
+    """Render a figure to PNG bytes"""
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight')
+    return buffer.getvalue()
+
+
+def render_section_png(results, engine=None, dpi=REPORT_IMAGE_DPI):
+    """Detailed section drawing (bars, ties, dimensions, legend) as PNG bytes"""
+    import matplotlib.patches as patches
+    from matplotlib.lines import Line2D
+
+    engine = engine or ColumnDesignEngine()
+    fig = _figure((8, 6))
+    ax = fig.add_subplot(1, 1, 1)
+
+    # Column dimensions
+    width = results['width']
+    height = results['height']
+    cover = results['cover']
+
+    # Draw column outline
+    column_rect = patches.Rectangle((0, 0), width, height,
+                                    linewidth=2, edgecolor='black',
+                                    facecolor='lightgray', alpha=0.3)
+    ax.add_patch(column_rect)
+
+    # Draw reinforcement
+    rebar_x_dia = engine.get_rebar_diameter(results['rebar_x'])
+    rebar_y_dia = engine.get_rebar_diameter(results['rebar_y'])
+    corner_dia = engine.get_rebar_diameter(results['corner_rebar'])
+
+    # Corner bars
+    corner_positions = [
+        (cover, cover),  # Bottom-left
+        (width - cover, cover),  # Bottom-right
+        (width - cover, height - cover),  # Top-right
+        (cover, height - cover)  # Top-left
+    ]
+
+    for pos in corner_positions:
+        circle = patches.Circle(pos, corner_dia/2,
+                                facecolor='red', edgecolor='darkred')
+        ax.add_patch(circle)
+
+    # X-direction bars (excluding corners)
+    if results['num_bars_x'] > 2:  # Additional bars between corners
+        x_spacing = (width - 2*cover) / (results['num_bars_x'] - 1)
+        for i in range(1, int(results['num_bars_x']) - 1):
+            x_pos = cover + i * x_spacing
+            for y_pos in (cover, height - cover):  # Bottom and top bars
+                circle = patches.Circle((x_pos, y_pos), rebar_x_dia/2,
+                                        facecolor='blue', edgecolor='darkblue')
+                ax.add_patch(circle)
+
+    # Y-direction bars (excluding corners)
+    if results['num_bars_y'] > 2:  # Additional bars between corners
+        y_spacing = (height - 2*cover) / (results['num_bars_y'] - 1)
+        for i in range(1, int(results['num_bars_y']) - 1):
+            y_pos = cover + i * y_spacing
+            for x_pos in (cover, width - cover):  # Left and right bars
+                circle = patches.Circle((x_pos, y_pos), rebar_y_dia/2,
+                                        facecolor='green', edgecolor='darkgreen')
+                ax.add_patch(circle)
+
+    # Draw ties
+    tie_dia = engine.get_rebar_diameter(results['tie_size'])
+    tie_rect = patches.Rectangle((cover - tie_dia/2, cover - tie_dia/2),
+                                 width - 2*cover + tie_dia,
+                                 height - 2*cover + tie_dia,
+                                 linewidth=2, edgecolor='orange',
+                                 facecolor='none', linestyle='--')
+    ax.add_patch(tie_rect)
+
+    # Width dimension
+    ax.annotate('', xy=(0, -20), xytext=(width, -20),
+                arrowprops=dict(arrowstyle='<->', color='black'))
+    ax.text(width/2, -35, f'{width:.0f} mm', ha='center', va='top', fontsize=10)
+
+    # Height dimension
+    ax.annotate('', xy=(-20, 0), xytext=(-20, height),
+                arrowprops=dict(arrowstyle='<->', color='black'))
+    ax.text(-35, height/2, f'{height:.0f} mm', ha='center', va='bottom',
+            rotation=90, fontsize=10)
+
+    # Cover dimensions
+    ax.annotate('', xy=(0, height + 10), xytext=(cover, height + 10),
+                arrowprops=dict(arrowstyle='<->', color='red'))
+    ax.text(cover/2, height + 25, f'{cover:.0f} mm', ha='center', va='bottom',
+            fontsize=8, color='red')
+
+    # Reinforcement legend
+    legend_elements = [
+        Line2D([0], [0], marker='o', color='w', markerfacecolor='red',
+               markersize=8, label=f'Corner: 4-{results["corner_rebar"]}'),
+        Line2D([0], [0], marker='o', color='w', markerfacecolor='blue',
+               markersize=8, label=f'X-dir: {results["num_bars_x"]}-{results["rebar_x"]}'),
+        Line2D([0], [0], marker='o', color='w', markerfacecolor='green',
+               markersize=8, label=f'Y-dir: {results["num_bars_y"]}-{results["rebar_y"]}'),
+        Line2D([0], [0], color='orange', linestyle='--', linewidth=2,
+               label=f'Ties: {results["tie_size"]}@{results["tie_spacing"]:.0f}mm')
+    ]
+    ax.legend(handles=legend_elements, loc='upper left', bbox_to_anchor=(1.05, 1))
+
+    # Equal aspect ratio and limits
+    ax.set_xlim(-60, width + 60)
+    ax.set_ylim(-60, height + 60)
+    ax.set_aspect('equal')
+    ax.grid(True, alpha=0.3)
+    ax.set_xlabel('Width (mm)')
+    ax.set_ylabel('Height (mm)')
+    ax.set_title('Reinforcement Details\nColumn Cross-Section', fontsize=12, fontweight='bold')
+
+    fig.tight_layout()
+    return _png_bytes(fig, dpi)
+
+
+def _design_moment(results, axis):
+    """Moment plotted as the applied load: the magnified Mcx / Mcy when known, else Mx / My"""
+    M = results.get(f'Mc{axis}')
+    return M if M is not None and math.isfinite(M) else results[f'M{axis}']
+
+
+def render_pm_png(results, engine=None, dpi=REPORT_IMAGE_DPI):
+    """Side-by-side P-Mx and P-My interaction diagrams as PNG bytes"""
+    engine = engine or ColumnDesignEngine()
+    fig = _figure((12, 6))
+    ax1, ax2 = fig.subplots(1, 2)
+
+    # Interaction curves (from the engine's curve cache)
+    Mx_points, P_points_x = engine.calculate_pm_interaction(results, 'x')
+    My_points, P_points_y = engine.calculate_pm_interaction(results, 'y')
+
+    utilization = governing_utilization(results, engine)
+    if utilization <= 100:
+        safety_text = "SAFE"
+        color = 'green'
+    else:
+        safety_text = "UNSAFE"
+        color = 'red'
+
+    for ax, M_points, P_points, M, axis, style in (
+            (ax1, Mx_points, P_points_x, _design_moment(results, 'x'), 'x', 'b-'),
+            (ax2, My_points, P_points_y, _design_moment(results, 'y'), 'y', 'g-')):
+        ax.plot(M_points, P_points, style, linewidth=2, label='Design Curve (φPn-φMn)')
+        ax.plot(M, results['P'], 'ro', markersize=10, label='Applied Load')
+        ax.axhline(y=0, color='k', linestyle='-', alpha=0.3)
+        ax.axvline(x=0, color='k', linestyle='-', alpha=0.3)
+        ax.grid(True, alpha=0.3)
+        ax.set_xlabel(f'Moment M{axis} (kN⋅m)', fontsize=10)
+        ax.set_ylabel('Axial Load P (kN)', fontsize=10)
+        ax.set_title(f'P-M{axis} Interaction Diagram\nUtilization: {utilization:.1f}%',
+                     fontsize=11, fontweight='bold')
+        ax.legend()
+
+        # Safety annotation
+        ax.text(0.02, 0.98, f'Status: {safety_text}', transform=ax.transAxes,
+                bbox=dict(boxstyle='round', facecolor=color, alpha=0.3),
+                verticalalignment='top', fontweight='bold')
+
+    fig.tight_layout()
+    return _png_bytes(fig, dpi)
+
+
+# Size (points) of the vector report drawings
+SECTION_DRAWING_SIZE = (430, 280)
+PM_DRAWING_SIZE = (470, 250)
+
+
+def _rotated_string(x, y, text, **kwargs):
+    """String rotated 90° counter-clockwise about (x, y)"""
+    from reportlab.graphics.shapes import Group, String
+    return Group(String(0, 0, text, textAnchor='middle', **kwargs), transform=(0, 1, -1, 0, x, y))
+
+
+def section_drawing(results, engine=None, size=SECTION_DRAWING_SIZE):
+    """Section drawing (bars, ties, dimensions, legend) as a vector ReportLab Drawing"""
+    from reportlab.graphics.shapes import Drawing, Rect, Circle, Line, String
+    from reportlab.lib import colors
+
+    engine = engine or ColumnDesignEngine()
+    drawing_width, drawing_height = size
+    drawing = Drawing(drawing_width, drawing_height)
+
+    width = results['width']
+    height = results['height']
+    cover = results['cover']
+
+    # Section area on the left, legend on the right; mm → points
+    area = min(drawing_width * 0.62, drawing_height) - 70
+    scale = area / max(width, height)
+    ox = 45
+    oy = (drawing_height - 25 - height * scale) / 2 + 5
+
+    def point(x, y):
+        return ox + x * scale, oy + y * scale
+
+    drawing.add(String(drawing_width / 2, drawing_height - 14, 'Reinforcement Details - Column Cross-Section',
+                       textAnchor='middle', fontName='Helvetica-Bold', fontSize=11))
+
+    # Column outline
+    drawing.add(Rect(ox, oy, width * scale, height * scale, strokeColor=colors.black,
+                     strokeWidth=1.5, fillColor=colors.Color(0.9, 0.9, 0.9)))
+
+    # Ties
+    tie_dia = engine.get_rebar_diameter(results['tie_size'])
+    x0, y0 = point(cover - tie_dia/2, cover - tie_dia/2)
+    drawing.add(Rect(x0, y0, (width - 2*cover + tie_dia) * scale, (height - 2*cover + tie_dia) * scale,
+                     strokeColor=colors.orange, strokeWidth=1.2, strokeDashArray=[4, 2], fillColor=None))
+
+    # Bars: corners, then intermediate X (top/bottom) and Y (left/right) bars
+    def bar(x, y, dia, fill, stroke):
+        cx, cy = point(x, y)
+        drawing.add(Circle(cx, cy, max(dia/2 * scale, 1.0), fillColor=fill, strokeColor=stroke, strokeWidth=0.5))
+
+    corner_dia = engine.get_rebar_diameter(results['corner_rebar'])
+    for x, y in [(cover, cover), (width - cover, cover), (width - cover, height - cover), (cover, height - cover)]:
+        bar(x, y, corner_dia, colors.red, colors.darkred)
+
+    if results['num_bars_x'] > 2:
+        rebar_x_dia = engine.get_rebar_diameter(results['rebar_x'])
+        x_spacing = (width - 2*cover) / (results['num_bars_x'] - 1)
+        for i in range(1, int(results['num_bars_x']) - 1):
+            for y in (cover, height - cover):
+                bar(cover + i * x_spacing, y, rebar_x_dia, colors.blue, colors.darkblue)
+
+    if results['num_bars_y'] > 2:
+        rebar_y_dia = engine.get_rebar_diameter(results['rebar_y'])
+        y_spacing = (height - 2*cover) / (results['num_bars_y'] - 1)
+        for i in range(1, int(results['num_bars_y']) - 1):
+            for x in (cover, width - cover):
+                bar(x, cover + i * y_spacing, rebar_y_dia, colors.green, colors.darkgreen)
+
+    # Dimensions: width below, height on the left, cover above
+    x_left, y_bottom = point(0, 0)
+    x_right, y_top = point(width, height)
+    x_cover, _ = point(cover, 0)
+    drawing.add(Line(x_left, y_bottom - 10, x_right, y_bottom - 10, strokeWidth=0.6))
+    drawing.add(String((x_left + x_right) / 2, y_bottom - 22, f'{width:.0f} mm', textAnchor='middle', fontName='Helvetica', fontSize=8))
+    drawing.add(Line(x_left - 10, y_bottom, x_left - 10, y_top, strokeWidth=0.6))
+    drawing.add(_rotated_string(x_left - 14, (y_bottom + y_top) / 2, f'{height:.0f} mm', fontName='Helvetica', fontSize=8))
+    drawing.add(Line(x_left, y_top + 6, x_cover, y_top + 6, strokeColor=colors.red, strokeWidth=0.6))
+    drawing.add(String(x_left, y_top + 10, f'cover {cover:.0f} mm', fontName='Helvetica', fontSize=7, fillColor=colors.red))
+
+    # Legend
+    legend = [
+        (colors.red, f'Corner: 4-{results["corner_rebar"]}'),
+        (colors.blue, f'X-dir: {results["num_bars_x"]}-{results["rebar_x"]}'),
+        (colors.green, f'Y-dir: {results["num_bars_y"]}-{results["rebar_y"]}'),
+        (colors.orange, f'Ties: {results["tie_size"]}@{results["tie_spacing"]:.0f}mm'),
+    ]
+    lx = drawing_width * 0.66
+    ly = drawing_height - 50
+    for i, (color, label) in enumerate(legend):
+        y = ly - i * 16
+        if color is colors.orange:
+            drawing.add(Line(lx - 6, y + 3, lx + 6, y + 3, strokeColor=color, strokeWidth=1.2,
+                             strokeDashArray=[4, 2]))
+        else:
+            drawing.add(Circle(lx, y + 3, 4, fillColor=color, strokeColor=None))
+        drawing.add(String(lx + 12, y, label, fontName='Helvetica', fontSize=8))
+    return drawing
+
+
+def pm_drawing(results, engine=None, curves=None, size=PM_DRAWING_SIZE):
+    """Side-by-side P-Mx and P-My interaction diagrams as a vector ReportLab Drawing
+
+    curves is an optional (Mx, Px, My, Py) tuple of precomputed curve
+    points; by default they come from the engine's curve cache.
+    """
+    from reportlab.graphics.shapes import Drawing, String
+    from reportlab.graphics.charts.lineplots import LinePlot
+    from reportlab.graphics.widgets.markers import makeMarker
+    from reportlab.lib import colors
+
+    if curves is None:
+        engine = engine or ColumnDesignEngine()
+        curves = engine.calculate_pm_interaction(results, 'x') + engine.calculate_pm_interaction(results, 'y')
+    Mx_points, P_points_x, My_points, P_points_y = curves
+
+    drawing_width, drawing_height = size
+    drawing = Drawing(drawing_width, drawing_height)
+    utilization = governing_utilization(results, engine)
+    safe = utilization <= 100
+    status_color = colors.green if safe else colors.red
+    drawing.add(String(drawing_width / 2, drawing_height - 12,
+                       f"Column Interaction Diagrams - {'SAFE' if safe else 'UNSAFE'} "
+                       f"(Utilization: {utilization:.1f}%)",
+                       textAnchor='middle', fontName='Helvetica-Bold', fontSize=10, fillColor=status_color))
+
+    plot_width = drawing_width / 2 - 60
+    plot_height = drawing_height - 75
+    for i, (M_points, P_points, M, axis, color) in enumerate((
+            (Mx_points, P_points_x, _design_moment(results, 'x'), 'x', colors.blue),
+            (My_points, P_points_y, _design_moment(results, 'y'), 'y', colors.green))):
+        plot = LinePlot()
+        plot.x = 45 + i * drawing_width / 2
+        plot.y = 35
+        plot.width = plot_width
+        plot.height = plot_height
+        plot.data = [[(float(m), float(p)) for m, p in zip(M_points, P_points)],
+                     [(float(M), float(results['P']))]]
+        plot.lines[0].strokeColor = color
+        plot.lines[0].strokeWidth = 1.5
+        plot.lines[1].strokeColor = colors.red
+        plot.lines[1].symbol = makeMarker('FilledCircle', size=5, fillColor=colors.red)
+        for value_axis in (plot.xValueAxis, plot.yValueAxis):
+            value_axis.visibleGrid = 1
+            value_axis.gridStrokeColor = colors.lightgrey
+            value_axis.gridStrokeWidth = 0.3
+            value_axis.labels.fontName = 'Helvetica'
+            value_axis.labels.fontSize = 7
+        plot.xValueAxis.valueMin = 0
+        drawing.add(plot)
+
+        cx = plot.x + plot_width / 2
+        drawing.add(String(cx, plot.y + plot_height + 8, f'P-M{axis} Interaction Diagram',
+                           textAnchor='middle', fontName='Helvetica-Bold', fontSize=9))
+        drawing.add(String(cx, 8, f'Moment M{axis} (kN·m)', textAnchor='middle', fontName='Helvetica', fontSize=8))
+        drawing.add(_rotated_string(plot.x - 32, plot.y + plot_height / 2, 'Axial Load P (kN)', fontName='Helvetica', fontSize=8))
+    return drawing
+
+
+class ReportImageCache(InteractionCurveCache):
+    """Bounded LRU cache of rendered report images keyed by content hash"""
+
+    def __init__(self, maxsize=REPORT_IMAGE_CACHE_SIZE, engine=None, dpi=REPORT_IMAGE_DPI):
+        super().__init__(maxsize)
+        self.engine = engine or ColumnDesignEngine()
+        self.dpi = dpi
+        self.renders = 0
+
+    def _image(self, kind, keys, render, results):
+        key = image_signature(kind, results, keys, self.dpi)
+        image = self.get(key)
+        if image is None:
+            image = render(results)
+            self.renders += 1
+            self.put(key, image)
+        return image
+
+    def section_png(self, results):
+        """PNG bytes of the section drawing, rendered only if not cached"""
+        return self._image('section', SECTION_IMAGE_KEYS,
+                           lambda r: render_section_png(r, self.engine, self.dpi), results)
+
+    def pm_png(self, results):
+        """PNG bytes of the P-M diagrams, rendered only if not cached"""
+        return self._image('pm', PM_IMAGE_KEYS,
+                           lambda r: render_pm_png(r, self.engine, self.dpi), results)
+
+    def section_drawing(self, results):
+        """Vector section drawing (ReportLab Drawing), built only if not cached"""
+        return self._image('section-vector', SECTION_IMAGE_KEYS,
+                           lambda r: section_drawing(r, self.engine), results)
+
+    def pm_drawing(self, results):
+        """Vector P-M diagrams (ReportLab Drawing), built only if not cached"""
+        return self._image('pm-vector', PM_IMAGE_KEYS,
+                           lambda r: pm_drawing(r, self.engine), results)
+
+    def clear(self):
+        """Drop all images and reset the counters"""
+        super().clear()
+        self.renders = 0
+
+    def stats(self):
+        """Counters for diagnostics, including the number of renders"""
+        return {**super().stats(), 'renders': self.renders}
+
+
+def governing_utilization(results, engine=None):
+    """Governing P-M utilization (%): results['governing_utilization'] if set, else solved by the engine"""
+    utilization = results.get('governing_utilization')
+    if utilization is None:
+        utilization = (engine or ColumnDesignEngine()).governing_utilization(results)
+    return utilization
+
+
+def design_status(results, engine=None):
+    """True when the P-M, steel-ratio and tie-spacing checks all pass"""
+    return (governing_utilization(results, engine) <= 100 and results['tie_spacing_ok'] and
+            1.0 <= results['steel_ratio'] <= 6.0)
+
+
+def _render_column(row, vector=True):
+    """Worker task: results and report images for one schedule row
+
+    With vector=True the worker returns the P-M curve points instead of a
+    PNG; the (cheap) ReportLab drawings are built by the caller.
+    """
+    global _worker_images
+    if _worker_images is None:
+        _worker_images = ReportImageCache()
+    if row.get('error'):
+        return None, None, None, row['error']
+    try:
+        inputs = {**DEFAULT_INPUTS, **{k: v for k, v in row.items() if k in DEFAULT_INPUTS}}
+        engine = _worker_images.engine
+        results = engine.perform_calculations(inputs)
+        results.update({key: row[key] for key in DESIGN_MOMENT_KEYS if key in row})
+        results['governing_utilization'] = engine.governing_utilization(results)
+        if vector:
+            curves = engine.calculate_pm_interaction(results, 'x') + engine.calculate_pm_interaction(results, 'y')
+            return results, None, curves, None
+        return results, _worker_images.section_png(results), _worker_images.pm_png(results), None
+    except Exception as e:
+        return None, None, None, f"{type(e).__name__}: {e}"
+
+
+def _rendered_columns(rows, workers, vector=True):
+    """Yield _render_column output in row order, keeping only a few rows in flight"""
+    if workers == 1 or len(rows) <= 1:
+        for row in rows:
+            yield _render_column(row, vector)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        remaining = iter(rows)
+        for row in remaining:
+            pending.append(executor.submit(_render_column, row, vector))
+            if len(pending) >= 2 * workers:
+                break
+        while pending:
+            future = pending.popleft()
+            row = next(remaining, None)
+            if row is not None:
+                pending.append(executor.submit(_render_column, row, vector))
+            try:
+                yield future.result()
+            except Exception as e:
+                yield None, None, None, f"Worker failed: {type(e).__name__}: {e}"
+
+
+class _FlowableStream(list):
+    """Flowable list that refills itself from a generator as ReportLab consumes it
+
+    BaseDocTemplate.build takes flowables off the front of the list and
+    checks len() before every step, so topping the list up there keeps
+    only a handful of flowables alive at any time.
+    """
+
+    def __init__(self, flowables, low_water=STORY_LOW_WATER):
+        super().__init__()
+        self._source = iter(flowables)
+        self.low_water = low_water
+
+    def __len__(self):
+        while list.__len__(self) < self.low_water:
+            flowable = next(self._source, None)
+            if flowable is None:
+                break
+            self.append(flowable)
+        return list.__len__(self)
+
+
+def _pdf_image(png, width):
+    """ReportLab Image flowable scaled to a width, keeping the aspect ratio"""
+    from reportlab.lib.utils import ImageReader
+    from reportlab.platypus import Image
+    image_width, image_height = ImageReader(io.BytesIO(png)).getSize()
+    return Image(io.BytesIO(png), width=width, height=width * image_height / image_width)
+
+
+def _schedule_story(rows, summary, rendered, frame_width, title, engine, vector=True):
+    """Generate the flowables of a schedule report one at a time"""
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import Paragraph, Spacer, Table, TableStyle, PageBreak
+
+    styles = getSampleStyleSheet()
+    table_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('FONTSIZE', (0, 0), (-1, -1), 7),
+        ('GRID', (0, 0), (-1, -1), 0.25, colors.grey),
+        ('ALIGN', (2, 1), (-1, -1), 'RIGHT'),
+    ])
+
+    yield Paragraph(title, styles['Title'])
+    yield Paragraph(f"Columns: {len(rows)} &nbsp; Generated: "
+                    f"{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')} &nbsp; "
+                    f"Design Code: ACI 318M-25 Chapter 10", styles['Normal'])
+    yield Spacer(1, 12)
+
+    # Summary table, split into fixed-size tables so none gets huge
+    header = ['#', 'ID', 'Section (mm)', 'As (mm²)', 'ρ (%)', 'P (kN)', 'φPn (kN)', 'Util. (%)', 'Status']
+    for start in range(0, len(summary), SUMMARY_ROWS_PER_TABLE):
+        table = Table([header] + summary[start:start + SUMMARY_ROWS_PER_TABLE], repeatRows=1)
+        table.setStyle(table_style)
+        yield table
+        yield Spacer(1, 6)
+
+    # One section per column, built as its images arrive
+    for index, (row, (results, section_png, pm_data, error)) in enumerate(zip(rows, rendered)):
+        yield PageBreak()
+        yield Paragraph(f"{index + 1}. Column {row.get('id') or index + 1}", styles['Heading2'])
+        if error:
+            yield Paragraph(f"<b>Error:</b> {error}", styles['Normal'])
+            continue
+
+        details = [
+            ['Section', f"{results['width']:.0f} × {results['height']:.0f} mm, cover {results['cover']:.0f} mm"],
+            ['Materials', f"fc' = {results['fc']:.0f} MPa, fy = {results['fy']:.0f} MPa"],
+            ['Loads', f"P = {results['P']:,.0f} kN, Mx = {results['Mx']:.0f} kN⋅m, My = {results['My']:.0f} kN⋅m"
+                      + (f" (magnified: Mcx = {results['Mcx']:.0f}, Mcy = {results['Mcy']:.0f} kN⋅m)"
+                         if 'Mcx' in results else "")],
+            ['Reinforcement', f"X: {results['num_bars_x']:.0f} × {results['rebar_x']}, "
+                              f"Y: {results['num_bars_y']:.0f} × {results['rebar_y']}, "
+                              f"Corners: 4 × {results['corner_rebar']}"],
+            ['Steel', f"As = {results['As_provided']:,.0f} mm² (ρ = {results['steel_ratio']:.2f}%)"],
+            ['Ties', f"{results['tie_size']} @ {results['tie_spacing']:.0f} mm "
+                     f"(max {results['max_spacing']:.0f} mm)"],
+            ['Capacity', f"φPn = {results['Pu_capacity']:,.0f} kN, axial utilization {results['utilization']:.1f}%, "
+                         f"P-M utilization {results['governing_utilization']:.1f}%"],
+            ['Status', 'DESIGN ACCEPTABLE' if design_status(results) else 'DESIGN REQUIRES MODIFICATION'],
+        ]
+        table = Table(details, colWidths=[90, frame_width - 90])
+        table.setStyle(TableStyle([('FONTSIZE', (0, 0), (-1, -1), 8),
+                                   ('GRID', (0, 0), (-1, -1), 0.25, colors.grey)]))
+        yield table
+        yield Spacer(1, 8)
+        if vector:
+            yield section_drawing(results, engine)
+            yield pm_drawing(results, curves=pm_data)
+        else:
+            yield _pdf_image(section_png, frame_width * 0.75)
+            yield _pdf_image(pm_data, frame_width)
+
+
+def export_schedule_pdf(rows, filename, workers=None, engine=None,
+                        title="Column Schedule Design Report", vector=True, progress=None):
+    """Write a whole column schedule into one PDF: summary table, then one section per column
+
+    rows is a sequence of input dicts (missing keys take the GUI defaults,
+    an optional 'id' labels the column, and a row with an 'error', such as
+    an unstable column from column_batch.magnify_rows, is listed as an
+    error). Results and interaction curves
+    are computed on `workers` processes (default: all cores) a few rows
+    ahead of the layout; drawings are vector ReportLab graphics, or
+    Matplotlib PNGs rendered by the workers with vector=False. Flowables
+    are created only when ReportLab needs them, so memory does not grow
+    with the story. progress, if given, is called with the fraction of
+    columns laid out (it may raise to abort the export). Returns a dict
+    with the column count, errors, pages and elapsed time.
+    """
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import SimpleDocTemplate
+
+    start = time.perf_counter()
+    rows = list(rows)
+    engine = engine or ColumnDesignEngine()
+    workers = workers or os.cpu_count() or 1
+
+    # Summary rows are small, so they are computed up front
+    summary = []
+    for index, row in enumerate(rows):
+        label = str(row.get('id') or index + 1)
+        if row.get('error'):
+            summary.append([index + 1, label, '-', '-', '-', '-', '-', '-', 'ERROR'])
+            continue
+        try:
+            r = engine.perform_calculations({**DEFAULT_INPUTS, **{k: v for k, v in row.items() if k in DEFAULT_INPUTS}})
+            r.update({key: row[key] for key in DESIGN_MOMENT_KEYS if key in row})
+            r['governing_utilization'] = engine.governing_utilization(r)
+        except Exception:
+            summary.append([index + 1, label, '-', '-', '-', '-', '-', '-', 'ERROR'])
+            continue
+        summary.append([index + 1, label, f"{r['width']:.0f} × {r['height']:.0f}",
+                        f"{r['As_provided']:,.0f}", f"{r['steel_ratio']:.2f}", f"{r['P']:,.0f}",
+                        f"{r['Pu_capacity']:,.0f}", f"{r['governing_utilization']:.1f}",
+                        'OK' if design_status(r) else 'NG'])
+
+    doc = SimpleDocTemplate(filename, pagesize=A4, rightMargin=54, leftMargin=54,
+                            topMargin=54, bottomMargin=36, title=title)
+    errors = 0
+    rendered = _rendered_columns(rows, workers, vector)
+
+    def counted(rendered):
+        nonlocal errors
+        for done, item in enumerate(rendered):
+            if progress is not None:
+                progress(done / len(rows))
+            errors += item[3] is not None
+            yield item
+
+    doc.build(_FlowableStream(_schedule_story(rows, summary, counted(rendered), doc.width,
+                                              title, engine, vector)))
+
+    return {
+        'columns': len(rows),
+        'errors': errors,
+        'pages': doc.page,
+        'elapsed': time.perf_counter() - start
+    }
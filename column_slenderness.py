@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Slenderness Effects
+ACI 318M-25 6.6.4 moment magnification for whole storeys: every column and
+load case of a storey is magnified in one vectorized pass, before the
+interaction check.
+
+Loads are arrays of shape (n_columns,) or (n_columns, n_cases). Bending
+about x uses the section height (as slenderness_x in the engine), bending
+about y the width. M1/M2 ratios use the ACI sign convention: negative for
+single curvature, positive for double curvature, so Cm = 0.6 - 0.4 M1/M2
+(6.6.4.5.3a) and the short-column limit is 34 + 12 M1/M2 ≤ 40 (6.2.5.1c).
+The default, -1 (single curvature with equal end moments), gives Cm = 1.
+
+Sway magnification needs the storey sums ΣPu and ΣPc, which are taken per
+load case over every column sharing a storey label.
+"""
+
+import math
+
+import numpy as np
+
+
+# Stiffness reduction factor φK in the magnifier denominators (6.6.4.5.2, 6.6.4.6.2)
+STIFFNESS_REDUCTION = 0.75
+
+# Slenderness below which sway effects may be neglected (6.2.5.1a)
+SWAY_SLENDERNESS_LIMIT = 22.0
+
+# Upper limit on the non-sway slenderness threshold (6.2.5.1c)
+NONSWAY_SLENDERNESS_LIMIT = 40.0
+
+# Default ratio of sustained to total factored axial load for EI_eff
+DEFAULT_BETA_DNS = 0.6
+
+# Default end-moment ratio M1/M2: single curvature, equal end moments (Cm = 1)
+DEFAULT_M1_M2 = -1.0
+
+
+def concrete_modulus(fc):
+    """Ec = 4700 √fc' (MPa)"""
+    return 4700 * np.sqrt(fc)
+
+
+def effective_stiffness(fc, b, h, beta=DEFAULT_BETA_DNS):
+    """EI_eff = 0.4 Ec Ig / (1 + β) in N⋅mm² (6.6.4.4.4a), bending across h"""
+    Ig = b * h ** 3 / 12
+    return 0.4 * concrete_modulus(fc) * Ig / (1 + beta)
+
+
+def critical_load(EI, k, lu):
+    """Pc = π² EI_eff / (k lu)² in kN, with lu in m (6.6.4.4.2)"""
+    return math.pi ** 2 * EI / (k * lu * 1000) ** 2 / 1000
+
+
+def nonsway_magnifier(Pu, Pc, Cm=1.0):
+    """δ = Cm / (1 - Pu / 0.75 Pc) ≥ 1 (6.6.4.5.2)
+
+    Infinite when Pu ≥ 0.75 Pc: the column is unstable and has no design
+    moment (magnify_storey flags it instead of returning one).
+    """
+    Pu, Pc = np.broadcast_arrays(np.asarray(Pu, dtype=float), np.asarray(Pc, dtype=float))
+    denominator = 1 - Pu / (STIFFNESS_REDUCTION * Pc)
+    with np.errstate(divide='ignore'):
+        delta = np.where(denominator > 0, Cm / np.where(denominator > 0, denominator, 1.0), np.inf)
+    return np.maximum(delta, 1.0)
+
+
+def sway_magnifier(sum_Pu, sum_Pc):
+    """δs = 1 / (1 - ΣPu / 0.75 ΣPc) ≥ 1 (6.6.4.6.2b); infinite when the storey is unstable"""
+    return nonsway_magnifier(sum_Pu, sum_Pc, 1.0)
+
+
+def _storey_sum(values, groups, n_groups):
+    """Sum (n_columns, n_cases) values over the columns of each storey"""
+    sums = np.zeros((n_groups, values.shape[1]))
+    np.add.at(sums, groups, values)
+    return sums
+
+
+def _magnify_axis(P, M, M_sway, M1_M2, b, h, lu, fc, k, k_sway, beta_dns, beta_ds, sway, groups, n_groups):
+    """Magnified moments about one axis; see magnify_storey"""
+    r = h / math.sqrt(12)
+    slenderness = (k * lu * 1000 / r)[:, None]
+    compression = P > 0
+
+    # Sway moments first (6.6.4.6.1): M2 = M2ns + δs M2s
+    delta_s = np.ones(P.shape)
+    if sway:
+        Pc_sway = critical_load(effective_stiffness(fc, b, h, beta_ds), k_sway, lu)
+        sum_Pu = _storey_sum(P, groups, n_groups)
+        sum_Pc = _storey_sum(np.broadcast_to(Pc_sway[:, None], P.shape), groups, n_groups)
+        storey_delta = sway_magnifier(sum_Pu, sum_Pc)[groups]
+        sway_slender = (k_sway * lu * 1000 / r)[:, None] > SWAY_SLENDERNESS_LIMIT
+        delta_s = np.where(sway_slender, storey_delta, 1.0)
+    with np.errstate(invalid='ignore'):
+        M2 = M + np.where(M_sway != 0, delta_s * M_sway, 0.0)
+
+    # Magnification along the length (6.6.4.5), skipped for short columns (6.2.5.1b, c)
+    limit = np.minimum(34 + 12 * M1_M2, NONSWAY_SLENDERNESS_LIMIT)
+    slender = compression & (slenderness > limit)
+
+    Pc = critical_load(effective_stiffness(fc, b, h, beta_dns), k, lu)[:, None]
+    M2_min = P * (15 + 0.03 * h[:, None]) / 1000  # kN⋅m (6.6.4.5.4)
+    below_min = np.abs(M2) < M2_min
+    Cm = np.where(below_min, 1.0, 0.6 - 0.4 * M1_M2)
+    delta = np.where(slender, nonsway_magnifier(P, Pc, Cm), 1.0)
+
+    # A non-positive magnifier denominator (Pu ≥ 0.75 Pc) means instability
+    unstable = ~np.isfinite(delta) | ~np.isfinite(delta_s)
+
+    magnitude = np.where(slender & below_min, M2_min, np.abs(M2))
+    sign = np.where(M2 < 0, -1.0, 1.0)
+    with np.errstate(invalid='ignore'):
+        M_design = np.where(unstable, np.nan, sign * delta * magnitude)
+    return M_design, delta, delta_s, slender, unstable, np.broadcast_to(Pc, P.shape)
+
+
+def magnify_storey(columns, P, Mx, My, Mx_sway=0.0, My_sway=0.0, M1_M2_x=DEFAULT_M1_M2, M1_M2_y=DEFAULT_M1_M2,
+                   sway=False, k=1.0, k_sway=1.0, beta_dns=DEFAULT_BETA_DNS, beta_ds=0.0, storey=None):
+    """Magnified (P, Mx, My) for every column and load case of one or more storeys
+
+    columns maps 'width', 'height', 'length' and 'fc' to per-column arrays
+    (or scalars, which are broadcast). P, Mx and My are the factored
+    loads, with Mx and My the non-sway moments; in a sway frame Mx_sway and
+    My_sway are the sway moments, magnified by the storey δs. k is the
+    non-sway and k_sway the sway effective length factor. M1_M2_x and
+    M1_M2_y are the end-moment ratios, negative for single curvature.
+    storey labels each column (default: one storey) for the ΣPu / ΣPc sums.
+
+    Returns a dict of (n_columns, n_cases) arrays: P, Mx, My (design
+    moments), delta_x, delta_y, delta_s_x, delta_s_y, slender_x, slender_y,
+    unstable_x, unstable_y, unstable, Pc_x and Pc_y. Where Pu ≥ 0.75 Pc
+    (or ΣPu ≥ 0.75 ΣPc) the magnifier is infinite, unstable is True and the
+    design moment is NaN; such cases fail and must not be checked.
+    """
+    P = np.asarray(P, dtype=float)
+    squeeze = P.ndim == 1
+    P = P.reshape(len(P), -1) if P.ndim else P.reshape(1, 1)
+    shape = P.shape
+    n = shape[0]
+
+    def per_column(value):
+        return np.broadcast_to(np.asarray(value, dtype=float).reshape(-1), (n,))
+
+    def per_load(value):
+        value = np.asarray(value, dtype=float)
+        if value.ndim == 1 and value.shape[0] == n:
+            value = value[:, None]
+        return np.broadcast_to(value, shape)
+
+    width, height = per_column(columns['width']), per_column(columns['height'])
+    lu, fc = per_column(columns['length']), per_column(columns['fc'])
+    k, k_sway = per_column(k), per_column(k_sway)
+
+    if storey is None:
+        groups, n_groups = np.zeros(n, dtype=int), 1
+    else:
+        labels, groups = np.unique(np.asarray(storey).reshape(-1), return_inverse=True)
+        groups, n_groups = np.broadcast_to(groups.reshape(-1), (n,)), len(labels)
+
+    common = (per_column(beta_dns), per_column(beta_ds), sway, groups, n_groups)
+    Mx_design, delta_x, delta_s_x, slender_x, unstable_x, Pc_x = _magnify_axis(
+        P, per_load(Mx), per_load(Mx_sway), per_load(M1_M2_x), width, height, lu, fc, k, k_sway, *common)
+    My_design, delta_y, delta_s_y, slender_y, unstable_y, Pc_y = _magnify_axis(
+        P, per_load(My), per_load(My_sway), per_load(M1_M2_y), height, width, lu, fc, k, k_sway, *common)
+
+    result = {
+        'P': P,
+        'Mx': Mx_design,
+        'My': My_design,
+        'delta_x': delta_x,
+        'delta_y': delta_y,
+        'delta_s_x': delta_s_x,
+        'delta_s_y': delta_s_y,
+        'slender_x': slender_x,
+        'slender_y': slender_y,
+        'unstable_x': unstable_x,
+        'unstable_y': unstable_y,
+        'unstable': unstable_x | unstable_y,
+        'Pc_x': Pc_x,
+        'Pc_y': Pc_y
+    }
+    if squeeze:
+        result = {key: value[:, 0] for key, value in result.items()}
+    return result
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Result Store
+SQLite database of design results, for filtered queries over whole
+buildings ("columns above 95% on levels 10-20", "tie-spacing failures").
+
+Each run (a batch schedule, or analyses saved from the GUI) is bulk-inserted
+in one transaction. One row per column/load case holds the inputs, the
+scalar results, the section id, level (storey) and load case. Queries hit
+indexes on governing utilization, steel ratio, level and section id, and
+are paged with LIMIT/OFFSET.
+
+Levels are stored with NUMERIC affinity, so labels such as "12" compare as
+numbers and level ranges work; other labels ("Roof") stay text.
+"""
+
+import datetime
+import sqlite3
+
+from column_engine import DEFAULT_INPUTS, REBAR_KEYS
+
+
+# Scalar result columns; the design (magnified) moments Mcx and Mcy are kept
+# apart from the first-order input moments Mx and My
+RESULT_COLUMNS = ('Ag', 'As_provided', 'steel_ratio', 'Pu_capacity', 'utilization',
+                  'max_spacing', 'tie_spacing_ok', 'ld_required', 'utilization_x',
+                  'utilization_y', 'governing_utilization', 'Mcx', 'Mcy', 'delta_x', 'delta_y',
+                  'delta_s_x', 'delta_s_y')
+
+INPUT_COLUMNS = tuple(DEFAULT_INPUTS)
+
+# Columns a query can be sorted by
+SORT_COLUMNS = ('governing_utilization', 'utilization', 'steel_ratio', 'level', 'section_id', 'row_index')
+
+# Rows per page in the GUI browser
+DEFAULT_PAGE_SIZE = 100
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    created TEXT NOT NULL,
+    source TEXT,
+    rows INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    row_index INTEGER NOT NULL,
+    section_id TEXT,
+    level NUMERIC,
+    load_case TEXT,
+    {', '.join(f'{key} TEXT' if key in REBAR_KEYS else f'{key} REAL' for key in INPUT_COLUMNS)},
+    {', '.join(f'{key} REAL' for key in RESULT_COLUMNS)},
+    error TEXT
+);
+"""
+
+INDEXES = {
+    'idx_results_utilization': "results(governing_utilization)",
+    'idx_results_steel_ratio': "results(steel_ratio)",
+    'idx_results_level': "results(level, governing_utilization)",
+    'idx_results_section': "results(section_id)",
+    'idx_results_run': "results(run_id, row_index)",
+    'idx_results_tie_failures': "results(run_id) WHERE tie_spacing_ok = 0",
+}
+
+# Runs at least this large are inserted without indexes, which are rebuilt
+# afterwards in one sort (about twice as fast as updating them row by row)
+BULK_REINDEX_ROWS = 20000
+
+INSERT_COLUMNS = ('run_id', 'row_index', 'section_id', 'level', 'load_case',
+                  *INPUT_COLUMNS, *RESULT_COLUMNS, 'error')
+
+
+class ResultStore:
+    """SQLite result store; path ':memory:' gives a throwaway in-memory store"""
+
+    def __init__(self, path=':memory:'):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        if path != ':memory:':
+            # WAL lets the GUI read while a batch run is writing
+            self.connection.execute("PRAGMA journal_mode = WAL")
+            self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.executescript(SCHEMA)
+        with self.connection:
+            self._add_missing_columns()
+            self._create_indexes()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def close(self):
+        self.connection.close()
+
+    def _add_missing_columns(self):
+        """Add result columns introduced after a store was created"""
+        existing = {row['name'] for row in self.connection.execute("PRAGMA table_info(results)")}
+        for key in RESULT_COLUMNS:
+            if key not in existing:
+                self.connection.execute(f"ALTER TABLE results ADD COLUMN {key} REAL")
+
+    def _create_indexes(self):
+        for name, target in INDEXES.items():
+            self.connection.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+
+    def add_run(self, rows, output, source=None):
+        """Insert one run in a single transaction and return its id
+
+        rows are the schedule input dicts and output the matching entries of
+        column_batch.run_schedule ('index', 'id', 'results', 'error').
+        """
+        rows = list(rows)
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (created, source, rows) VALUES (?, ?, ?)",
+                (datetime.datetime.now().isoformat(timespec='seconds'), source, len(rows)))
+            run_id = cursor.lastrowid
+            bulk = len(rows) >= BULK_REINDEX_ROWS
+            if bulk:
+                for name in INDEXES:
+                    self.connection.execute(f"DROP INDEX IF EXISTS {name}")
+            placeholders = ', '.join('?' * len(INSERT_COLUMNS))
+            self.connection.executemany(
+                f"INSERT INTO results ({', '.join(INSERT_COLUMNS)}) VALUES ({placeholders})",
+                (self._record(run_id, row, entry) for row, entry in zip(rows, output)))
+            if bulk:
+                self._create_indexes()
+        return run_id
+
+    def add_result(self, inputs, results, section_id=None, level=None, load_case=None, source=None):
+        """Store a single analysis (for example the GUI's last results) as a one-row run"""
+        entry = {'index': 0, 'id': section_id, 'results': results, 'error': None}
+        row = {**inputs, 'storey': level, 'case': load_case}
+        return self.add_run([row], [entry], source)
+
+    @staticmethod
+    def _record(run_id, row, entry):
+        results = entry['results'] or {}
+        values = [run_id, entry['index'], entry['id'] or row.get('id'), row.get('storey'), row.get('case')]
+        # Inputs as given (first-order moments), so a stored row can be re-run
+        values.extend(row.get(key, default) for key, default in DEFAULT_INPUTS.items())
+        governing = results.get('governing_utilization', results.get('utilization'))
+        values.extend(governing if key == 'governing_utilization' else results.get(key)
+                      for key in RESULT_COLUMNS)
+        values.append(entry['error'])
+        return values
+
+    def runs(self):
+        """All runs, newest first"""
+        return [dict(row) for row in self.connection.execute("SELECT * FROM runs ORDER BY id DESC")]
+
+    def delete_run(self, run_id):
+        with self.connection:
+            self.connection.execute("DELETE FROM results WHERE run_id = ?", (run_id,))
+            self.connection.execute("DELETE FROM runs WHERE id = ?", (run_id,))
+
+    @staticmethod
+    def _where(run_id=None, min_utilization=None, max_utilization=None, min_steel_ratio=None,
+               max_steel_ratio=None, level_from=None, level_to=None, section_id=None,
+               tie_failures=False, errors=None):
+        """WHERE clause and parameters for the query filters"""
+        clauses, params = [], []
+        for column, operator, value in (
+                ('run_id', '=', run_id),
+                ('governing_utilization', '>=', min_utilization),
+                ('governing_utilization', '<=', max_utilization),
+                ('steel_ratio', '>=', min_steel_ratio),
+                ('steel_ratio', '<=', max_steel_ratio),
+                ('level', '>=', level_from),
+                ('level', '<=', level_to)):
+            if value is not None:
+                clauses.append(f"{column} {operator} ?")
+                params.append(value)
+        if section_id:
+            # Trailing '*' matches a prefix ("C1*"), which still uses the index
+            if section_id.endswith('*'):
+                clauses.append("section_id >= ? AND section_id < ?")
+                params.extend((section_id[:-1], section_id[:-1] + '\U0010ffff'))
+            else:
+                clauses.append("section_id = ?")
+                params.append(section_id)
+        if tie_failures:
+            clauses.append("tie_spacing_ok = 0")
+        if errors is True:
+            clauses.append("error IS NOT NULL")
+        elif errors is False:
+            clauses.append("error IS NULL")
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+    def query(self, limit=DEFAULT_PAGE_SIZE, offset=0, order_by='governing_utilization',
+              descending=True, **filters):
+        """One page of matching results as dicts
+
+        Filters: run_id, min_/max_utilization (governing, %), min_/max_steel_ratio
+        (%), level_from, level_to, section_id (exact, or a prefix ending in '*'),
+        tie_failures (only tie-spacing failures) and errors (True: only failed
+        rows, False: only designed rows).
+        """
+        if order_by not in SORT_COLUMNS:
+            raise ValueError(f"Cannot sort by {order_by!r}; choose one of {', '.join(SORT_COLUMNS)}")
+        where, params = self._where(**filters)
+        direction = 'DESC' if descending else 'ASC'
+        sql = f"SELECT * FROM results{where} ORDER BY {order_by} {direction}, id LIMIT ? OFFSET ?"
+        return [dict(row) for row in self.connection.execute(sql, (*params, limit, offset))]
+
+    def count(self, **filters):
+        """Number of results matching the filters of query"""
+        where, params = self._where(**filters)
+        return self.connection.execute(f"SELECT COUNT(*) FROM results{where}", params).fetchone()[0]
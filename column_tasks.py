@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Background Tasks
+Runs long GUI operations (analysis, optimization, report export) on a
+worker thread so the Tk window stays responsive.
+
+Tk may only be touched from the main thread, so the worker never calls it:
+progress updates and the final result go through a queue that the main
+thread drains every POLL_MS via root.after, and every callback runs there.
+
+Cancellation is cooperative. The work function receives the task and
+calls task.progress(fraction, message) between steps; once cancel() has
+been requested that call raises TaskCancelled, which unwinds the work and
+reports on_cancel instead of on_done.
+"""
+
+import queue
+import threading
+
+
+# Interval at which the main thread collects worker messages
+POLL_MS = 50
+
+
+class TaskCancelled(Exception):
+    """Raised inside the work function when its task has been cancelled"""
+
+
+class BackgroundTask:
+    """One unit of work on a daemon thread with main-thread callbacks
+
+    work(task) returns the result passed to on_done(result). on_progress
+    receives (fraction, message) with fraction in 0..1 or None when
+    unknown, on_error the exception raised by work, and on_cancel nothing.
+    """
+
+    def __init__(self, root, work, on_done=None, on_progress=None, on_error=None, on_cancel=None,
+                 name="task"):
+        self.root = root
+        self.work = work
+        self.on_done = on_done
+        self.on_progress = on_progress
+        self.on_error = on_error
+        self.on_cancel = on_cancel
+        self.name = name
+        self._messages = queue.Queue()
+        self._cancel = threading.Event()
+        self._thread = None
+        self.finished = False
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+        self.root.after(POLL_MS, self._poll)
+        return self
+
+    def cancel(self):
+        """Request cancellation; the work stops at its next progress() call"""
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def progress(self, fraction=None, message=""):
+        """Report progress from the worker (raises TaskCancelled once cancelled)"""
+        if self._cancel.is_set():
+            raise TaskCancelled()
+        self._messages.put(('progress', (fraction, message)))
+
+    def _run(self):
+        try:
+            result = self.work(self)
+        except TaskCancelled:
+            self._messages.put(('cancel', None))
+        except Exception as e:
+            self._messages.put(('error', e))
+        else:
+            # A cancel that arrives after the last step still discards the result
+            self._messages.put(('cancel', None) if self._cancel.is_set() else ('done', result))
+
+    def _poll(self):
+        """Deliver queued worker messages on the main thread"""
+        latest_progress = None
+        while True:
+            try:
+                kind, payload = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'progress':
+                latest_progress = payload
+                continue
+            self.finished = True
+            callback = {'done': self.on_done, 'error': self.on_error, 'cancel': self.on_cancel}[kind]
+            if callback is not None:
+                callback(*(() if kind == 'cancel' else (payload,)))
+            return
+        # Only the newest progress message matters to the display
+        if latest_progress is not None and self.on_progress is not None:
+            self.on_progress(*latest_progress)
+        self.root.after(POLL_MS, self._poll)
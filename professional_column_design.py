@@ -8,25 +8,25 @@ Complete structural design tool with detailed reinforcement and interaction diag
 import tkinter as tk
 from tkinter import ttk, messagebox
 import math
+import os
+import time
 import datetime
-try:
-    import numpy as np
-    import matplotlib.pyplot as plt
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    from matplotlib.figure import Figure
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
+from importlib.util import find_spec
 
-try:
-    from reportlab.lib.pagesizes import letter, A4
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib import colors
-    from reportlab.lib.units import inch
-    HAS_REPORTLAB = True
-except ImportError:
-    HAS_REPORTLAB = False
+from column_engine import ColumnDesignEngine, HAS_NUMPY
+from column_profiler import profiler, PROFILE_ENV
+from column_tasks import BackgroundTask, TaskCancelled
+
+# Optional libraries are only located here; they are imported on first use
+# (P-M diagram, report images, PDF export) so the window opens quickly.
+HAS_MATPLOTLIB = find_spec("numpy") is not None and find_spec("matplotlib") is not None
+HAS_REPORTLAB = find_spec("reportlab") is not None
+
+# Delay before redrawing the section preview after a keystroke
+PREVIEW_DEBOUNCE_MS = 120
+
+# Input keys whose tk variable is not named '<key>_var'
+INPUT_VAR_NAMES = {'P': 'axial_load_var', 'Mx': 'moment_x_var', 'My': 'moment_y_var'}
 
 
 class ProfessionalColumnDesign:
@@ -36,6 +36,9 @@ class ProfessionalColumnDesign:
         self.root.geometry("1200x800")
         self.root.configure(bg='#f8f9fa')
         
+        # Headless calculation engine (no GUI dependencies)
+        self.engine = ColumnDesignEngine()
+        
         # Configure style
         style = ttk.Style()
         style.theme_use('clam')
@@ -87,16 +90,474 @@ class ProfessionalColumnDesign:
         # Initialize calculation variables
         self.last_results = None
         self.interaction_data = None
+        self.pm_plot = None
+        self.report_images = None
+        self.section_preview_drawing = None
+        self.pm_diagrams_drawing = None
+        
+        # Open project file, the row of its 'columns' table being edited and its column id
+        self.project_path = None
+        self.project_index = None
+        self.project_column_id = None
+        
+        # Background task (analysis, optimization, report export) in progress
+        self.task = None
         
         # Enable mouse wheel scrolling
         self.bind_mousewheel()
         
+        # Tools menu and the caches reported in the performance panel
+        self.create_menu()
+        profiler.add_source('pm_cache', self.engine.pm_cache.stats)
+        profiler.add_source('report_images', lambda: self.report_images.stats() if self.report_images else {})
+        
     def bind_mousewheel(self):
         def _on_mousewheel(event):
             self.main_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
         
         self.main_canvas.bind("<MouseWheel>", _on_mousewheel)
         
+    def create_menu(self):
+        """Menu bar with project files, the profiling switch and the performance panel"""
+        menubar = tk.Menu(self.root)
+        file_menu = tk.Menu(menubar, tearoff=0)
+        file_menu.add_command(label="Open Project...", command=self.open_project)
+        file_menu.add_command(label="Save Project...", command=self.save_project)
+        menubar.add_cascade(label="File", menu=file_menu)
+        
+        tools_menu = tk.Menu(menubar, tearoff=0)
+        
+        self.profiling_var = tk.BooleanVar(value=profiler.enabled)
+        tools_menu.add_checkbutton(label="Enable Profiling", variable=self.profiling_var,
+                                   command=lambda: setattr(profiler, 'enabled', self.profiling_var.get()))
+        tools_menu.add_command(label="Performance Panel...", command=self.open_performance_panel)
+        tools_menu.add_command(label="Save Timings as JSON...", command=self.save_profile_json)
+        tools_menu.add_command(label="Reset Timings", command=profiler.reset)
+        tools_menu.add_separator()
+        tools_menu.add_command(label="Load Rebar Catalog...", command=self.load_rebar_catalog)
+        tools_menu.add_command(label="Result Store...", command=self.open_result_store)
+        
+        menubar.add_cascade(label="Tools", menu=tools_menu)
+        self.root.config(menu=menubar)
+    
+    def load_rebar_catalog(self):
+        """Replace the rebar catalog with one loaded from a CSV or JSON file"""
+        from tkinter import filedialog
+        from column_rebar import RebarCatalog
+        
+        filename = filedialog.askopenfilename(
+            filetypes=[("Rebar catalogs", "*.csv *.json"), ("All files", "*.*")],
+            title="Load Rebar Catalog"
+        )
+        if not filename or self.is_busy():
+            return
+        
+        try:
+            catalog = RebarCatalog.from_file(filename)
+        except Exception as e:
+            messagebox.showerror("Catalog Error", f"Could not load rebar catalog: {str(e)}")
+            return
+        if not catalog.longitudinal_names() or not catalog.tie_names():
+            messagebox.showerror("Catalog Error", "The catalog needs at least one longitudinal and one tie bar.")
+            return
+        
+        # Curves and images are keyed by bar names, so they are stale now
+        self.engine.rebar_catalog = catalog
+        self.engine.pm_cache.clear()
+        self.engine.pm_limits_cache.clear()
+        self.report_images = None
+        
+        for combo, var, names in ((self.rebar_x_combo, self.rebar_x_var, catalog.longitudinal_names()),
+                                  (self.rebar_y_combo, self.rebar_y_var, catalog.longitudinal_names()),
+                                  (self.corner_rebar_combo, self.corner_rebar_var, catalog.longitudinal_names()),
+                                  (self.tie_combo, self.tie_size_var, catalog.tie_names())):
+            combo['values'] = names
+            if var.get() not in catalog:
+                var.set(names[0])
+        self.update_preview()
+        
+        messagebox.showinfo("Rebar Catalog", f"Loaded '{catalog.name}' with {len(catalog)} bar designations.")
+    
+    def apply_input_data(self, inputs):
+        """Set the interface fields from an input dict (unknown keys are ignored)"""
+        for key, value in inputs.items():
+            var = getattr(self, INPUT_VAR_NAMES.get(key, f"{key}_var"), None)
+            if var is None or key == 'id':
+                continue
+            if isinstance(value, float) and value.is_integer():
+                value = int(value)
+            var.set(str(value))
+        self.update_preview()
+    
+    def _project_result_row(self):
+        """Scalar results of the last analysis for the project 'results' table"""
+        from column_batch import RESULT_KEYS
+        if self.last_results is None:
+            return None
+        return {key: self.last_results[key] for key in RESULT_KEYS
+                if isinstance(self.last_results.get(key), (bool, int, float))}
+    
+    def open_project(self):
+        """Open a project file and load one of its columns into the interface"""
+        from tkinter import filedialog
+        if not HAS_NUMPY:
+            messagebox.showerror("Missing Library", "Project files require numpy.\nInstall with: pip install numpy")
+            return
+        from column_project import ProjectFile, PROJECT_EXTENSION
+        
+        filename = filedialog.askopenfilename(
+            filetypes=[("Column projects", f"*{PROJECT_EXTENSION}"), ("All files", "*.*")],
+            title="Open Project"
+        )
+        if not filename:
+            return
+        
+        try:
+            project = ProjectFile(filename)
+        except Exception as e:
+            messagebox.showerror("Project Error", f"Could not open project: {str(e)}")
+            return
+        
+        count = project.rows('columns')
+        if count == 0:
+            project.close()
+            messagebox.showerror("Project Error", "The project has no columns.")
+            return
+        if count == 1:
+            self._load_project_column(project, 0)
+            return
+        
+        # Only the id field is read to fill the list; a column's other
+        # fields are read when it is picked
+        if 'id' in project.fields('columns'):
+            ids = project.column('columns', 'id').tolist()
+        else:
+            ids = [f"Column {i + 1}" for i in range(count)]
+        
+        dialog = tk.Toplevel(self.root)
+        dialog.title(f"Open Project - {count} columns")
+        dialog.geometry("320x420")
+        dialog.transient(self.root)
+        
+        frame = ttk.Frame(dialog, padding="10")
+        frame.pack(fill=tk.BOTH, expand=True)
+        listbox = tk.Listbox(frame, listvariable=tk.StringVar(value=ids), activestyle='dotbox')
+        scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=listbox.yview)
+        listbox.configure(yscrollcommand=scrollbar.set)
+        listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        listbox.selection_set(0)
+        
+        def load(event=None):
+            selection = listbox.curselection()
+            if selection:
+                self._load_project_column(project, selection[0])
+                dialog.destroy()
+        
+        def close():
+            project.close()
+            dialog.destroy()
+        
+        listbox.bind('<Double-Button-1>', load)
+        ttk.Button(dialog, text="Open Column", command=load).pack(pady=(0, 10))
+        dialog.protocol("WM_DELETE_WINDOW", close)
+    
+    def _load_project_column(self, project, index):
+        """Load row index of the project's 'columns' table into the interface"""
+        try:
+            row = project.row('columns', index)
+        finally:
+            project.close()
+        # Missing values are stored as NaN (numbers) or '' (labels)
+        self.apply_input_data({key: value for key, value in row.items() if value != '' and value == value})
+        self.project_path = project.filename
+        self.project_index = index
+        self.project_column_id = row.get('id') or None
+        self.last_results = None
+        self.root.title(f"Professional Column Design v3.0 - {row.get('id') or project.filename}")
+    
+    def save_project(self):
+        """Save the current column (and its last results) to a project file
+        
+        Saving back to the open project replaces only the column being edited.
+        """
+        from tkinter import filedialog
+        if not HAS_NUMPY:
+            messagebox.showerror("Missing Library", "Project files require numpy.\nInstall with: pip install numpy")
+            return
+        from column_project import ProjectFile, PROJECT_EXTENSION, save_project, set_row
+        
+        try:
+            inputs = self.collect_input_data()
+        except ValueError as e:
+            messagebox.showerror("Input Error", f"Invalid input values: {str(e)}")
+            return
+        
+        filename = filedialog.asksaveasfilename(
+            defaultextension=PROJECT_EXTENSION,
+            filetypes=[("Column projects", f"*{PROJECT_EXTENSION}"), ("All files", "*.*")],
+            initialfile=os.path.basename(self.project_path) if self.project_path else "column_project.cdp",
+            title="Save Project"
+        )
+        if not filename:
+            return
+        
+        results = self._project_result_row()
+        try:
+            if (self.project_path and self.project_index is not None and os.path.exists(filename)
+                    and os.path.samefile(filename, self.project_path)):
+                with ProjectFile(filename) as project:
+                    tables = project.read_all()
+                    meta = project.meta
+                set_row(tables, 'columns', self.project_index, inputs)
+                if results is not None:
+                    set_row(tables, 'results', self.project_index, {'index': self.project_index, **results})
+                save_project(filename, tables, meta=meta)
+            else:
+                tables = {'columns': [{'id': 'C1', **inputs}]}
+                if results is not None:
+                    tables['results'] = [{'index': 0, **results}]
+                save_project(filename, tables, meta={'source': 'Professional Column Design'})
+                self.project_path, self.project_index, self.project_column_id = filename, 0, 'C1'
+        except Exception as e:
+            messagebox.showerror("Save Error", f"Could not save project: {str(e)}")
+            return
+        
+        messagebox.showinfo("Project Saved", f"Project saved to {filename}")
+    
+    def open_result_store(self):
+        """Browse a SQLite result store with filters, one page at a time"""
+        from tkinter import filedialog, simpledialog
+        from column_store import ResultStore, DEFAULT_PAGE_SIZE, INPUT_COLUMNS
+        
+        window = tk.Toplevel(self.root)
+        window.title("Result Store")
+        window.geometry("820x520")
+        state = {'store': None, 'offset': 0, 'total': 0}
+        
+        top = ttk.Frame(window, padding="10")
+        top.pack(fill=tk.X)
+        path_label = ttk.Label(top, text="No store open")
+        path_label.pack(side=tk.LEFT)
+        
+        filters = ttk.Frame(window, padding=(10, 0))
+        filters.pack(fill=tk.X)
+        min_util_var = tk.StringVar(value="")
+        level_from_var = tk.StringVar(value="")
+        level_to_var = tk.StringVar(value="")
+        section_var = tk.StringVar(value="")
+        tie_var = tk.BooleanVar(value=False)
+        for label, var, width in (("Min Utilization (%):", min_util_var, 7), ("Levels:", level_from_var, 6),
+                                  ("to", level_to_var, 6), ("Section (C1*):", section_var, 10)):
+            ttk.Label(filters, text=label).pack(side=tk.LEFT, padx=(0, 3))
+            ttk.Entry(filters, textvariable=var, width=width).pack(side=tk.LEFT, padx=(0, 8))
+        ttk.Checkbutton(filters, text="Tie failures", variable=tie_var).pack(side=tk.LEFT)
+        
+        columns = ('section_id', 'level', 'load_case', 'governing_utilization', 'steel_ratio', 'tie_spacing_ok', 'error')
+        titles = ("Section", "Level", "Case", "Util. (%)", "ρ (%)", "Ties", "Error")
+        frame = ttk.Frame(window, padding="10")
+        frame.pack(fill=tk.BOTH, expand=True)
+        tree = ttk.Treeview(frame, columns=columns, show='headings', height=16)
+        for column, title in zip(columns, titles):
+            tree.heading(column, text=title)
+            tree.column(column, width=90, anchor=tk.E if column in ('governing_utilization', 'steel_ratio') else tk.W)
+        tree.column('error', width=200)
+        scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        bottom = ttk.Frame(window, padding=(10, 0, 10, 10))
+        bottom.pack(fill=tk.X)
+        status_label = ttk.Label(bottom, text="")
+        status_label.pack(side=tk.LEFT)
+        rows_by_item = {}
+        
+        def parse_filters():
+            def number_or_label(text):
+                text = text.strip()
+                if not text:
+                    return None
+                try:
+                    return float(text)
+                except ValueError:
+                    return text
+            min_util = min_util_var.get().strip()
+            return {
+                'min_utilization': float(min_util) if min_util else None,
+                'level_from': number_or_label(level_from_var.get()),
+                'level_to': number_or_label(level_to_var.get()),
+                'section_id': section_var.get().strip() or None,
+                'tie_failures': tie_var.get()
+            }
+        
+        def show_page():
+            store = state['store']
+            if store is None:
+                return
+            try:
+                query_filters = parse_filters()
+            except ValueError:
+                messagebox.showerror("Input Error", "Minimum utilization must be a number.", parent=window)
+                return
+            start = datetime.datetime.now()
+            state['total'] = store.count(**query_filters)
+            page = store.query(limit=DEFAULT_PAGE_SIZE, offset=state['offset'], **query_filters)
+            elapsed = (datetime.datetime.now() - start).total_seconds() * 1000
+            
+            tree.delete(*tree.get_children())
+            rows_by_item.clear()
+            for row in page:
+                values = []
+                for column in columns:
+                    value = row[column]
+                    if column == 'tie_spacing_ok':
+                        value = "" if value is None else ("OK" if value else "FAIL")
+                    elif isinstance(value, float) and column != 'level':
+                        value = f"{value:.1f}" if column == 'governing_utilization' else f"{value:.2f}"
+                    values.append("" if value is None else value)
+                rows_by_item[tree.insert('', tk.END, values=values)] = row
+            last = min(state['offset'] + DEFAULT_PAGE_SIZE, state['total'])
+            status_label.config(text=f"Rows {state['offset'] + 1 if page else 0}-{last} of {state['total']} "
+                                     f"({elapsed:.0f} ms)")
+        
+        def search():
+            state['offset'] = 0
+            show_page()
+        
+        def move(step):
+            offset = state['offset'] + step * DEFAULT_PAGE_SIZE
+            if 0 <= offset < max(state['total'], 1):
+                state['offset'] = offset
+                show_page()
+        
+        def open_store():
+            filename = filedialog.askopenfilename(
+                parent=window, filetypes=[("Result stores", "*.db *.sqlite"), ("All files", "*.*")],
+                title="Open Result Store"
+            )
+            if not filename:
+                return
+            try:
+                store = ResultStore(filename)
+            except Exception as e:
+                messagebox.showerror("Store Error", f"Could not open result store: {str(e)}", parent=window)
+                return
+            if state['store'] is not None:
+                state['store'].close()
+            state['store'] = store
+            path_label.config(text=filename)
+            search()
+        
+        def add_current():
+            if state['store'] is None:
+                messagebox.showwarning("No Store", "Open a result store first.", parent=window)
+                return
+            if self.last_results is None:
+                messagebox.showwarning("No Results", "Please run analysis first.", parent=window)
+                return
+            # The inputs behind the results (echoed by the engine), not the
+            # widgets, which may have been edited since the analysis
+            results = self.last_results
+            inputs = {key: results[key] for key in INPUT_COLUMNS if key in results}
+            
+            # Section ids are column ids, as in schedule runs
+            section_id = simpledialog.askstring("Add Result", "Column ID (optional):",
+                                                initialvalue=self.project_column_id or "", parent=window)
+            if section_id is None:
+                return
+            try:
+                state['store'].add_result(inputs, results, section_id=section_id.strip() or None,
+                                          source="Professional Column Design")
+            except Exception as e:
+                messagebox.showerror("Store Error", f"Could not add the result: {str(e)}", parent=window)
+                return
+            search()
+        
+        def load_selected(event=None):
+            row = rows_by_item.get(tree.focus())
+            if row:
+                self.apply_input_data({key: row[key] for key in INPUT_COLUMNS if row[key] is not None})
+        
+        def close():
+            if state['store'] is not None:
+                state['store'].close()
+            window.destroy()
+        
+        ttk.Button(top, text="Open Store...", command=open_store).pack(side=tk.RIGHT)
+        ttk.Button(top, text="Add Current Result", command=add_current).pack(side=tk.RIGHT, padx=(0, 5))
+        ttk.Button(filters, text="Search", command=search).pack(side=tk.RIGHT)
+        ttk.Button(bottom, text="Next ▶", command=lambda: move(1)).pack(side=tk.RIGHT)
+        ttk.Button(bottom, text="◀ Prev", command=lambda: move(-1)).pack(side=tk.RIGHT, padx=(0, 5))
+        tree.bind('<Double-Button-1>', load_selected)
+        window.protocol("WM_DELETE_WINDOW", close)
+    
+    def open_performance_panel(self):
+        """Show per-stage timings, counters and cache statistics"""
+        window = tk.Toplevel(self.root)
+        window.title("Performance Panel")
+        window.geometry("620x420")
+        
+        frame = ttk.Frame(window, padding="10")
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        status_label = ttk.Label(frame)
+        status_label.pack(anchor=tk.W, pady=(0, 5))
+        
+        columns = ('calls', 'total', 'mean', 'max')
+        tree = ttk.Treeview(frame, columns=columns, height=14)
+        tree.heading('#0', text="Stage / Counter")
+        tree.column('#0', width=240)
+        for column, title in zip(columns, ("Calls", "Total (ms)", "Mean (ms)", "Max (ms)")):
+            tree.heading(column, text=title)
+            tree.column(column, width=85, anchor=tk.E)
+        tree.pack(fill=tk.BOTH, expand=True)
+        
+        def refresh():
+            snapshot = profiler.snapshot()
+            status_label.config(text="Profiling is ON" if snapshot['enabled'] else 
+                               f"Profiling is OFF (enable from Tools or set {PROFILE_ENV}=1)")
+            tree.delete(*tree.get_children())
+            stages = tree.insert('', tk.END, text="Stages", open=True)
+            for name, stage in sorted(snapshot['stages'].items()):
+                tree.insert(stages, tk.END, text=name, values=(
+                    stage['calls'], f"{stage['total_ms']:.1f}", f"{stage['mean_ms']:.2f}", f"{stage['max_ms']:.2f}"))
+            counters = tree.insert('', tk.END, text="Counters", open=True)
+            for name, value in sorted(snapshot['counters'].items()):
+                tree.insert(counters, tk.END, text=name, values=(value, '', '', ''))
+            for source, stats in snapshot['sources'].items():
+                node = tree.insert('', tk.END, text=source, open=True)
+                for name, value in stats.items():
+                    tree.insert(node, tk.END, text=name, values=(value, '', '', ''))
+        
+        def reset():
+            profiler.reset()
+            refresh()
+        
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(fill=tk.X, pady=(10, 0))
+        ttk.Button(button_frame, text="🔄 Refresh", command=refresh).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(button_frame, text="🗑️ Reset", command=reset).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(button_frame, text="💾 Save JSON...", command=self.save_profile_json).pack(side=tk.LEFT)
+        
+        refresh()
+    
+    def save_profile_json(self):
+        """Dump the current timings and counters to a JSON file"""
+        from tkinter import filedialog
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+            title="Save Timings as JSON"
+        )
+        if not filename:
+            return
+        try:
+            profiler.dump_json(filename)
+            messagebox.showinfo("Saved", f"Timings saved as {filename}")
+        except Exception as e:
+            messagebox.showerror("Save Error", f"Could not save timings: {str(e)}")
+    
     def create_title_section(self, parent):
         title_frame = ttk.Frame(parent)
         title_frame.grid(row=0, column=0, columnspan=2, pady=(0, 15), sticky=(tk.W, tk.E))
@@ -160,6 +621,9 @@ class ProfessionalColumnDesign:
         self.moment_y_var = tk.StringVar(value="80")
         ttk.Entry(loads_frame, textvariable=self.moment_y_var, width=12).grid(row=2, column=1, sticky=tk.W, padx=(5, 0))
         
+        ttk.Button(loads_frame, text="📋 Load Combinations...", 
+                  command=self.open_load_combinations).grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=(8, 0))
+        
         # === MATERIALS ===
         materials_frame = ttk.LabelFrame(left_frame, text="🔹 Material Properties", padding="12")
         materials_frame.grid(row=2, column=0, columnspan=2, sticky="ew", pady=(0, 10))
@@ -185,11 +649,11 @@ class ProfessionalColumnDesign:
         
         tk.Label(main_rebar_frame, text="Size:", font=("Arial", 9)).grid(row=1, column=0, sticky=tk.W, pady=2)
         self.rebar_x_var = tk.StringVar(value="DB25")
-        rebar_x_combo = ttk.Combobox(main_rebar_frame, textvariable=self.rebar_x_var, 
-                                    values=["DB12", "DB16", "DB20", "DB25", "DB32"], 
+        self.rebar_x_combo = ttk.Combobox(main_rebar_frame, textvariable=self.rebar_x_var, 
+                                    values=self.engine.rebar_catalog.longitudinal_names(), 
                                     state="readonly", width=10)
-        rebar_x_combo.grid(row=1, column=1, sticky=tk.W, padx=(5, 0))
-        rebar_x_combo.bind('<<ComboboxSelected>>', self.update_preview)
+        self.rebar_x_combo.grid(row=1, column=1, sticky=tk.W, padx=(5, 0))
+        self.rebar_x_combo.bind('<<ComboboxSelected>>', self.update_preview)
         
         tk.Label(main_rebar_frame, text="Number:", font=("Arial", 9)).grid(row=2, column=0, sticky=tk.W, pady=2)
         self.num_bars_x_var = tk.StringVar(value="3")
@@ -202,11 +666,11 @@ class ProfessionalColumnDesign:
         
         tk.Label(main_rebar_frame, text="Size:", font=("Arial", 9)).grid(row=1, column=3, sticky=tk.W, pady=2, padx=(5, 0))
         self.rebar_y_var = tk.StringVar(value="DB25")
-        rebar_y_combo = ttk.Combobox(main_rebar_frame, textvariable=self.rebar_y_var, 
-                                    values=["DB12", "DB16", "DB20", "DB25", "DB32"], 
+        self.rebar_y_combo = ttk.Combobox(main_rebar_frame, textvariable=self.rebar_y_var, 
+                                    values=self.engine.rebar_catalog.longitudinal_names(), 
                                     state="readonly", width=10)
-        rebar_y_combo.grid(row=1, column=4, sticky=tk.W, padx=(5, 0))
-        rebar_y_combo.bind('<<ComboboxSelected>>', self.update_preview)
+        self.rebar_y_combo.grid(row=1, column=4, sticky=tk.W, padx=(5, 0))
+        self.rebar_y_combo.bind('<<ComboboxSelected>>', self.update_preview)
         
         tk.Label(main_rebar_frame, text="Number:", font=("Arial", 9)).grid(row=2, column=3, sticky=tk.W, pady=2, padx=(5, 0))
         self.num_bars_y_var = tk.StringVar(value="3")
@@ -219,11 +683,11 @@ class ProfessionalColumnDesign:
         
         tk.Label(main_rebar_frame, text="Size:", font=("Arial", 9)).grid(row=4, column=0, sticky=tk.W, pady=2)
         self.corner_rebar_var = tk.StringVar(value="DB25")
-        corner_rebar_combo = ttk.Combobox(main_rebar_frame, textvariable=self.corner_rebar_var, 
-                                         values=["DB12", "DB16", "DB20", "DB25", "DB32"], 
+        self.corner_rebar_combo = ttk.Combobox(main_rebar_frame, textvariable=self.corner_rebar_var, 
+                                         values=self.engine.rebar_catalog.longitudinal_names(), 
                                          state="readonly", width=10)
-        corner_rebar_combo.grid(row=4, column=1, sticky=tk.W, padx=(5, 0))
-        corner_rebar_combo.bind('<<ComboboxSelected>>', self.update_preview)
+        self.corner_rebar_combo.grid(row=4, column=1, sticky=tk.W, padx=(5, 0))
+        self.corner_rebar_combo.bind('<<ComboboxSelected>>', self.update_preview)
         
         tk.Label(main_rebar_frame, text="Always 4 bars", font=("Arial", 8), fg="gray").grid(row=4, column=2, sticky=tk.W, pady=2, padx=(20, 0))
         
@@ -233,11 +697,11 @@ class ProfessionalColumnDesign:
         
         tk.Label(ties_frame, text="Tie Size:", font=("Arial", 9, "bold")).grid(row=0, column=0, sticky=tk.W, pady=3)
         self.tie_size_var = tk.StringVar(value="DB12")
-        tie_combo = ttk.Combobox(ties_frame, textvariable=self.tie_size_var, 
-                                values=["RB6", "RB9", "DB10", "DB12", "DB16"], 
+        self.tie_combo = ttk.Combobox(ties_frame, textvariable=self.tie_size_var, 
+                                values=self.engine.rebar_catalog.tie_names(), 
                                 state="readonly", width=12)
-        tie_combo.grid(row=0, column=1, sticky=tk.W, padx=(5, 0))
-        tie_combo.bind('<<ComboboxSelected>>', self.update_preview)
+        self.tie_combo.grid(row=0, column=1, sticky=tk.W, padx=(5, 0))
+        self.tie_combo.bind('<<ComboboxSelected>>', self.update_preview)
         
         tk.Label(ties_frame, text="Spacing (mm):", font=("Arial", 9, "bold")).grid(row=1, column=0, sticky=tk.W, pady=3)
         self.tie_spacing_var = tk.StringVar(value="150")
@@ -282,14 +746,28 @@ class ProfessionalColumnDesign:
         button_frame = ttk.Frame(left_frame)
         button_frame.grid(row=6, column=0, columnspan=2, pady=(20, 0))
         
-        design_btn = ttk.Button(button_frame, text="🔧 Run Complete Analysis", 
-                               command=self.run_complete_analysis)
-        design_btn.pack(side=tk.LEFT, padx=(0, 10))
+        self.design_btn = ttk.Button(button_frame, text="🔧 Run Complete Analysis", 
+                                    command=self.run_complete_analysis)
+        self.design_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
+        self.optimize_btn = ttk.Button(button_frame, text="⚙️ Optimize Design", 
+                                      command=self.optimize_design)
+        self.optimize_btn.pack(side=tk.LEFT, padx=(0, 10))
         
         clear_btn = ttk.Button(button_frame, text="🗑️ Clear All", 
                               command=self.clear_all)
         clear_btn.pack(side=tk.LEFT)
         
+        # Progress of background work, with its Cancel button
+        progress_frame = ttk.Frame(left_frame)
+        progress_frame.grid(row=7, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
+        self.progress_bar = ttk.Progressbar(progress_frame, length=220, mode='determinate', maximum=100)
+        self.progress_bar.pack(side=tk.LEFT)
+        self.cancel_btn = ttk.Button(progress_frame, text="Cancel", command=self.cancel_task, state=tk.DISABLED)
+        self.cancel_btn.pack(side=tk.LEFT, padx=(10, 0))
+        self.task_status_label = ttk.Label(progress_frame, text="Ready")
+        self.task_status_label.pack(side=tk.LEFT, padx=(10, 0))
+        
         # === ENHANCED PREVIEW CANVAS ===
         preview_container = ttk.Frame(right_frame)
         preview_container.pack(fill=tk.BOTH, expand=True)
@@ -298,6 +776,11 @@ class ProfessionalColumnDesign:
                                        bg='white', relief=tk.SUNKEN, bd=2)
         self.preview_canvas.pack(expand=True, fill=tk.BOTH, padx=10, pady=10)
         
+        # Preview canvas items are reused between redraws
+        self._preview_items = {}
+        self._preview_bar_items = {}
+        self._preview_after_id = None
+        
         # Legend frame
         legend_frame = ttk.LabelFrame(right_frame, text="📚 Legend", padding="10")
         legend_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
@@ -351,7 +834,10 @@ class ProfessionalColumnDesign:
                   command=self.export_report).pack(side=tk.LEFT, padx=(0, 10))
         
         ttk.Button(results_control_frame, text="📑 Export to PDF", 
-                  command=self.export_to_pdf).pack(side=tk.LEFT)
+                  command=self.export_to_pdf).pack(side=tk.LEFT, padx=(0, 10))
+        
+        ttk.Button(results_control_frame, text="📚 Schedule to PDF...", 
+                  command=self.export_schedule_pdf).pack(side=tk.LEFT)
         
         results_main_frame = ttk.LabelFrame(self.results_frame, text="📋 Complete Design Report", padding="15")
         results_main_frame.pack(fill=tk.BOTH, expand=True)
@@ -368,45 +854,66 @@ class ProfessionalColumnDesign:
         
     def get_rebar_area(self, rebar_size):
         """Get area of single rebar in mm²"""
-        rebar_areas = {
-            # Round bars (RB) - fy = 240 MPa
-            "RB6": 28.3,    "RB9": 63.6,
-            # Deformed bars (DB) - fy = 420 MPa  
-            "DB10": 78.5,   "DB12": 113,    "DB16": 201,
-            "DB20": 314,    "DB25": 491,    "DB32": 804
-        }
-        return rebar_areas.get(rebar_size, 314)
+        return self.engine.get_rebar_area(rebar_size)
     
     def get_rebar_diameter(self, rebar_size):
         """Get diameter of rebar in mm"""
-        if rebar_size.startswith("RB"):
-            return int(rebar_size[2:])
-        elif rebar_size.startswith("DB"):
-            return int(rebar_size[2:])
-        else:
-            return 12  # Default
+        return self.engine.get_rebar_diameter(rebar_size)
     
     def get_rebar_strength(self, rebar_size):
         """Get yield strength of rebar in MPa"""
-        if rebar_size.startswith("RB"):
-            return 240  # Round bars
-        elif rebar_size.startswith("DB"):
-            return 420  # Deformed bars
-        else:
-            return 420  # Default
+        return self.engine.get_rebar_strength(rebar_size)
         
     def update_preview(self, event=None):
-        """Update the enhanced section preview with detailed reinforcement"""
+        """Schedule a section preview redraw (debounced while typing)"""
+        if self._preview_after_id is not None:
+            self.root.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.root.after(PREVIEW_DEBOUNCE_MS, self.redraw_preview)
+    
+    def _preview_item(self, key, kind, **options):
+        """Canvas item for a preview element, created on first use and reused afterwards"""
+        item = self._preview_items.get(key)
+        if item is None:
+            create = getattr(self.preview_canvas, f"create_{kind}")
+            item = create(0, 0, 0, 0, tags=("preview",), **options) if kind != "text" else \
+                create(0, 0, tags=("preview",), **options)
+            self._preview_items[key] = item
+        return item
+    
+    def _preview_bars(self, key, count, **options):
+        """List of bar ovals for one group, adding or removing items only when the count changes"""
+        items = self._preview_bar_items.setdefault(key, [])
+        while len(items) < count:
+            items.append(self.preview_canvas.create_oval(0, 0, 0, 0, tags=("preview",), **options))
+        while len(items) > count:
+            self.preview_canvas.delete(items.pop())
+        return items
+    
+    def _show_preview_message(self, text, font, color):
+        """Hide the drawing and show a single status message instead"""
+        canvas = self.preview_canvas
+        canvas.itemconfigure("preview", state="hidden")
+        message = self._preview_item("message", "text")
+        canvas.coords(message, 200, 250)
+        canvas.itemconfigure(message, text=text, font=font, fill=color, state="normal")
+    
+    @profiler.timed('preview.redraw')
+    def redraw_preview(self):
+        """Update the enhanced section preview with detailed reinforcement
+        
+        Canvas items are kept between redraws; only their coordinates and
+        styles change, and bar ovals are added or removed when counts change.
+        """
+        self._preview_after_id = None
+        canvas = self.preview_canvas
         try:
             width = float(self.width_var.get() or "500")
             height = float(self.height_var.get() or "500")
             cover = float(self.cover_var.get() or "50")
             
-            self.preview_canvas.delete("all")
-            
             # Canvas dimensions
-            canvas_width = self.preview_canvas.winfo_width()
-            canvas_height = self.preview_canvas.winfo_height()
+            canvas_width = canvas.winfo_width()
+            canvas_height = canvas.winfo_height()
             
             if canvas_width <= 1:
                 canvas_width = 400
@@ -422,22 +929,30 @@ class ProfessionalColumnDesign:
             w_scaled = width * scale
             h_scaled = height * scale
             
+            canvas.itemconfigure("preview", state="normal")
+            canvas.itemconfigure(self._preview_item("message", "text"), state="hidden")
+            
             # Draw concrete section
             x1, y1 = cx - w_scaled/2, cy - h_scaled/2
             x2, y2 = cx + w_scaled/2, cy + h_scaled/2
             
-            self.preview_canvas.create_rectangle(x1, y1, x2, y2, 
-                                               fill='#e8e8e8', outline='black', width=3)
+            section = self._preview_item("section", "rectangle", fill='#e8e8e8', outline='black', width=3)
+            canvas.coords(section, x1, y1, x2, y2)
+            canvas.tag_lower(section)
+            
+            cover_scaled = cover * scale
+            corners = [self._preview_item(f"corner_{i}", "oval") for i in range(4)]
             
             # Draw reinforcement
             try:
-                cover_scaled = cover * scale
-                
                 # Get reinforcement parameters
                 num_x = int(self.num_bars_x_var.get() or "3")
                 num_y = int(self.num_bars_y_var.get() or "3")
-                rebar_x_size = int(self.rebar_x_var.get()[2:])  # Extract diameter
-                rebar_y_size = int(self.rebar_y_var.get()[2:])
+                rebar_x_size = self.engine.get_rebar_diameter(self.rebar_x_var.get())
+                rebar_y_size = self.engine.get_rebar_diameter(self.rebar_y_var.get())
+                tie_size = self.engine.get_rebar_diameter(self.tie_size_var.get())
+                tie_spacing = float(self.tie_spacing_var.get() or "150")
+                tie_legs = int(self.tie_legs_var.get() or "2")
                 
                 # Bar radius in scaled units
                 bar_radius_x = max(2, rebar_x_size * scale / 2)
@@ -451,42 +966,35 @@ class ProfessionalColumnDesign:
                     (x1 + cover_scaled, y2 - cover_scaled),
                 ]
                 
-                for px, py in corner_positions:
-                    self.preview_canvas.create_oval(px-4, py-4, px+4, py+4,
-                                                   fill='red', outline='darkred', width=2)
+                for item, (px, py) in zip(corners, corner_positions):
+                    canvas.coords(item, px-4, py-4, px+4, py+4)
+                    canvas.itemconfigure(item, fill='red', outline='darkred', width=2)
                 
-                # X-direction bars (along width)
+                # X-direction bars (along width): top and bottom edge pairs
+                x_items = self._preview_bars("x_bars", 2 * max(num_x - 2, 0),
+                                             fill='blue', outline='darkblue', width=1)
                 if num_x > 2:  # Additional bars beyond corners
                     x_spacing = (w_scaled - 2*cover_scaled) / (num_x - 1)
                     for i in range(1, num_x - 1):
                         px = x1 + cover_scaled + i * x_spacing
-                        # Top edge
-                        self.preview_canvas.create_oval(px-bar_radius_x, y1+cover_scaled-bar_radius_x, 
-                                                       px+bar_radius_x, y1+cover_scaled+bar_radius_x,
-                                                       fill='blue', outline='darkblue', width=1)
-                        # Bottom edge
-                        self.preview_canvas.create_oval(px-bar_radius_x, y2-cover_scaled-bar_radius_x, 
-                                                       px+bar_radius_x, y2-cover_scaled+bar_radius_x,
-                                                       fill='blue', outline='darkblue', width=1)
+                        top, bottom = x_items[2*(i-1)], x_items[2*(i-1) + 1]
+                        canvas.coords(top, px-bar_radius_x, y1+cover_scaled-bar_radius_x, 
+                                      px+bar_radius_x, y1+cover_scaled+bar_radius_x)
+                        canvas.coords(bottom, px-bar_radius_x, y2-cover_scaled-bar_radius_x, 
+                                      px+bar_radius_x, y2-cover_scaled+bar_radius_x)
                 
-                # Y-direction bars (along height)
+                # Y-direction bars (along height): left and right edge pairs
+                y_items = self._preview_bars("y_bars", 2 * max(num_y - 2, 0),
+                                             fill='green', outline='darkgreen', width=1)
                 if num_y > 2:  # Additional bars beyond corners
                     y_spacing = (h_scaled - 2*cover_scaled) / (num_y - 1)
                     for i in range(1, num_y - 1):
                         py = y1 + cover_scaled + i * y_spacing
-                        # Left edge
-                        self.preview_canvas.create_oval(x1+cover_scaled-bar_radius_y, py-bar_radius_y, 
-                                                       x1+cover_scaled+bar_radius_y, py+bar_radius_y,
-                                                       fill='green', outline='darkgreen', width=1)
-                        # Right edge  
-                        self.preview_canvas.create_oval(x2-cover_scaled-bar_radius_y, py-bar_radius_y, 
-                                                       x2-cover_scaled+bar_radius_y, py+bar_radius_y,
-                                                       fill='green', outline='darkgreen', width=1)
-                
-                # Draw ties/stirrups
-                tie_size = int(self.tie_size_var.get()[2:])  # Extract diameter
-                tie_spacing = float(self.tie_spacing_var.get() or "150")
-                tie_legs = int(self.tie_legs_var.get() or "2")
+                        left, right = y_items[2*(i-1)], y_items[2*(i-1) + 1]
+                        canvas.coords(left, x1+cover_scaled-bar_radius_y, py-bar_radius_y, 
+                                      x1+cover_scaled+bar_radius_y, py+bar_radius_y)
+                        canvas.coords(right, x2-cover_scaled-bar_radius_y, py-bar_radius_y, 
+                                      x2-cover_scaled+bar_radius_y, py+bar_radius_y)
                 
                 # Tie outline (simplified rectangular stirrup)
                 tie_x1 = x1 + cover_scaled - tie_size/2*scale
@@ -494,116 +1002,263 @@ class ProfessionalColumnDesign:
                 tie_x2 = x2 - cover_scaled + tie_size/2*scale
                 tie_y2 = y2 - cover_scaled + tie_size/2*scale
                 
-                self.preview_canvas.create_rectangle(tie_x1, tie_y1, tie_x2, tie_y2,
-                                                   outline='orange', width=3, fill='')
+                canvas.coords(self._preview_item("tie", "rectangle", outline='orange', width=3, fill=''),
+                              tie_x1, tie_y1, tie_x2, tie_y2)
                 
                 # Show multiple tie levels if spacing allows
                 tie_height = tie_spacing * scale
                 section_height = h_scaled
-                if tie_height < section_height / 4:
-                    # Show 3 tie levels
-                    for i in [-0.3, 0, 0.3]:
-                        offset_y = i * section_height / 3
-                        self.preview_canvas.create_rectangle(
-                            tie_x1, tie_y1 + offset_y, tie_x2, tie_y2 + offset_y,
-                            outline='orange', width=2, fill='', dash=(3, 3))
+                show_levels = tie_height < section_height / 4
+                for level, i in enumerate([-0.3, 0, 0.3]):
+                    item = self._preview_item(f"tie_level_{level}", "rectangle",
+                                              outline='orange', width=2, fill='', dash=(3, 3))
+                    offset_y = i * section_height / 3
+                    canvas.coords(item, tie_x1, tie_y1 + offset_y, tie_x2, tie_y2 + offset_y)
+                    canvas.itemconfigure(item, state="normal" if show_levels else "hidden")
                 
                 # Add tie hook details
                 hook_size = 10
-                self.preview_canvas.create_line(tie_x2, tie_y1, tie_x2+hook_size, tie_y1-hook_size,
-                                              fill='orange', width=2)
-                self.preview_canvas.create_line(tie_x1, tie_y2, tie_x1-hook_size, tie_y2+hook_size,
-                                              fill='orange', width=2)
+                canvas.coords(self._preview_item("hook_0", "line", fill='orange', width=2),
+                              tie_x2, tie_y1, tie_x2+hook_size, tie_y1-hook_size)
+                canvas.coords(self._preview_item("hook_1", "line", fill='orange', width=2),
+                              tie_x1, tie_y2, tie_x1-hook_size, tie_y2+hook_size)
+                
+                # Reinforcement summary
+                rebar_text = f"Reinforcement:\n"
+                rebar_text += f"X: {num_x}×{self.rebar_x_var.get()}\n"
+                rebar_text += f"Y: {num_y}×{self.rebar_y_var.get()}\n"
+                rebar_text += f"Ties: {self.tie_size_var.get()} @ {tie_spacing:.0f}mm"
+                
+                summary = self._preview_item("summary", "text", font=("Arial", 8), justify=tk.CENTER)
+                canvas.coords(summary, cx, canvas_height-60)
+                canvas.itemconfigure(summary, text=rebar_text)
                 
-            except:
+            except (ValueError, IndexError):
                 # Basic corner bars if reinforcement parameters fail
-                for px, py in [(x1+20, y1+20), (x2-20, y1+20), (x2-20, y2-20), (x1+20, y2-20)]:
-                    self.preview_canvas.create_oval(px-3, py-3, px+3, py+3,
-                                                   fill='red', outline='darkred')
+                for key in ("tie", "tie_level_0", "tie_level_1", "tie_level_2", "hook_0", "hook_1", "summary"):
+                    if key in self._preview_items:
+                        canvas.itemconfigure(self._preview_items[key], state="hidden")
+                for key in ("x_bars", "y_bars"):
+                    self._preview_bars(key, 0)
+                for item, (px, py) in zip(corners, [(x1+20, y1+20), (x2-20, y1+20), (x2-20, y2-20), (x1+20, y2-20)]):
+                    canvas.coords(item, px-3, py-3, px+3, py+3)
+                    canvas.itemconfigure(item, fill='red', outline='darkred', width=1)
             
             # Add comprehensive dimensions and labels
-            title_text = f"Column Section: {width:.0f} × {height:.0f} mm"
-            self.preview_canvas.create_text(cx, 20, text=title_text, 
-                                          font=("Arial", 12, "bold"))
+            title = self._preview_item("title", "text", font=("Arial", 12, "bold"))
+            canvas.coords(title, cx, 20)
+            canvas.itemconfigure(title, text=f"Column Section: {width:.0f} × {height:.0f} mm")
             
             # Width dimension
-            self.preview_canvas.create_line(x1, y2+20, x2, y2+20, fill='black', width=2)
-            self.preview_canvas.create_line(x1, y2+15, x1, y2+25, fill='black', width=2)
-            self.preview_canvas.create_line(x2, y2+15, x2, y2+25, fill='black', width=2)
-            self.preview_canvas.create_text(cx, y2+35, text=f"B = {width:.0f} mm", 
-                                          font=("Arial", 10, "bold"))
+            canvas.coords(self._preview_item("dim_w", "line", fill='black', width=2), x1, y2+20, x2, y2+20)
+            canvas.coords(self._preview_item("dim_w_1", "line", fill='black', width=2), x1, y2+15, x1, y2+25)
+            canvas.coords(self._preview_item("dim_w_2", "line", fill='black', width=2), x2, y2+15, x2, y2+25)
+            width_label = self._preview_item("dim_w_text", "text", font=("Arial", 10, "bold"))
+            canvas.coords(width_label, cx, y2+35)
+            canvas.itemconfigure(width_label, text=f"B = {width:.0f} mm")
             
             # Height dimension
-            self.preview_canvas.create_line(x1-20, y1, x1-20, y2, fill='black', width=2)
-            self.preview_canvas.create_line(x1-25, y1, x1-15, y1, fill='black', width=2)
-            self.preview_canvas.create_line(x1-25, y2, x1-15, y2, fill='black', width=2)
-            self.preview_canvas.create_text(x1-40, cy, text=f"H = {height:.0f} mm", 
-                                          font=("Arial", 10, "bold"), angle=90)
+            canvas.coords(self._preview_item("dim_h", "line", fill='black', width=2), x1-20, y1, x1-20, y2)
+            canvas.coords(self._preview_item("dim_h_1", "line", fill='black', width=2), x1-25, y1, x1-15, y1)
+            canvas.coords(self._preview_item("dim_h_2", "line", fill='black', width=2), x1-25, y2, x1-15, y2)
+            height_label = self._preview_item("dim_h_text", "text", font=("Arial", 10, "bold"), angle=90)
+            canvas.coords(height_label, x1-40, cy)
+            canvas.itemconfigure(height_label, text=f"H = {height:.0f} mm")
             
             # Cover indication
-            try:
-                self.preview_canvas.create_line(x1, y1, x1+cover_scaled, y1+cover_scaled, 
-                                              fill='red', width=1, dash=(2, 2))
-                self.preview_canvas.create_text(x1+cover_scaled/2-10, y1+cover_scaled/2-10, 
-                                              text=f"{cover:.0f}mm", font=("Arial", 8), fill='red')
-            except:
-                pass
-            
-            # Reinforcement summary
-            try:
-                rebar_text = f"Reinforcement:\n"
-                rebar_text += f"X: {num_x}×{self.rebar_x_var.get()}\n"
-                rebar_text += f"Y: {num_y}×{self.rebar_y_var.get()}\n"
-                rebar_text += f"Ties: {self.tie_size_var.get()} @ {tie_spacing:.0f}mm"
-                
-                self.preview_canvas.create_text(cx, canvas_height-60, text=rebar_text, 
-                                              font=("Arial", 8), justify=tk.CENTER)
-            except:
-                pass
+            canvas.coords(self._preview_item("cover_line", "line", fill='red', width=1, dash=(2, 2)),
+                          x1, y1, x1+cover_scaled, y1+cover_scaled)
+            cover_label = self._preview_item("cover_text", "text", font=("Arial", 8), fill='red')
+            canvas.coords(cover_label, x1+cover_scaled/2-10, y1+cover_scaled/2-10)
+            canvas.itemconfigure(cover_label, text=f"{cover:.0f}mm")
+            
+            # Keep the original stacking: concrete, bars, then ties on top
+            stacking = corners + self._preview_bar_items.get("x_bars", []) + self._preview_bar_items.get("y_bars", [])
+            stacking += [self._preview_items[key] for key in ("tie", "tie_level_0", "tie_level_1", "tie_level_2")
+                         if key in self._preview_items]
+            for item in stacking:
+                canvas.tag_raise(item)
                 
-        except ValueError:
+        except (ValueError, ZeroDivisionError):
             # Show error state
-            self.preview_canvas.delete("all")
-            self.preview_canvas.create_text(200, 250, text="Invalid Input Values", 
-                                          font=("Arial", 14), fill='red')
-        except Exception as e:
+            self._show_preview_message("Invalid Input Values", ("Arial", 14), 'red')
+        except Exception:
             # Show basic preview on any error
-            self.preview_canvas.delete("all")
-            self.preview_canvas.create_text(200, 250, text="Preview Error", 
-                                          font=("Arial", 12), fill='orange')
+            self._show_preview_message("Preview Error", ("Arial", 12), 'orange')
     
     def update_rebar_preview(self, event=None):
         """Update reinforcement preview when rebar details change"""
         self.update_preview()
         
+    def is_busy(self, parent=None):
+        """True (after telling the user) while a background task uses the engine"""
+        if self.task is None:
+            return False
+        messagebox.showwarning("Busy", "Please wait for the current operation to finish or cancel it.",
+                               parent=parent or self.root)
+        return True
+    
+    def start_task(self, title, work, on_done, error_title=None):
+        """Run work(task) on a worker thread and on_done(result) back on the main thread
+        
+        Only one task runs at a time; the engine's caches are not shared
+        between threads. Returns False (after telling the user) when busy.
+        """
+        if self.is_busy():
+            return False
+        
+        def finish(message):
+            self.task = None
+            self.progress_bar.stop()
+            self.progress_bar.config(mode='determinate', value=0)
+            self.task_status_label.config(text=message)
+            self.cancel_btn.config(state=tk.DISABLED)
+            self.design_btn.config(state=tk.NORMAL)
+            self.optimize_btn.config(state=tk.NORMAL)
+            self.root.config(cursor="")
+        
+        def done(result):
+            finish("Ready")
+            on_done(result)
+        
+        def failed(error):
+            finish(f"{title} failed")
+            messagebox.showerror(error_title or f"{title} Error", f"Error in {title.lower()}: {str(error)}")
+        
+        self.design_btn.config(state=tk.DISABLED)
+        self.optimize_btn.config(state=tk.DISABLED)
+        self.cancel_btn.config(state=tk.NORMAL)
+        self.task_status_label.config(text=f"{title}...")
+        self.root.config(cursor="watch")
+        self.task = BackgroundTask(self.root, work, on_done=done, on_progress=self._show_task_progress,
+                                   on_error=failed, on_cancel=lambda: finish(f"{title} cancelled"),
+                                   name=title).start()
+        return True
+    
+    def _show_task_progress(self, fraction, message):
+        """Progress bar update from the running task (fraction None = unknown)"""
+        if fraction is None:
+            if str(self.progress_bar['mode']) != 'indeterminate':
+                self.progress_bar.config(mode='indeterminate')
+                self.progress_bar.start(15)
+        else:
+            if str(self.progress_bar['mode']) != 'determinate':
+                self.progress_bar.stop()
+                self.progress_bar.config(mode='determinate')
+            self.progress_bar.config(value=fraction * 100)
+        if message:
+            self.task_status_label.config(text=message)
+    
+    def cancel_task(self):
+        """Ask the running task to stop at its next step"""
+        if self.task is not None:
+            self.task.cancel()
+            self.cancel_btn.config(state=tk.DISABLED)
+            self.task_status_label.config(text="Cancelling...")
+    
     def run_complete_analysis(self):
-        """Run complete structural analysis"""
+        """Run complete structural analysis
+        
+        Calculations, the analysis text and the interaction curves are
+        computed on a worker thread; the widgets and the P-M figure are
+        updated on the main thread when it finishes.
+        """
         try:
-            # Collect all input data
             inputs = self.collect_input_data()
-            
-            # Perform calculations
+        except ValueError:
+            messagebox.showerror("Input Error", "Please check all input values.")
+            return
+        
+        profiler.count('analysis.runs')
+        start = time.perf_counter()
+        
+        def work(task):
+            task.progress(0.05, "Calculating section...")
             results = self.perform_calculations(inputs)
-            
-            # Store results
+            task.progress(0.35, "Checking interaction...")
+            analysis = self.format_analysis_results(results)
+            if HAS_MATPLOTLIB:
+                # Fills the curve cache, so the diagram update below is cheap
+                task.progress(0.65, "Building interaction curves...")
+                for direction in ('x', 'y'):
+                    self.calculate_pm_interaction(results, direction)
+            task.progress(0.95, "Updating displays...")
+            return results, analysis
+        
+        def done(output):
+            results, analysis = output
             self.last_results = results
-            
-            # Update all displays
-            self.display_analysis_results(results)
+            self.display_analysis_results(results, analysis)
             self.generate_pm_diagram()
+            if profiler.enabled:
+                profiler.record('analysis.total', time.perf_counter() - start)
             
             # Show completion message
-            status = "✅ SAFE" if results['utilization'] <= 100 else "⚠️ OVER-UTILIZED"
+            if results['unstable']:
+                status = "⚠️ UNSTABLE (Pu ≥ 0.75Pc)"
+            else:
+                status = "✅ SAFE" if results['governing_utilization'] <= 100 else "⚠️ OVER-UTILIZED"
             messagebox.showinfo("Analysis Complete", 
                                f"Complete analysis finished!\n"
                                f"Status: {status}\n"
-                               f"Utilization: {results['utilization']:.1f}%")
-                               
+                               f"Utilization: {results['governing_utilization']:.1f}%")
+        
+        self.start_task("Analysis", work, done)
+    
+    def optimize_design(self):
+        """Search for the lightest section and reinforcement that pass all checks"""
+        try:
+            from column_optimizer import ColumnOptimizer
+        except ImportError:
+            messagebox.showerror("Missing Library", "NumPy is required for the optimizer. Please install numpy.")
+            return
+        
+        try:
+            inputs = self.collect_input_data()
         except ValueError:
             messagebox.showerror("Input Error", "Please check all input values.")
-        except Exception as e:
-            messagebox.showerror("Analysis Error", f"Error in analysis: {str(e)}")
+            return
+        
+        def work(task):
+            with profiler.stage('optimizer.run'):
+                return ColumnOptimizer(engine=self.engine).optimize(
+                    inputs, progress=lambda fraction: task.progress(fraction, "Searching sections..."))
+        
+        self.start_task("Optimization", work, self._apply_optimization)
     
+    def _apply_optimization(self, optimization):
+        """Apply the optimizer's best design to the inputs and summarize it"""
+        best = optimization['inputs']
+        if best is None:
+            messagebox.showwarning("No Design Found", 
+                                  "No section in the search range passes all checks.\n"
+                                  "Check the loads, materials and tie spacing.")
+            return
+        
+        # Apply the optimized design to the inputs
+        self.width_var.set(f"{best['width']:.0f}")
+        self.height_var.set(f"{best['height']:.0f}")
+        self.rebar_x_var.set(best['rebar_x'])
+        self.rebar_y_var.set(best['rebar_y'])
+        self.corner_rebar_var.set(best['corner_rebar'])
+        self.num_bars_x_var.set(str(best['num_bars_x']))
+        self.num_bars_y_var.set(str(best['num_bars_y']))
+        self.update_preview()
+        
+        results = optimization['results']
+        messagebox.showinfo("Optimization Complete", 
+                           f"Lightest passing design:\n"
+                           f"Section: {best['width']:.0f} × {best['height']:.0f} mm\n"
+                           f"X: {best['num_bars_x']} × {best['rebar_x']}, "
+                           f"Y: {best['num_bars_y']} × {best['rebar_y']}, "
+                           f"Corners: 4 × {best['corner_rebar']}\n"
+                           f"Steel Ratio: {results['steel_ratio']:.2f}%\n"
+                           f"Utilization: {results['governing_utilization']:.1f}%\n"
+                           f"Mass: {optimization['mass_per_m']:.0f} kg/m\n"
+                           f"({optimization['evaluations']} candidates checked in "
+                           f"{optimization['elapsed']*1000:.0f} ms)")
+    
+    @profiler.timed('analysis.collect_inputs')
     def collect_input_data(self):
         """Collect all input data from the interface"""
         return {
@@ -636,107 +1291,47 @@ class ProfessionalColumnDesign:
             'dev_length_factor': float(self.dev_length_factor_var.get())
         }
     
+    @profiler.timed('analysis.calculations')
     def perform_calculations(self, inputs):
-        """Perform complete structural calculations"""
-        
-        # Basic section properties
-        Ag = inputs['width'] * inputs['height']  # mm²
-        
-        # Reinforcement calculations
-        As_x = inputs['num_bars_x'] * self.get_rebar_area(inputs['rebar_x'])
-        As_y = inputs['num_bars_y'] * self.get_rebar_area(inputs['rebar_y'])
-        As_total = As_x + As_y
-        
-        # Corner reinforcement (4 corner bars with selected size)
-        As_corner = 4 * self.get_rebar_area(inputs['corner_rebar'])
-        
-        # Total reinforcement
-        As_provided = As_total + As_corner
-        steel_ratio = As_provided / Ag * 100
-        
-        # Load calculations
-        P_N = inputs['P'] * 1000  # kN to N
-        Mx_Nm = inputs['Mx'] * 1000  # kN⋅m to N⋅m
-        My_Nm = inputs['My'] * 1000  # kN⋅m to N⋅m
-        
-        # Eccentricities
-        ex = Mx_Nm / P_N * 1000 if P_N > 0 else 0  # mm
-        ey = My_Nm / P_N * 1000 if P_N > 0 else 0  # mm
-        
-        # Slenderness
-        rx = inputs['height'] / math.sqrt(12)
-        ry = inputs['width'] / math.sqrt(12)
-        slenderness_x = (inputs['length'] * 1000) / rx
-        slenderness_y = (inputs['length'] * 1000) / ry
-        
-        # Capacity calculations (simplified)
-        fc = inputs['fc']
-        fy = inputs['fy']
-        
-        # Concrete contribution
-        Pn_concrete = 0.85 * fc * (Ag - As_provided)
-        
-        # Steel contribution
-        Pn_steel = fy * As_provided
-        
-        # Total nominal capacity
-        Pn_total = Pn_concrete + Pn_steel
-        
-        # Reduced capacity (φ factor)
-        phi = 0.65  # For tied columns
-        Pu_capacity = phi * Pn_total / 1000  # kN
-        
-        # Utilization
-        utilization = (inputs['P'] / Pu_capacity) * 100 if Pu_capacity > 0 else 999
-        
-        # Tie spacing checks
-        max_spacing = min(16 * self.get_rebar_diameter(inputs['rebar_x']), 
-                         48 * self.get_rebar_diameter(inputs['tie_size']),
-                         min(inputs['width'], inputs['height']))
-        
-        tie_spacing_ok = inputs['tie_spacing'] <= max_spacing
-        
-        # Development length calculation
-        db = self.get_rebar_diameter(inputs['rebar_x'])
-        ld_basic = 0.6 * fy * db / math.sqrt(fc)  # Basic development length
-        ld_required = ld_basic * inputs['dev_length_factor']
-        
-        return {
-            # Input echo
-            **inputs,
-            
-            # Calculated properties
-            'Ag': Ag,
-            'As_x': As_x,
-            'As_y': As_y,
-            'As_corner': As_corner,
-            'As_total': As_total,
-            'As_provided': As_provided,
-            'steel_ratio': steel_ratio,
-            
-            # Loading
-            'ex': ex,
-            'ey': ey,
-            'slenderness_x': slenderness_x,
-            'slenderness_y': slenderness_y,
-            
-            # Capacity
-            'Pn_concrete': Pn_concrete,
-            'Pn_steel': Pn_steel,
-            'Pn_total': Pn_total,
-            'Pu_capacity': Pu_capacity,
-            'utilization': utilization,
-            
-            # Detailing checks
-            'max_spacing': max_spacing,
-            'tie_spacing_ok': tie_spacing_ok,
-            'ld_required': ld_required
-        }
+        """Perform complete structural calculations, including the exact P-Mx and P-My checks
+        
+        The P-M checks use the non-sway magnified design moments Mcx and Mcy
+        (k = 1, Cm = 1; first-order moments without NumPy); an unstable
+        column (Pu ≥ 0.75 Pc) fails with infinite utilization.
+        utilization_x and utilization_y are the capacity ratios (%) along the
+        load ray; governing_utilization, the larger of those and the axial
+        utilization, decides the design status everywhere in the GUI.
+        """
+        results = self.engine.perform_calculations(inputs)
+        results['Mcx'], results['Mcy'], results['unstable'] = results['Mx'], results['My'], False
+        if HAS_NUMPY:
+            from column_slenderness import magnify_storey
+            magnified = magnify_storey(results, [results['P']], [results['Mx']], [results['My']])
+            for key in ('delta_x', 'delta_y', 'Pc_x', 'Pc_y'):
+                results[key] = float(magnified[key][0])
+            results['Mcx'], results['Mcy'] = float(magnified['Mx'][0]), float(magnified['My'][0])
+            results['unstable'] = bool(magnified['unstable'][0])
+        
+        if results['unstable']:
+            ratio_x = ratio_y = math.inf
+        else:
+            ratio_x = self.engine.capacity_ratio(results, 'x', results['P'], results['Mcx'])[0]
+            ratio_y = self.engine.capacity_ratio(results, 'y', results['P'], results['Mcy'])[0]
+        results['utilization_x'] = ratio_x * 100
+        results['utilization_y'] = ratio_y * 100
+        results['governing_utilization'] = max(results['utilization'], ratio_x * 100, ratio_y * 100)
+        return results
     
-    def display_analysis_results(self, results):
-        """Display detailed analysis results"""
+    @profiler.timed('analysis.display_results')
+    def display_analysis_results(self, results, analysis=None):
+        """Display detailed analysis results (formatted here unless already given)"""
+        if analysis is None:
+            analysis = self.format_analysis_results(results)
         self.analysis_text.delete(1.0, tk.END)
-        
+        self.analysis_text.insert(tk.END, analysis)
+    
+    def format_analysis_results(self, results):
+        """Analysis summary text (no widget access, safe on a worker thread)"""
         analysis = f"""
 COMPREHENSIVE STRUCTURAL ANALYSIS
 {'='*60}
@@ -771,25 +1366,84 @@ LOADING ANALYSIS:
 SLENDERNESS CHECK:
 • λx = {results['slenderness_x']:.1f}, λy = {results['slenderness_y']:.1f}
 • Status: {'Short Column' if max(results['slenderness_x'], results['slenderness_y']) <= 22 else 'Slender Column'}
-
+{self._magnification_summary(results)}
 CAPACITY ANALYSIS:
 • Concrete Contribution: {results['Pn_concrete']/1000:,.0f} kN
 • Steel Contribution: {results['Pn_steel']/1000:,.0f} kN
 • Nominal Capacity: {results['Pn_total']/1000:,.0f} kN
 • Design Capacity (φPn): {results['Pu_capacity']:,.0f} kN
-• Utilization Ratio: {results['utilization']:.1f}%
+• Axial Utilization: {results['utilization']:.1f}%
+• Interaction Ratio (φPn-φMn, along load ray, Mcx / Mcy): P-Mx {results['utilization_x']:.1f}%, P-My {results['utilization_y']:.1f}%
+• Governing Utilization: {results['governing_utilization']:.1f}%
 
 DEVELOPMENT LENGTH:
 • Required Ld: {results['ld_required']:.0f} mm
 • Available Length: {results['length']*1000-2*results['end_length']:.0f} mm
 
-DESIGN STATUS: {'✅ SAFE' if results['utilization'] <= 100 else '⚠️ OVER-UTILIZED'}
+DESIGN STATUS: {'✅ SAFE' if results['governing_utilization'] <= 100 else '⚠️ OVER-UTILIZED'}
 """
+        return analysis
+    
+    def _magnification_summary(self, results):
+        """Non-sway moment magnification lines for the analysis text (k = 1, Cm = 1)"""
+        if 'Pc_x' not in results:
+            return "• Moment magnification: requires NumPy"
+        if results['unstable']:
+            return (f"• Magnifiers (non-sway): ⚠️ Pu ≥ 0.75Pc, column unstable "
+                    f"(Pc = {results['Pc_x']:,.0f} / {results['Pc_y']:,.0f} kN) - FAILS")
+        return (f"• Magnifiers (non-sway): δx = {results['delta_x']:.2f}, δy = {results['delta_y']:.2f} "
+                f"(Pc = {results['Pc_x']:,.0f} / {results['Pc_y']:,.0f} kN)\n"
+                f"• Design Moments: Mcx = {results['Mcx']:.1f} kN⋅m, Mcy = {results['Mcy']:.1f} kN⋅m")
+    
+    def _design_moments_text(self, results):
+        """Magnified design moments for the reports, or the instability they failed on"""
+        if results['unstable']:
+            return "column unstable (Pu ≥ 0.75Pc) - FAILS"
+        return f"Mcx = {results['Mcx']:.1f} kN⋅m, Mcy = {results['Mcy']:.1f} kN⋅m (non-sway, k = 1, Cm = 1)"
+    
+    def _create_pm_figure(self):
+        """Build the persistent P-M figure, its artists and the Tk canvas (once per session)"""
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+        
+        # Create figure
+        fig = Figure(figsize=(12, 8), dpi=100)
+        
+        # Create subplots
+        ax1 = fig.add_subplot(121)  # P-Mx diagram
+        ax2 = fig.add_subplot(122)  # P-My diagram
+        
+        lines = {}
+        for ax, direction, style in ((ax1, 'x', 'b-'), (ax2, 'y', 'g-')):
+            lines[f'curve_{direction}'], = ax.plot([], [], style, linewidth=2, label='Design Curve (φPn-φMn)')
+            lines[f'load_{direction}'], = ax.plot([], [], 'ro', markersize=8, label='Applied Load')
+            ax.axhline(y=0, color='k', linestyle='-', alpha=0.3)
+            ax.axvline(x=0, color='k', linestyle='-', alpha=0.3)
+            ax.grid(True, alpha=0.3)
+            ax.set_xlabel(f'Moment M{direction} (kN⋅m)')
+            ax.set_ylabel('Axial Load P (kN)')
+            ax.set_title(f'P-M{direction} Interaction Diagram')
+            ax.legend()
         
-        self.analysis_text.insert(tk.END, analysis)
+        title = fig.suptitle('', fontsize=14, fontweight='bold')
+        
+        # Embed in tkinter
+        canvas = FigureCanvasTkAgg(fig, self.figure_frame)
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        self.pm_plot = {'figure': fig, 'canvas': canvas, 'axes': (ax1, ax2),
+                        'lines': lines, 'title': title}
+        
+        # Store for export
+        self.interaction_figure = fig
     
+    @profiler.timed('analysis.pm_diagram')
     def generate_pm_diagram(self):
-        """Generate P-M interaction diagram"""
+        """Generate P-M interaction diagram
+        
+        The figure and canvas are created once; later runs only replace the
+        line data and title and request an idle redraw.
+        """
         if self.last_results is None:
             messagebox.showwarning("No Data", "Please run analysis first.")
             return
@@ -797,422 +1451,94 @@ DESIGN STATUS: {'✅ SAFE' if results['utilization'] <= 100 else '⚠️ OVER-UT
         if not HAS_MATPLOTLIB:
             messagebox.showerror("Missing Library", "Matplotlib is required for P-M diagrams. Please install matplotlib.")
             return
+        
+        if self.is_busy():
+            return
             
         try:
-            # Clear previous diagram
-            for widget in self.figure_frame.winfo_children():
-                widget.destroy()
-            
-            # Create figure
-            fig = Figure(figsize=(12, 8), dpi=100)
-            
-            # Create subplots
-            ax1 = fig.add_subplot(121)  # P-Mx diagram
-            ax2 = fig.add_subplot(122)  # P-My diagram
+            if self.pm_plot is None:
+                self._create_pm_figure()
             
             results = self.last_results
+            lines = self.pm_plot['lines']
             
             # Generate interaction curves
             Mx_points, P_points_x = self.calculate_pm_interaction(results, 'x')
             My_points, P_points_y = self.calculate_pm_interaction(results, 'y')
             
-            # Plot P-Mx diagram
-            ax1.plot(Mx_points, P_points_x, 'b-', linewidth=2, label='Interaction Curve')
-            ax1.plot(results['Mx'], results['P'], 'ro', markersize=8, label='Applied Load')
-            ax1.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-            ax1.axvline(x=0, color='k', linestyle='-', alpha=0.3)
-            ax1.grid(True, alpha=0.3)
-            ax1.set_xlabel('Moment Mx (kN⋅m)')
-            ax1.set_ylabel('Axial Load P (kN)')
-            ax1.set_title('P-Mx Interaction Diagram')
-            ax1.legend()
+            # Update curves and applied-load markers in place
+            lines['curve_x'].set_data(Mx_points, P_points_x)
+            lines['load_x'].set_data([results['Mcx']], [results['P']])
+            lines['curve_y'].set_data(My_points, P_points_y)
+            lines['load_y'].set_data([results['Mcy']], [results['P']])
             
-            # Plot P-My diagram
-            ax2.plot(My_points, P_points_y, 'g-', linewidth=2, label='Interaction Curve')
-            ax2.plot(results['My'], results['P'], 'ro', markersize=8, label='Applied Load')
-            ax2.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-            ax2.axvline(x=0, color='k', linestyle='-', alpha=0.3)
-            ax2.grid(True, alpha=0.3)
-            ax2.set_xlabel('Moment My (kN⋅m)')
-            ax2.set_ylabel('Axial Load P (kN)')
-            ax2.set_title('P-My Interaction Diagram')
-            ax2.legend()
+            for ax in self.pm_plot['axes']:
+                ax.relim()
+                ax.autoscale_view()
             
             # Add safety check annotations
-            if results['utilization'] <= 100:
-                safety_text = f"✓ SAFE\nUtilization: {results['utilization']:.1f}%"
+            if results['governing_utilization'] <= 100:
+                safety_text = f"✓ SAFE\nUtilization: {results['governing_utilization']:.1f}%"
                 color = 'green'
             else:
-                safety_text = f"✗ UNSAFE\nUtilization: {results['utilization']:.1f}%"
+                safety_text = f"✗ UNSAFE\nUtilization: {results['governing_utilization']:.1f}%"
                 color = 'red'
             
-            fig.suptitle(f'Column Interaction Diagrams - {safety_text}', 
-                        fontsize=14, fontweight='bold', color=color)
-            
-            # Embed in tkinter
-            canvas = FigureCanvasTkAgg(fig, self.figure_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            self.pm_plot['title'].set_text(f'Column Interaction Diagrams - {safety_text}')
+            self.pm_plot['title'].set_color(color)
             
-            # Store for export
-            self.interaction_figure = fig
+            self.pm_plot['canvas'].draw_idle()
             
         except Exception as e:
             messagebox.showerror("Diagram Error", f"Could not generate diagram: {str(e)}")
     
+    @profiler.timed('pm_curves')
     def calculate_pm_interaction(self, results, direction):
         """Calculate P-M interaction points for given direction using proper analysis"""
-        
-        fc = results['fc']
-        fy = results['fy']
-        
-        if direction == 'x':
-            h = results['height']
-            b = results['width']
-            As_tension = results['As_x'] + results['As_corner']/2
-            As_compression = results['As_x'] + results['As_corner']/2
-        else:
-            h = results['width']  
-            b = results['height']
-            As_tension = results['As_y'] + results['As_corner']/2
-            As_compression = results['As_y'] + results['As_corner']/2
-        
-        cover = results['cover']
-        d = h - cover  # Effective depth to tension steel
-        d_prime = cover  # Depth to compression steel
-        
-        # Material properties
-        beta1 = 0.85 if fc <= 28 else max(0.85 - 0.05*(fc-28)/7, 0.65)
-        epsilon_cu = 0.003  # Ultimate concrete strain
-        Es = 200000  # Steel modulus (MPa)
-        
-        # Generate points for interaction curve
-        M_points = []
-        P_points = []
-        
-        # Point 1: Pure compression (no moment)
-        Pn_max = 0.85 * fc * (results['Ag'] - results['As_provided']) + fy * results['As_provided']
-        P_points.append(min(0.8 * Pn_max / 1000, 0.85 * Pn_max / 1000))  # Tied column limit
-        M_points.append(0)
-        
-        # Calculate balanced point
-        cb_balanced = (0.003 * d) / (0.003 + fy / Es)  # Balanced neutral axis depth
-        
-        # Generate interaction points by varying neutral axis depth
-        c_values = []
-        
-        # Points for compression-controlled region (c > cb_balanced)
-        for i in range(5):
-            c_ratio = 0.2 + (i * 0.15)  # From 0.2h to 0.8h
-            c_values.append(c_ratio * h)
-        
-        # Add balanced point
-        c_values.append(cb_balanced)
-        
-        # Points for tension-controlled region (c < cb_balanced)  
-        for i in range(5):
-            c_ratio = 0.05 + (i * cb_balanced/h * 0.15)  # Smaller values
-            c_values.append(c_ratio * h)
-        
-        # Pure moment point (c approaching 0)
-        c_values.append(0.01 * h)
-        
-        # Sort c values in descending order for smooth curve
-        c_values.sort(reverse=True)
-        
-        for c in c_values:
-            if c <= 0.01 * h:  # Pure moment case
-                # Simplified pure moment capacity
-                a = 0.01 * h
-                Mn = As_tension * fy * (d - a/2) / 1000000  # Convert to kN⋅m
-                Pn = 0
-            else:
-                # Calculate strains
-                epsilon_s = epsilon_cu * (d - c) / c  # Tension steel strain
-                epsilon_s_prime = epsilon_cu * (c - d_prime) / c  # Compression steel strain
-                
-                # Calculate stresses
-                if abs(epsilon_s) >= fy / Es:
-                    fs = fy if epsilon_s > 0 else -fy
-                else:
-                    fs = Es * epsilon_s
-                
-                if abs(epsilon_s_prime) >= fy / Es:
-                    fs_prime = fy if epsilon_s_prime > 0 else -fy
-                else:
-                    fs_prime = Es * epsilon_s_prime
-                
-                # Concrete stress block
-                a = beta1 * c
-                Cc = 0.85 * fc * a * b  # Concrete compression force
-                
-                # Steel forces
-                Ts = As_tension * fs  # Tension steel force
-                Cs = As_compression * fs_prime  # Compression steel force
-                
-                # Equilibrium
-                Pn = (Cc + Cs - Ts) / 1000  # Convert to kN
-                
-                # Moment about centroid
-                Mn = (Cc * (h/2 - a/2) + Cs * (h/2 - d_prime) + Ts * (d - h/2)) / 1000000  # kN⋅m
-                
-                # Apply limits
-                Pn = max(0, min(Pn, P_points[0]))  # Cannot exceed max compression
-            
-            P_points.append(max(0, Pn))
-            M_points.append(abs(Mn))
-        
-        # Add pure tension point (negative moment region)
-        P_points.append(0)
-        M_points.append(0)
-        
-        # Remove duplicates and sort for smooth curve
-        points = list(zip(M_points, P_points))
-        points = list(set(points))  # Remove duplicates
-        points.sort(key=lambda x: (x[1], x[0]))  # Sort by P, then M
-        
-        # Separate back into lists
-        M_sorted = [p[0] for p in points]
-        P_sorted = [p[1] for p in points]
-        
-        # Ensure curve is physically reasonable
-        M_final = []
-        P_final = []
-        
-        for i, (m, p) in enumerate(zip(M_sorted, P_sorted)):
-            if i == 0 or (m >= 0 and p >= 0):  # Only positive values
-                M_final.append(m)
-                P_final.append(p)
-        
-        return M_final, P_final
+        return self.engine.calculate_pm_interaction(results, direction)
+    
+    def _pm_accuracy_text(self, results):
+        """Error bound of the adaptive P-Mx / P-My curves for the reports"""
+        errors = [self.engine.pm_interaction_error(results, direction) for direction in ('x', 'y')]
+        return (f"within {max(e['error_P'] for e in errors):.1f} kN and "
+                f"{max(e['error_M'] for e in errors):.2f} kN⋅m "
+                f"({errors[0]['points']} + {errors[1]['points']} points)")
     
+    @profiler.timed('report.diagrams')
     def generate_report_diagrams(self):
-        """Generate section preview and P-M diagrams for inclusion in report"""
-        if not HAS_MATPLOTLIB:
-            return  # Skip diagram generation if matplotlib not available
-            
-        results = self.last_results
+        """Build (or reuse) the vector section and P-M drawings shared by the report and PDF"""
+        self.section_preview_drawing = None
+        self.pm_diagrams_drawing = None
+        if not HAS_REPORTLAB or self.last_results is None:
+            return  # Skip diagram generation if reportlab not available
         
-        try:
-            import os
-            import tempfile
-            
-            # Create temporary directory for images
-            self.temp_dir = tempfile.mkdtemp()
-            
-            # Generate section preview diagram
-            self.generate_section_preview_image()
-            
-            # Generate P-M interaction diagrams
-            self.generate_pm_diagrams_image()
-            
-        except Exception as e:
-            print(f"Warning: Could not generate report diagrams: {e}")
+        # Generate section preview diagram
+        self.generate_section_preview_image()
+        
+        # Generate P-M interaction diagrams
+        self.generate_pm_diagrams_image()
+    
+    def _get_report_images(self):
+        """In-memory report image cache, created on first use"""
+        if self.report_images is None:
+            from column_report import ReportImageCache
+            self.report_images = ReportImageCache(engine=self.engine)
+        return self.report_images
     
     def generate_section_preview_image(self):
-        """Generate detailed section preview image for report"""
-        if not HAS_MATPLOTLIB:
-            return
-            
+        """Generate detailed section drawing for report (vector ReportLab drawing)"""
         try:
-            import matplotlib.pyplot as plt
-            import matplotlib.patches as patches
-            from matplotlib.lines import Line2D
-            import os
-            
-            results = self.last_results
-            if results is None:
-                return
-            
-            # Create figure
-            fig, ax = plt.subplots(1, 1, figsize=(8, 6))
-            
-            # Column dimensions
-            width = results['width']
-            height = results['height']
-            cover = results['cover']
-            
-            # Draw column outline
-            column_rect = patches.Rectangle((0, 0), width, height, 
-                                          linewidth=2, edgecolor='black', 
-                                          facecolor='lightgray', alpha=0.3)
-            ax.add_patch(column_rect)
-            
-            # Draw reinforcement
-            # Get rebar diameter
-            rebar_x_dia = self.get_rebar_diameter(results['rebar_x'])
-            rebar_y_dia = self.get_rebar_diameter(results['rebar_y'])
-            corner_dia = self.get_rebar_diameter(results['corner_rebar'])
-            
-            # Corner bars
-            corner_positions = [
-                (cover, cover),  # Bottom-left
-                (width - cover, cover),  # Bottom-right
-                (width - cover, height - cover),  # Top-right
-                (cover, height - cover)  # Top-left
-            ]
-            
-            for pos in corner_positions:
-                circle = patches.Circle(pos, corner_dia/2, 
-                                      facecolor='red', edgecolor='darkred')
-                ax.add_patch(circle)
-            
-            # X-direction bars (excluding corners)
-            if results['num_bars_x'] > 2:  # Additional bars between corners
-                x_spacing = (width - 2*cover) / (results['num_bars_x'] - 1)
-                for i in range(1, results['num_bars_x'] - 1):
-                    x_pos = cover + i * x_spacing
-                    # Bottom bars
-                    circle = patches.Circle((x_pos, cover), rebar_x_dia/2,
-                                          facecolor='blue', edgecolor='darkblue')
-                    ax.add_patch(circle)
-                    # Top bars
-                    circle = patches.Circle((x_pos, height - cover), rebar_x_dia/2,
-                                          facecolor='blue', edgecolor='darkblue')
-                    ax.add_patch(circle)
-            
-            # Y-direction bars (excluding corners)
-            if results['num_bars_y'] > 2:  # Additional bars between corners
-                y_spacing = (height - 2*cover) / (results['num_bars_y'] - 1)
-                for i in range(1, results['num_bars_y'] - 1):
-                    y_pos = cover + i * y_spacing
-                    # Left bars
-                    circle = patches.Circle((cover, y_pos), rebar_y_dia/2,
-                                          facecolor='green', edgecolor='darkgreen')
-                    ax.add_patch(circle)
-                    # Right bars
-                    circle = patches.Circle((width - cover, y_pos), rebar_y_dia/2,
-                                          facecolor='green', edgecolor='darkgreen')
-                    ax.add_patch(circle)
-            
-            # Draw ties
-            tie_dia = self.get_rebar_diameter(results['tie_size'])
-            tie_rect = patches.Rectangle((cover - tie_dia/2, cover - tie_dia/2), 
-                                       width - 2*cover + tie_dia, 
-                                       height - 2*cover + tie_dia,
-                                       linewidth=2, edgecolor='orange', 
-                                       facecolor='none', linestyle='--')
-            ax.add_patch(tie_rect)
-            
-            # Add dimensions
-            # Width dimension
-            ax.annotate('', xy=(0, -20), xytext=(width, -20),
-                       arrowprops=dict(arrowstyle='<->', color='black'))
-            ax.text(width/2, -35, f'{width:.0f} mm', ha='center', va='top', fontsize=10)
-            
-            # Height dimension
-            ax.annotate('', xy=(-20, 0), xytext=(-20, height),
-                       arrowprops=dict(arrowstyle='<->', color='black'))
-            ax.text(-35, height/2, f'{height:.0f} mm', ha='center', va='bottom', 
-                   rotation=90, fontsize=10)
-            
-            # Cover dimensions
-            ax.annotate('', xy=(0, height + 10), xytext=(cover, height + 10),
-                       arrowprops=dict(arrowstyle='<->', color='red'))
-            ax.text(cover/2, height + 25, f'{cover:.0f} mm', ha='center', va='bottom', 
-                   fontsize=8, color='red')
-            
-            # Add reinforcement legend
-            legend_elements = [
-                Line2D([0], [0], marker='o', color='w', markerfacecolor='red', 
-                          markersize=8, label=f'Corner: 4-{results["corner_rebar"]}'),
-                Line2D([0], [0], marker='o', color='w', markerfacecolor='blue', 
-                          markersize=8, label=f'X-dir: {results["num_bars_x"]}-{results["rebar_x"]}'),
-                Line2D([0], [0], marker='o', color='w', markerfacecolor='green', 
-                          markersize=8, label=f'Y-dir: {results["num_bars_y"]}-{results["rebar_y"]}'),
-                Line2D([0], [0], color='orange', linestyle='--', linewidth=2,
-                          label=f'Ties: {results["tie_size"]}@{results["tie_spacing"]:.0f}mm')
-            ]
-            ax.legend(handles=legend_elements, loc='upper left', bbox_to_anchor=(1.05, 1))
-            
-            # Set equal aspect ratio and limits
-            ax.set_xlim(-60, width + 60)
-            ax.set_ylim(-60, height + 60)
-            ax.set_aspect('equal')
-            ax.grid(True, alpha=0.3)
-            ax.set_xlabel('Width (mm)')
-            ax.set_ylabel('Height (mm)')
-            ax.set_title('Reinforcement Details\nColumn Cross-Section', fontsize=12, fontweight='bold')
-            
-            plt.tight_layout()
-            
-            # Save the image
-            self.section_preview_path = os.path.join(self.temp_dir, 'section_preview.png')
-            plt.savefig(self.section_preview_path, dpi=150, bbox_inches='tight')
-            plt.close()
-            
+            self.section_preview_drawing = self._get_report_images().section_drawing(self.last_results)
         except Exception as e:
+            self.section_preview_drawing = None
             print(f"Error generating section preview: {e}")
     
     def generate_pm_diagrams_image(self):
-        """Generate P-M interaction diagrams image for report"""
-        if not HAS_MATPLOTLIB:
-            return
-            
+        """Generate P-M interaction diagrams for report (vector ReportLab drawing)"""
         try:
-            import matplotlib.pyplot as plt
-            import os
-            
-            results = self.last_results
-            if results is None:
-                return
-            
-            # Create figure with two subplots
-            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 6))
-            
-            # Generate interaction curves
-            Mx_points, P_points_x = self.calculate_pm_interaction(results, 'x')
-            My_points, P_points_y = self.calculate_pm_interaction(results, 'y')
-            
-            # Plot P-Mx diagram
-            ax1.plot(Mx_points, P_points_x, 'b-', linewidth=2, label='Interaction Curve')
-            ax1.plot(results['Mx'], results['P'], 'ro', markersize=10, label='Applied Load')
-            ax1.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-            ax1.axvline(x=0, color='k', linestyle='-', alpha=0.3)
-            ax1.grid(True, alpha=0.3)
-            ax1.set_xlabel('Moment Mx (kN⋅m)', fontsize=10)
-            ax1.set_ylabel('Axial Load P (kN)', fontsize=10)
-            ax1.set_title(f'P-Mx Interaction Diagram\nUtilization: {results["utilization"]:.1f}%', 
-                         fontsize=11, fontweight='bold')
-            ax1.legend()
-            
-            # Add safety annotation
-            if results['utilization'] <= 100:
-                safety_text = "SAFE"
-                color = 'green'
-            else:
-                safety_text = "UNSAFE"
-                color = 'red'
-            
-            ax1.text(0.02, 0.98, f'Status: {safety_text}', transform=ax1.transAxes,
-                    bbox=dict(boxstyle='round', facecolor=color, alpha=0.3),
-                    verticalalignment='top', fontweight='bold')
-            
-            # Plot P-My diagram
-            ax2.plot(My_points, P_points_y, 'g-', linewidth=2, label='Interaction Curve')
-            ax2.plot(results['My'], results['P'], 'ro', markersize=10, label='Applied Load')
-            ax2.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-            ax2.axvline(x=0, color='k', linestyle='-', alpha=0.3)
-            ax2.grid(True, alpha=0.3)
-            ax2.set_xlabel('Moment My (kN⋅m)', fontsize=10)
-            ax2.set_ylabel('Axial Load P (kN)', fontsize=10)
-            ax2.set_title(f'P-My Interaction Diagram\nUtilization: {results["utilization"]:.1f}%', 
-                         fontsize=11, fontweight='bold')
-            ax2.legend()
-            
-            # Add safety annotation
-            ax2.text(0.02, 0.98, f'Status: {safety_text}', transform=ax2.transAxes,
-                    bbox=dict(boxstyle='round', facecolor=color, alpha=0.3),
-                    verticalalignment='top', fontweight='bold')
-            
-            plt.tight_layout()
-            
-            # Save the image
-            self.pm_diagrams_path = os.path.join(self.temp_dir, 'pm_diagrams.png')
-            plt.savefig(self.pm_diagrams_path, dpi=150, bbox_inches='tight')
-            plt.close()
-            
+            self.pm_diagrams_drawing = self._get_report_images().pm_drawing(self.last_results)
         except Exception as e:
+            self.pm_diagrams_drawing = None
             print(f"Error generating P-M diagrams: {e}")
     
     def save_pm_diagram(self):
@@ -1230,9 +1556,20 @@ DESIGN STATUS: {'✅ SAFE' if results['utilization'] <= 100 else '⚠️ OVER-UT
             messagebox.showwarning("No Data", "Please run analysis first.")
             return
         
-        self.results_text.delete(1.0, tk.END)
+        def work(task):
+            task.progress(None, "Writing report...")
+            return self.format_full_report()
         
-        # First generate the diagrams and save them as temporary images
+        def done(report):
+            self.results_text.delete(1.0, tk.END)
+            self.results_text.insert(tk.END, report)
+        
+        self.start_task("Report", work, done)
+    
+    @profiler.timed('report.text')
+    def format_full_report(self):
+        """Full report text for the last results (no widget access, safe on a worker thread)"""
+        # First render the diagrams (cached in memory, shared with the PDF export)
         self.generate_report_diagrams()
         
         results = self.last_results
@@ -1325,7 +1662,7 @@ PROJECT INFORMATION:
 2.2 TRANSVERSE REINFORCEMENT (TIES) - SPACING CALCULATIONS:
     
     Tie Specifications:
-    • Size: {results['tie_size']} (Diameter = {self.get_rebar_diameter(results['tie_size']):.0f} mm)
+    • Size: {results['tie_size']} (Diameter = {self.get_rebar_diameter(results['tie_size']):g} mm)
     • Configuration: {results['tie_legs']:.0f}-leg ties
     • Spacing in main region: {results['tie_spacing']:.0f} mm
     • Spacing in end regions: {results['end_spacing']:.0f} mm
@@ -1333,8 +1670,8 @@ PROJECT INFORMATION:
     
     MAXIMUM SPACING CALCULATION (ACI 318M-25 Ch.10):
     The smallest of:
-    1) 16 × db,longitudinal = 16 × {self.get_rebar_diameter(results['rebar_x']):.0f} = {16 * self.get_rebar_diameter(results['rebar_x']):.0f} mm
-    2) 48 × db,tie = 48 × {self.get_rebar_diameter(results['tie_size']):.0f} = {48 * self.get_rebar_diameter(results['tie_size']):.0f} mm
+    1) 16 × db,longitudinal = 16 × {self.get_rebar_diameter(results['rebar_x']):g} = {16 * self.get_rebar_diameter(results['rebar_x']):.0f} mm
+    2) 48 × db,tie = 48 × {self.get_rebar_diameter(results['tie_size']):g} = {48 * self.get_rebar_diameter(results['tie_size']):.0f} mm
     3) Least dimension = min({results['width']:.0f}, {results['height']:.0f}) = {min(results['width'], results['height']):.0f} mm
     
     GOVERNING: Maximum spacing = {results['max_spacing']:.0f} mm
@@ -1346,12 +1683,12 @@ PROJECT INFORMATION:
     FORMULA: Ld = 0.6 × fy × db / √fc' × factor
     WHERE:
     • fy = {results['fy']:.0f} MPa (steel yield strength)
-    • db = {self.get_rebar_diameter(results['rebar_x']):.0f} mm (bar diameter)
+    • db = {self.get_rebar_diameter(results['rebar_x']):g} mm (bar diameter)
     • fc' = {results['fc']:.0f} MPa (concrete strength)
     • factor = {results['dev_length_factor']:.1f} (development factor)
     
     CALCULATION:
-    Ld = 0.6 × {results['fy']:.0f} × {self.get_rebar_diameter(results['rebar_x']):.0f} / √{results['fc']:.0f} × {results['dev_length_factor']:.1f}
+    Ld = 0.6 × {results['fy']:.0f} × {self.get_rebar_diameter(results['rebar_x']):g} / √{results['fc']:.0f} × {results['dev_length_factor']:.1f}
     Ld = {0.6 * results['fy'] * self.get_rebar_diameter(results['rebar_x']) / math.sqrt(results['fc']):.1f} × {results['dev_length_factor']:.1f} = {results['ld_required']:.0f} mm
     
     AVAILABLE LENGTH: {results['length']*1000-2*results['end_length']:.0f} mm
@@ -1439,15 +1776,21 @@ PROJECT INFORMATION:
     CALCULATION: Utilization = ({results['P']:,.0f} / {results['Pu_capacity']:,.0f}) × 100%
     CALCULATION: Utilization = {results['utilization']:.1f}%
     
-    DESIGN MARGIN: {100 - results['utilization']:.1f}%
-    STATUS: {'✅ ADEQUATE CAPACITY' if results['utilization'] <= 100 else '❌ INADEQUATE CAPACITY - INCREASE SIZE OR REINFORCEMENT'}
+    P-M INTERACTION (φPn-φMn, along the load ray):
+    Design Moments: {self._design_moments_text(results)}
+    P-Mx: {results['utilization_x']:.1f}%, P-My: {results['utilization_y']:.1f}%
+    GOVERNING UTILIZATION: {results['governing_utilization']:.1f}%
+    
+    DESIGN MARGIN: {100 - results['governing_utilization']:.1f}%
+    STATUS: {'✅ ADEQUATE CAPACITY' if results['governing_utilization'] <= 100 else '❌ INADEQUATE CAPACITY - INCREASE SIZE OR REINFORCEMENT'}
 
 ┌────────────────────────────────────────────────────────────────────────────┐
 │                        P-M INTERACTION DIAGRAMS                           │
 │    ✓ P-Mx interaction curve generated and analyzed                        │
 │    ✓ P-My interaction curve generated and analyzed                        │
 │    ✓ Applied loads plotted on interaction curves                          │
-│    ✓ Safety status: {'SAFE' if results['utilization'] <= 100 else 'UNSAFE'} - Utilization: {results['utilization']:.1f}%                      │
+│    ✓ Safety status: {'SAFE' if results['governing_utilization'] <= 100 else 'UNSAFE'} - Utilization: {results['governing_utilization']:.1f}%                      │
+│    ✓ Curve accuracy: {self._pm_accuracy_text(results)}
 │                                                                            │
 │    [Complete interaction diagrams available in PDF export]                │
 └────────────────────────────────────────────────────────────────────────────┘
@@ -1507,13 +1850,14 @@ PROJECT INFORMATION:
     CAPACITY CHECK:
     Applied Load: Pu = {results['P']:,.0f} kN
     Design Capacity: φPn = {results['Pu_capacity']:,.0f} kN
-    Utilization: {results['utilization']:.1f}%
-    Status: {'✓ ADEQUATE' if results['utilization'] <= 100 else '✗ INADEQUATE'}
+    Axial Utilization: {results['utilization']:.1f}%
+    P-M Utilization: P-Mx {results['utilization_x']:.1f}%, P-My {results['utilization_y']:.1f}%
+    Status: {'✓ ADEQUATE' if results['governing_utilization'] <= 100 else '✗ INADEQUATE'}
 
 6.3 SAFETY AND SERVICEABILITY:
     
-    SAFETY MARGIN: {100 - results['utilization']:.1f}%
-    {'• Excellent safety margin (>20%)' if results['utilization'] < 80 else '• Adequate safety margin (10-20%)' if results['utilization'] < 90 else '• Minimal safety margin (<10%)' if results['utilization'] < 95 else '• Very tight design - consider increasing capacity'}
+    SAFETY MARGIN: {100 - results['governing_utilization']:.1f}%
+    {'• Excellent safety margin (>20%)' if results['governing_utilization'] < 80 else '• Adequate safety margin (10-20%)' if results['governing_utilization'] < 90 else '• Minimal safety margin (<10%)' if results['governing_utilization'] < 95 else '• Very tight design - consider increasing capacity'}
     
     DEVELOPMENT LENGTH CHECK:
     Required: Ld = {results['ld_required']:.0f} mm
@@ -1526,36 +1870,37 @@ PROJECT INFORMATION:
 """
         
         # Add specific recommendations with detailed analysis
-        if results['utilization'] > 100:
+        governing = results['governing_utilization']
+        if not governing <= 100:
             report += f"""
     🚨 CRITICAL ISSUES REQUIRING IMMEDIATE ATTENTION:
-    • Column capacity ({results['Pu_capacity']:,.0f} kN) < Applied load ({results['P']:,.0f} kN)
+    • Governing utilization {governing:.1f}% > 100% (axial {results['utilization']:.1f}%, P-Mx {results['utilization_x']:.1f}%, P-My {results['utilization_y']:.1f}%)
     • REQUIRED ACTIONS:
       - Increase column size: Try {results['width']+50:.0f} × {results['height']+50:.0f} mm
       - OR increase reinforcement significantly
       - Re-analyze with increased capacity
 """
-        elif results['utilization'] > 95:
+        elif governing > 95:
             report += f"""
     ⚠️ DESIGN CONCERNS:
-    • Very high utilization ({results['utilization']:.1f}%) - minimal safety margin
+    • Very high utilization ({governing:.1f}%) - minimal safety margin
     • RECOMMENDATIONS:
       - Consider slight increase in section size or reinforcement
       - Verify all load factors are appropriate
       - Consider fatigue effects if applicable
 """
-        elif results['utilization'] > 85:
+        elif governing > 85:
             report += f"""
     ✓ DESIGN ACCEPTABLE BUT CONSIDER:
-    • Utilization is {results['utilization']:.1f}% - adequate but not conservative
+    • Utilization is {governing:.1f}% - adequate but not conservative
     • Could add slight reinforcement for additional safety margin
-    • Current design provides {100-results['utilization']:.1f}% safety margin
+    • Current design provides {100-governing:.1f}% safety margin
 """
         else:
             report += f"""
     ✅ EXCELLENT DESIGN:
-    • Conservative utilization ({results['utilization']:.1f}%)
-    • Good safety margin ({100-results['utilization']:.1f}%)
+    • Conservative utilization ({governing:.1f}%)
+    • Good safety margin ({100-governing:.1f}%)
     • Design provides reliable performance
 """
         
@@ -1605,8 +1950,8 @@ PROJECT INFORMATION:
     • Limitations: P-M interaction simplified for preliminary design
 
 8.3 DESIGN CONFIDENCE LEVEL:
-    Based on calculation sophistication: {'HIGH' if results['utilization'] < 90 else 'MEDIUM' if results['utilization'] < 95 else 'LOW - REQUIRES DETAILED ANALYSIS'}
-    Recommended for: {'Final design with engineer review' if results['utilization'] < 85 else 'Preliminary design - detailed analysis recommended'}
+    Based on calculation sophistication: {'HIGH' if governing < 90 else 'MEDIUM' if governing < 95 else 'LOW - REQUIRES DETAILED ANALYSIS'}
+    Recommended for: {'Final design with engineer review' if governing < 85 else 'Preliminary design - detailed analysis recommended'}
 
 {'='*80}
 END OF DETAILED CALCULATION REPORT
@@ -1623,11 +1968,10 @@ Report generated by: Professional Column Design v3.0
 Analysis date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 {'='*80}
 """
-        
-        self.results_text.insert(tk.END, report)
+        return report
     
     def export_to_pdf(self):
-        """Export the complete report to PDF format"""
+        """Export the complete report to PDF format (built on a worker thread)"""
         if self.last_results is None:
             messagebox.showwarning("No Data", "Please generate report first.")
             return
@@ -1638,225 +1982,279 @@ Analysis date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
                                "Install with: pip install reportlab")
             return
         
-        try:
-            from tkinter import filedialog
-            from reportlab.lib.pagesizes import letter, A4
-            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
-            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-            from reportlab.lib import colors
-            from reportlab.lib.units import inch
-            import os
-            
-            # Generate diagrams first
+        from tkinter import filedialog
+        
+        # Ask user for save location
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".pdf",
+            filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")],
+            title="Save Report as PDF"
+        )
+        
+        if not filename:
+            return
+        
+        def work(task):
+            # Generate diagrams first (reused from the report if unchanged)
+            task.progress(None, "Preparing diagrams...")
             self.generate_report_diagrams()
-            
-            # Ask user for save location
-            filename = filedialog.asksaveasfilename(
-                defaultextension=".pdf",
-                filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")],
-                title="Save Report as PDF"
-            )
-            
-            if not filename:
-                return
-            
-            # Create PDF document
-            doc = SimpleDocTemplate(filename, pagesize=A4,
-                                  rightMargin=72, leftMargin=72,
-                                  topMargin=72, bottomMargin=18)
-            
-            # Container for the 'Flowable' objects
-            story = []
-            
-            # Define styles
-            styles = getSampleStyleSheet()
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=16,
-                spaceAfter=30,
-                alignment=1,  # Center alignment
-                textColor=colors.darkblue
-            )
-            
-            results = self.last_results
-            
-            # Title
-            story.append(Paragraph("REINFORCED CONCRETE COLUMN DESIGN REPORT", title_style))
-            story.append(Paragraph("WITH DETAILED CALCULATIONS", title_style))
-            story.append(Spacer(1, 20))
-            
-            # Project Information
-            project_info = f"""
-            <b>Analysis Date:</b> {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}<br/>
-            <b>Software:</b> Professional Column Design v3.0<br/>
-            <b>Design Code:</b> ACI 318M-25 Chapter 10 (Columns)<br/>
-            <b>Column Size:</b> {results['width']:.0f} × {results['height']:.0f} mm
-            """
-            story.append(Paragraph(project_info, styles['Normal']))
-            story.append(Spacer(1, 20))
-            
-            # Add Section Preview if available
-            if hasattr(self, 'section_preview_path') and os.path.exists(self.section_preview_path):
-                story.append(Paragraph("DETAILED SECTION PREVIEW", styles['Heading2']))
-                # Add image with appropriate size
-                img = Image(self.section_preview_path, width=6*inch, height=4*inch)
-                story.append(img)
-                story.append(Spacer(1, 20))
-            
-            # Input Parameters Summary
-            story.append(Paragraph("1. DESIGN INPUT PARAMETERS", styles['Heading2']))
-            
-            input_text = f"""
-            <b>Geometry:</b><br/>
-            • Column Cross-Section: {results['width']:.0f} × {results['height']:.0f} mm<br/>
-            • Column Length: {results['length']:.1f} m<br/>
-            • Gross Area: Ag = {results['width']:.0f} × {results['height']:.0f} = {results['Ag']:,.0f} mm²<br/><br/>
-            
-            <b>Applied Loads:</b><br/>
-            • Axial Load: Pu = {results['P']:,.0f} kN<br/>
-            • Moment X: Mux = {results['Mx']:.0f} kN⋅m → ex = {results['ex']:.1f} mm<br/>
-            • Moment Y: Muy = {results['My']:.0f} kN⋅m → ey = {results['ey']:.1f} mm<br/><br/>
-            
-            <b>Materials:</b><br/>
-            • Concrete: fc' = {results['fc']:.0f} MPa<br/>
-            • Steel: fy = {results['fy']:.0f} MPa
-            """
-            story.append(Paragraph(input_text, styles['Normal']))
-            story.append(Spacer(1, 20))
-            
-            # Reinforcement Design
-            story.append(Paragraph("2. REINFORCEMENT DESIGN WITH CALCULATIONS", styles['Heading2']))
-            
-            rebar_text = f"""
-            <b>Longitudinal Reinforcement Area Calculations:</b><br/><br/>
-            
-            <b>X-Direction:</b><br/>
-            Size: {results['rebar_x']} (Area = {self.get_rebar_area(results['rebar_x']):.0f} mm² per bar)<br/>
-            Formula: As,x = n × Ab = {results['num_bars_x']:.0f} × {self.get_rebar_area(results['rebar_x']):.0f} = {results['As_x']:,.0f} mm²<br/><br/>
-            
-            <b>Y-Direction:</b><br/>
-            Size: {results['rebar_y']} (Area = {self.get_rebar_area(results['rebar_y']):.0f} mm² per bar)<br/>
-            Formula: As,y = n × Ab = {results['num_bars_y']:.0f} × {self.get_rebar_area(results['rebar_y']):.0f} = {results['As_y']:,.0f} mm²<br/><br/>
-            
-            <b>Corner Bars:</b><br/>
-            Size: {results['corner_rebar']} (Area = {self.get_rebar_area(results['corner_rebar']):.0f} mm² per bar)<br/>
-            Formula: As,corner = 4 × Ab = 4 × {self.get_rebar_area(results['corner_rebar']):.0f} = {results['As_corner']:,.0f} mm²<br/><br/>
-            
-            <b>Total Steel:</b><br/>
-            Formula: As,total = As,x + As,y + As,corner<br/>
-            = {results['As_x']:,.0f} + {results['As_y']:,.0f} + {results['As_corner']:,.0f} = {results['As_provided']:,.0f} mm²<br/><br/>
-            
-            <b>Steel Ratio:</b><br/>
-            Formula: ρ = As,total / Ag × 100%<br/>
-            = {results['As_provided']:,.0f} / {results['Ag']:,.0f} × 100% = {results['steel_ratio']:.2f}%<br/>
-            Check: {'✓ OK' if 1.0 <= results['steel_ratio'] <= 6.0 else '✗ Outside range'} (Min: 1.0%, Max: 6.0%)
-            """
-            story.append(Paragraph(rebar_text, styles['Normal']))
-            story.append(Spacer(1, 20))
-            
-            # Capacity Calculations
-            story.append(Paragraph("3. CAPACITY CALCULATIONS", styles['Heading2']))
-            
-            capacity_text = f"""
-            <b>Nominal Axial Capacity (Simplified Method):</b><br/><br/>
-            
-            <b>Concrete Contribution:</b><br/>
-            Formula: Pn,concrete = 0.85 × fc' × (Ag - As)<br/>
-            = 0.85 × {results['fc']:.0f} × ({results['Ag']:,.0f} - {results['As_provided']:,.0f})<br/>
-            = 0.85 × {results['fc']:.0f} × {results['Ag'] - results['As_provided']:,.0f}<br/>
-            = {results['Pn_concrete']/1000:,.0f} kN<br/><br/>
-            
-            <b>Steel Contribution:</b><br/>
-            Formula: Pn,steel = fy × As<br/>
-            = {results['fy']:.0f} × {results['As_provided']:,.0f}<br/>
-            = {results['Pn_steel']/1000:,.0f} kN<br/><br/>
-            
-            <b>Total Nominal Capacity:</b><br/>
-            Formula: Pn = Pn,concrete + Pn,steel<br/>
-            = {results['Pn_concrete']/1000:,.0f} + {results['Pn_steel']/1000:,.0f} = {results['Pn_total']/1000:,.0f} kN<br/><br/>
-            
-            <b>Design Capacity:</b><br/>
-            Formula: φPn = φ × Pn (φ = 0.65 for tied columns)<br/>
-            = 0.65 × {results['Pn_total']/1000:,.0f} = {results['Pu_capacity']:,.0f} kN<br/><br/>
-            
-            <b>Utilization Check:</b><br/>
-            Formula: Utilization = (Applied Load / Design Capacity) × 100%<br/>
-            = ({results['P']:,.0f} / {results['Pu_capacity']:,.0f}) × 100% = {results['utilization']:.1f}%<br/>
-            Status: <b>{'✅ ADEQUATE' if results['utilization'] <= 100 else '❌ INADEQUATE'}</b><br/>
-            Safety Margin: {100 - results['utilization']:.1f}%
-            """
-            story.append(Paragraph(capacity_text, styles['Normal']))
+            task.progress(None, "Writing PDF...")
+            self._write_pdf_report(filename)
+        
+        self.start_task("PDF Export", work,
+                        lambda _: messagebox.showinfo("PDF Export Complete", 
+                                                      f"Report successfully exported to:\n{filename}"),
+                        error_title="PDF Export Error")
+    
+    def _write_pdf_report(self, filename):
+        """Build the PDF report for the last results (no widget access)"""
+        from reportlab.lib.pagesizes import A4
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib import colors
+        from reportlab.lib.units import inch
+        from column_report import design_status
+        
+        # Create PDF document
+        doc = SimpleDocTemplate(filename, pagesize=A4,
+                              rightMargin=72, leftMargin=72,
+                              topMargin=72, bottomMargin=18)
+        
+        # Container for the 'Flowable' objects
+        story = []
+        
+        # Define styles
+        styles = getSampleStyleSheet()
+        title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=16,
+            spaceAfter=30,
+            alignment=1,  # Center alignment
+            textColor=colors.darkblue
+        )
+        
+        results = self.last_results
+        
+        # Title
+        story.append(Paragraph("REINFORCED CONCRETE COLUMN DESIGN REPORT", title_style))
+        story.append(Paragraph("WITH DETAILED CALCULATIONS", title_style))
+        story.append(Spacer(1, 20))
+        
+        # Project Information
+        project_info = f"""
+        <b>Analysis Date:</b> {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}<br/>
+        <b>Software:</b> Professional Column Design v3.0<br/>
+        <b>Design Code:</b> ACI 318M-25 Chapter 10 (Columns)<br/>
+        <b>Column Size:</b> {results['width']:.0f} × {results['height']:.0f} mm
+        """
+        story.append(Paragraph(project_info, styles['Normal']))
+        story.append(Spacer(1, 20))
+        
+        # Add Section Preview if available
+        if self.section_preview_drawing:
+            story.append(Paragraph("DETAILED SECTION PREVIEW", styles['Heading2']))
+            # Vector drawing, resolution independent
+            story.append(self.section_preview_drawing)
             story.append(Spacer(1, 20))
-            
-            # Add P-M Interaction Diagrams if available
-            if hasattr(self, 'pm_diagrams_path') and os.path.exists(self.pm_diagrams_path):
-                story.append(Paragraph("P-M INTERACTION DIAGRAMS", styles['Heading2']))
-                # Add image with appropriate size
-                img = Image(self.pm_diagrams_path, width=7*inch, height=3.5*inch)
-                story.append(img)
-                
-                # Add diagram description
-                diagram_desc = f"""
-                <b>Interaction Diagram Analysis:</b><br/>
-                • P-Mx and P-My interaction curves generated using ACI 318M-25 provisions<br/>
-                • Applied loads: P = {results['P']:.0f} kN, Mx = {results['Mx']:.0f} kN⋅m, My = {results['My']:.0f} kN⋅m<br/>
-                • Utilization: {results['utilization']:.1f}% of capacity<br/>
-                • Safety Status: <b>{'SAFE' if results['utilization'] <= 100 else 'UNSAFE'}</b><br/>
-                • Design complies with interaction requirements
-                """
-                story.append(Paragraph(diagram_desc, styles['Normal']))
-                story.append(Spacer(1, 20))
-            
-            # Design Summary
-            story.append(Paragraph("4. FINAL DESIGN SUMMARY", styles['Heading2']))
-            
-            summary_text = f"""
-            <b>Design Specifications:</b><br/>
-            • Column Size: {results['width']:.0f} × {results['height']:.0f} mm<br/>
-            • X-Direction: {results['num_bars_x']:.0f} × {results['rebar_x']} = {results['As_x']:,.0f} mm²<br/>
-            • Y-Direction: {results['num_bars_y']:.0f} × {results['rebar_y']} = {results['As_y']:,.0f} mm²<br/>
-            • Corner Bars: 4 × {results['corner_rebar']} = {results['As_corner']:,.0f} mm²<br/>
-            • Total Steel: {results['As_provided']:,.0f} mm² ({results['steel_ratio']:.2f}%)<br/>
-            • Ties: {results['tie_size']} @ {results['tie_spacing']:.0f} mm c/c<br/>
-            • Clear Cover: {results['cover']:.0f} mm<br/><br/>
-            
-            <b>Design Verification:</b><br/>
-            {'✓' if results['steel_ratio'] >= 1.0 else '✗'} Minimum reinforcement: {results['steel_ratio']:.2f}% ≥ 1.0%<br/>
-            {'✓' if results['steel_ratio'] <= 6.0 else '✗'} Maximum reinforcement: {results['steel_ratio']:.2f}% ≤ 6.0%<br/>
-            {'✓' if results['tie_spacing_ok'] else '✗'} Tie spacing: {results['tie_spacing']:.0f} mm ≤ {results['max_spacing']:.0f} mm<br/>
-            {'✓' if results['utilization'] <= 100 else '✗'} Capacity check: {results['utilization']:.1f}% ≤ 100%<br/><br/>
-            
-            <b>Overall Status: {'✅ DESIGN ACCEPTABLE' if results['utilization'] <= 100 and results['tie_spacing_ok'] and 1.0 <= results['steel_ratio'] <= 6.0 else '⚠️ DESIGN REQUIRES MODIFICATION'}</b>
+        
+        # Input Parameters Summary
+        story.append(Paragraph("1. DESIGN INPUT PARAMETERS", styles['Heading2']))
+        
+        input_text = f"""
+        <b>Geometry:</b><br/>
+        • Column Cross-Section: {results['width']:.0f} × {results['height']:.0f} mm<br/>
+        • Column Length: {results['length']:.1f} m<br/>
+        • Gross Area: Ag = {results['width']:.0f} × {results['height']:.0f} = {results['Ag']:,.0f} mm²<br/><br/>
+        
+        <b>Applied Loads:</b><br/>
+        • Axial Load: Pu = {results['P']:,.0f} kN<br/>
+        • Moment X: Mux = {results['Mx']:.0f} kN⋅m → ex = {results['ex']:.1f} mm<br/>
+        • Moment Y: Muy = {results['My']:.0f} kN⋅m → ey = {results['ey']:.1f} mm<br/><br/>
+        
+        <b>Materials:</b><br/>
+        • Concrete: fc' = {results['fc']:.0f} MPa<br/>
+        • Steel: fy = {results['fy']:.0f} MPa
+        """
+        story.append(Paragraph(input_text, styles['Normal']))
+        story.append(Spacer(1, 20))
+        
+        # Reinforcement Design
+        story.append(Paragraph("2. REINFORCEMENT DESIGN WITH CALCULATIONS", styles['Heading2']))
+        
+        rebar_text = f"""
+        <b>Longitudinal Reinforcement Area Calculations:</b><br/><br/>
+        
+        <b>X-Direction:</b><br/>
+        Size: {results['rebar_x']} (Area = {self.get_rebar_area(results['rebar_x']):.0f} mm² per bar)<br/>
+        Formula: As,x = n × Ab = {results['num_bars_x']:.0f} × {self.get_rebar_area(results['rebar_x']):.0f} = {results['As_x']:,.0f} mm²<br/><br/>
+        
+        <b>Y-Direction:</b><br/>
+        Size: {results['rebar_y']} (Area = {self.get_rebar_area(results['rebar_y']):.0f} mm² per bar)<br/>
+        Formula: As,y = n × Ab = {results['num_bars_y']:.0f} × {self.get_rebar_area(results['rebar_y']):.0f} = {results['As_y']:,.0f} mm²<br/><br/>
+        
+        <b>Corner Bars:</b><br/>
+        Size: {results['corner_rebar']} (Area = {self.get_rebar_area(results['corner_rebar']):.0f} mm² per bar)<br/>
+        Formula: As,corner = 4 × Ab = 4 × {self.get_rebar_area(results['corner_rebar']):.0f} = {results['As_corner']:,.0f} mm²<br/><br/>
+        
+        <b>Total Steel:</b><br/>
+        Formula: As,total = As,x + As,y + As,corner<br/>
+        = {results['As_x']:,.0f} + {results['As_y']:,.0f} + {results['As_corner']:,.0f} = {results['As_provided']:,.0f} mm²<br/><br/>
+        
+        <b>Steel Ratio:</b><br/>
+        Formula: ρ = As,total / Ag × 100%<br/>
+        = {results['As_provided']:,.0f} / {results['Ag']:,.0f} × 100% = {results['steel_ratio']:.2f}%<br/>
+        Check: {'✓ OK' if 1.0 <= results['steel_ratio'] <= 6.0 else '✗ Outside range'} (Min: 1.0%, Max: 6.0%)
+        """
+        story.append(Paragraph(rebar_text, styles['Normal']))
+        story.append(Spacer(1, 20))
+        
+        # Capacity Calculations
+        story.append(Paragraph("3. CAPACITY CALCULATIONS", styles['Heading2']))
+        
+        capacity_text = f"""
+        <b>Nominal Axial Capacity (Simplified Method):</b><br/><br/>
+        
+        <b>Concrete Contribution:</b><br/>
+        Formula: Pn,concrete = 0.85 × fc' × (Ag - As)<br/>
+        = 0.85 × {results['fc']:.0f} × ({results['Ag']:,.0f} - {results['As_provided']:,.0f})<br/>
+        = 0.85 × {results['fc']:.0f} × {results['Ag'] - results['As_provided']:,.0f}<br/>
+        = {results['Pn_concrete']/1000:,.0f} kN<br/><br/>
+        
+        <b>Steel Contribution:</b><br/>
+        Formula: Pn,steel = fy × As<br/>
+        = {results['fy']:.0f} × {results['As_provided']:,.0f}<br/>
+        = {results['Pn_steel']/1000:,.0f} kN<br/><br/>
+        
+        <b>Total Nominal Capacity:</b><br/>
+        Formula: Pn = Pn,concrete + Pn,steel<br/>
+        = {results['Pn_concrete']/1000:,.0f} + {results['Pn_steel']/1000:,.0f} = {results['Pn_total']/1000:,.0f} kN<br/><br/>
+        
+        <b>Design Capacity:</b><br/>
+        Formula: φPn = φ × Pn (φ = 0.65 for tied columns)<br/>
+        = 0.65 × {results['Pn_total']/1000:,.0f} = {results['Pu_capacity']:,.0f} kN<br/><br/>
+        
+        <b>Utilization Check:</b><br/>
+        Formula: Utilization = (Applied Load / Design Capacity) × 100%<br/>
+        = ({results['P']:,.0f} / {results['Pu_capacity']:,.0f}) × 100% = {results['utilization']:.1f}%<br/>
+        Design moments: {self._design_moments_text(results)}<br/>
+        P-M interaction (along the load ray): P-Mx {results['utilization_x']:.1f}%, P-My {results['utilization_y']:.1f}%<br/>
+        Governing utilization: {results['governing_utilization']:.1f}%<br/>
+        Status: <b>{'✅ ADEQUATE' if results['governing_utilization'] <= 100 else '❌ INADEQUATE'}</b><br/>
+        Safety Margin: {100 - results['governing_utilization']:.1f}%
+        """
+        story.append(Paragraph(capacity_text, styles['Normal']))
+        story.append(Spacer(1, 20))
+        
+        # Add P-M Interaction Diagrams if available
+        if self.pm_diagrams_drawing:
+            story.append(Paragraph("P-M INTERACTION DIAGRAMS", styles['Heading2']))
+            # Vector drawing, resolution independent
+            story.append(self.pm_diagrams_drawing)
+            
+            # Add diagram description
+            diagram_desc = f"""
+            <b>Interaction Diagram Analysis:</b><br/>
+            • P-Mx and P-My interaction curves generated using ACI 318M-25 provisions<br/>
+            • Applied loads: P = {results['P']:.0f} kN, Mx = {results['Mx']:.0f} kN⋅m, My = {results['My']:.0f} kN⋅m<br/>
+            • Utilization: {results['governing_utilization']:.1f}% of capacity<br/>
+            • Safety Status: <b>{'SAFE' if results['governing_utilization'] <= 100 else 'UNSAFE'}</b><br/>
+            • Curve accuracy: {self._pm_accuracy_text(results)}<br/>
+            • Design complies with interaction requirements
             """
-            story.append(Paragraph(summary_text, styles['Normal']))
+            story.append(Paragraph(diagram_desc, styles['Normal']))
             story.append(Spacer(1, 20))
-            
-            # Footer
-            footer_text = f"""
-            <b>DISCLAIMERS:</b><br/>
-            • This analysis uses simplified methods for preliminary design<br/>
-            • Professional engineer review and approval required<br/>
-            • Verify all applicable codes and project-specific requirements<br/>
-            • Consider all load combinations and special conditions<br/><br/>
-            Report generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}<br/>
-            Software: Professional Column Design v3.0
-            """
-            story.append(Paragraph(footer_text, styles['Normal']))
-            
-            # Build PDF
-            doc.build(story)
-            
-            messagebox.showinfo("PDF Export Complete", 
-                               f"Report successfully exported to:\n{filename}")
         
-        except ImportError:
+        # Design Summary
+        story.append(Paragraph("4. FINAL DESIGN SUMMARY", styles['Heading2']))
+        
+        summary_text = f"""
+        <b>Design Specifications:</b><br/>
+        • Column Size: {results['width']:.0f} × {results['height']:.0f} mm<br/>
+        • X-Direction: {results['num_bars_x']:.0f} × {results['rebar_x']} = {results['As_x']:,.0f} mm²<br/>
+        • Y-Direction: {results['num_bars_y']:.0f} × {results['rebar_y']} = {results['As_y']:,.0f} mm²<br/>
+        • Corner Bars: 4 × {results['corner_rebar']} = {results['As_corner']:,.0f} mm²<br/>
+        • Total Steel: {results['As_provided']:,.0f} mm² ({results['steel_ratio']:.2f}%)<br/>
+        • Ties: {results['tie_size']} @ {results['tie_spacing']:.0f} mm c/c<br/>
+        • Clear Cover: {results['cover']:.0f} mm<br/><br/>
+        
+        <b>Design Verification:</b><br/>
+        {'✓' if results['steel_ratio'] >= 1.0 else '✗'} Minimum reinforcement: {results['steel_ratio']:.2f}% ≥ 1.0%<br/>
+        {'✓' if results['steel_ratio'] <= 6.0 else '✗'} Maximum reinforcement: {results['steel_ratio']:.2f}% ≤ 6.0%<br/>
+        {'✓' if results['tie_spacing_ok'] else '✗'} Tie spacing: {results['tie_spacing']:.0f} mm ≤ {results['max_spacing']:.0f} mm<br/>
+        {'✓' if results['governing_utilization'] <= 100 else '✗'} Capacity check (P-M): {results['governing_utilization']:.1f}% ≤ 100%<br/><br/>
+        
+        <b>Overall Status: {'✅ DESIGN ACCEPTABLE' if design_status(results) else '⚠️ DESIGN REQUIRES MODIFICATION'}</b>
+        """
+        story.append(Paragraph(summary_text, styles['Normal']))
+        story.append(Spacer(1, 20))
+        
+        # Footer
+        footer_text = f"""
+        <b>DISCLAIMERS:</b><br/>
+        • This analysis uses simplified methods for preliminary design<br/>
+        • Professional engineer review and approval required<br/>
+        • Verify all applicable codes and project-specific requirements<br/>
+        • Consider all load combinations and special conditions<br/><br/>
+        Report generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}<br/>
+        Software: Professional Column Design v3.0
+        """
+        story.append(Paragraph(footer_text, styles['Normal']))
+        
+        # Build PDF
+        with profiler.stage('report.pdf_build'):
+            doc.build(story)
+    
+    def export_schedule_pdf(self):
+        """Export a whole column schedule (CSV) into one PDF report"""
+        if not HAS_MATPLOTLIB or not HAS_REPORTLAB:
             messagebox.showerror("Missing Library", 
-                               "ReportLab library is required for PDF export.\n"
-                               "Install with: pip install reportlab")
+                               "Matplotlib and ReportLab are required for schedule PDF export.\n"
+                               "Install with: pip install matplotlib reportlab")
+            return
+        
+        from tkinter import filedialog
+        from column_batch import read_schedule_csv
+        from column_report import export_schedule_pdf
+        
+        schedule = filedialog.askopenfilename(
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+            title="Open Column Schedule"
+        )
+        if not schedule:
+            return
+        
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".pdf",
+            filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")],
+            title="Save Schedule Report as PDF"
+        )
+        if not filename:
+            return
+        
+        try:
+            rows = read_schedule_csv(schedule)
         except Exception as e:
-            messagebox.showerror("PDF Export Error", 
-                               f"Could not export to PDF: {str(e)}")
+            messagebox.showerror("PDF Export Error", f"Could not read schedule: {str(e)}")
+            return
+        
+        def work(task):
+            try:
+                return export_schedule_pdf(rows, filename, engine=self.engine,
+                                           progress=lambda fraction: task.progress(fraction, "Writing schedule PDF..."))
+            except TaskCancelled:
+                # Do not leave a truncated report behind
+                if os.path.exists(filename):
+                    os.remove(filename)
+                raise
+        
+        def done(report):
+            messagebox.showinfo("PDF Export Complete", 
+                               f"{report['columns']} columns ({report['pages']} pages) exported to:\n"
+                               f"{filename}\n"
+                               f"Time: {report['elapsed']:.1f} s")
+        
+        self.start_task("Schedule Export", work, done, error_title="PDF Export Error")
     
     def export_report(self):
         """Export the complete report to a text file"""
@@ -1873,14 +2271,139 @@ Analysis date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         except Exception as e:
             messagebox.showerror("Export Error", f"Could not export report: {str(e)}")
     
+    def open_load_combinations(self):
+        """Open the load-combination table and check every combination at once"""
+        try:
+            from column_loads import LOAD_TYPES, factored_loads, parse_load_table, check_load_combinations
+            from column_biaxial import SCREEN_LIMIT, check_biaxial
+            from column_slenderness import magnify_storey
+        except ImportError:
+            messagebox.showerror("Missing Library", "NumPy is required for load combinations. Please install numpy.")
+            return
+        
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Load Combinations")
+        dialog.geometry("720x600")
+        
+        # === SERVICE LOADS ===
+        service_frame = ttk.LabelFrame(dialog, text="🔹 Service Loads", padding="10")
+        service_frame.pack(fill=tk.X, padx=10, pady=(10, 5))
+        
+        for col, heading in enumerate(["P (kN)", "Mx (kN⋅m)", "My (kN⋅m)"], 1):
+            tk.Label(service_frame, text=heading, font=("Arial", 9, "bold")).grid(row=0, column=col, padx=5)
+        
+        service_vars = {}
+        for row, load_type in enumerate(LOAD_TYPES, 1):
+            tk.Label(service_frame, text=f"{load_type}:", font=("Arial", 9, "bold")).grid(row=row, column=0, sticky=tk.W, pady=2)
+            service_vars[load_type] = [tk.StringVar(value="0") for _ in range(3)]
+            for col, var in enumerate(service_vars[load_type], 1):
+                ttk.Entry(service_frame, textvariable=var, width=12).grid(row=row, column=col, padx=5)
+        
+        # === COMBINATION TABLE ===
+        table_frame = ttk.LabelFrame(dialog, text="📋 Factored Combinations (name, P, Mx, My)", padding="10")
+        table_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        
+        table_text = tk.Text(table_frame, font=("Courier New", 9), height=12, bg='#f8f9fa')
+        table_text.pack(fill=tk.BOTH, expand=True)
+        table_text.insert(tk.END, f"Design, {self.axial_load_var.get()}, {self.moment_x_var.get()}, {self.moment_y_var.get()}\n")
+        
+        results_text = tk.Text(dialog, font=("Courier New", 9), height=10, bg='#f8f9fa')
+        
+        def generate():
+            try:
+                service = {t: [float(v.get() or "0") for v in service_vars[t]] for t in LOAD_TYPES}
+            except ValueError:
+                messagebox.showerror("Input Error", "Service loads must be numbers.", parent=dialog)
+                return
+            names, loads = factored_loads(service)
+            table_text.delete(1.0, tk.END)
+            for name, (P, Mx, My) in zip(names, loads):
+                table_text.insert(tk.END, f"{name.replace(' ', '')}, {P:.1f}, {Mx:.1f}, {My:.1f}\n")
+        
+        def check():
+            if self.is_busy(parent=dialog):
+                return
+            try:
+                inputs = self.collect_input_data()
+                names, loads = parse_load_table(table_text.get(1.0, tk.END))
+            except ValueError as e:
+                messagebox.showerror("Input Error", f"Please check all input values.\n{e}", parent=dialog)
+                return
+            if not names:
+                messagebox.showwarning("No Data", "Enter at least one load combination.", parent=dialog)
+                return
+            
+            unstable = None
+            if magnify_var.get():
+                magnified = magnify_storey(inputs, loads[:, 0][None, :], loads[:, 1][None, :], loads[:, 2][None, :])
+                # Unstable cases have no design moment and fail outright
+                unstable = magnified['unstable'][0]
+                loads[:, 1] = magnified['Mx'][0]
+                loads[:, 2] = magnified['My'][0]
+            
+            check_results = check_load_combinations(self.engine, inputs, loads, names, unstable=unstable)
+            if biaxial_var.get():
+                show_biaxial(check_results, check_biaxial(self.engine, inputs, loads, names, unstable=unstable))
+                return
+            
+            results_text.delete(1.0, tk.END)
+            results_text.insert(tk.END, f"{'Combination':<24}{'P':>10}{'Mx':>10}{'My':>10}{'Ux %':>9}{'Uy %':>9}{'U %':>9}\n")
+            results_text.insert(tk.END, "-" * 81 + "\n")
+            for i, name in enumerate(check_results['names']):
+                P, Mx, My = check_results['loads'][i]
+                marker = " ◄" if i == check_results['governing_index'] else ""
+                results_text.insert(tk.END, f"{name:<24}{P:>10.1f}{Mx:>10.1f}{My:>10.1f}"
+                                            f"{check_results['utilization_x'][i]:>9.1f}"
+                                            f"{check_results['utilization_y'][i]:>9.1f}"
+                                            f"{check_results['utilization'][i]:>9.1f}{marker}\n")
+            
+            status = "✅ SAFE" if check_results['governing_utilization'] <= 100 else "⚠️ OVER-UTILIZED"
+            results_text.insert(tk.END, f"\nGoverning: {check_results['governing_name']} - "
+                                        f"{check_results['governing_utilization']:.1f}% {status}\n")
+        
+        def show_biaxial(check_results, biaxial):
+            results_text.delete(1.0, tk.END)
+            results_text.insert(tk.END, f"{'Combination':<24}{'Ux %':>8}{'Uy %':>8}{'Recip %':>9}{'Contour %':>11}{'U %':>8}\n")
+            results_text.insert(tk.END, "-" * 68 + "\n")
+            for i, name in enumerate(biaxial['names']):
+                reciprocal = (f"{biaxial['utilization_reciprocal'][i]:>9.1f}"
+                              if biaxial['reciprocal_valid'][i] else f"{'n/a':>9}")
+                marker = " ◄" if i == biaxial['governing_index'] else (" *" if biaxial['needs_full_check'][i] else "")
+                results_text.insert(tk.END, f"{name:<24}{check_results['utilization_x'][i]:>8.1f}"
+                                            f"{check_results['utilization_y'][i]:>8.1f}{reciprocal}"
+                                            f"{biaxial['utilization_contour'][i]:>11.1f}"
+                                            f"{biaxial['utilization'][i]:>8.1f}{marker}\n")
+            
+            status = "✅ SAFE" if biaxial['governing_utilization'] <= 100 else "⚠️ OVER-UTILIZED"
+            results_text.insert(tk.END, f"\nGoverning (Bresler, α = {biaxial['alpha']}): {biaxial['governing_name']} - "
+                                        f"{biaxial['governing_utilization']:.1f}% {status}\n")
+            flagged = int(biaxial['needs_full_check'].sum())
+            if flagged:
+                results_text.insert(tk.END, f"* {flagged} combination(s) above {SCREEN_LIMIT:.0f}% - "
+                                            f"confirm with the fiber-section check\n")
+        
+        button_frame = ttk.Frame(dialog)
+        button_frame.pack(fill=tk.X, padx=10, pady=5)
+        ttk.Button(button_frame, text="⚙️ Generate ACI Combinations", command=generate).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(button_frame, text="🔧 Check All Combinations", command=check).pack(side=tk.LEFT)
+        biaxial_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(button_frame, text="Biaxial (Bresler)", variable=biaxial_var).pack(side=tk.LEFT, padx=(10, 0))
+        magnify_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(button_frame, text="Magnify Moments (non-sway)", variable=magnify_var).pack(side=tk.LEFT, padx=(10, 0))
+        
+        results_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=(5, 10))
+    
     def clear_all(self):
         """Clear all results and reset interface"""
         self.analysis_text.delete(1.0, tk.END)
         self.results_text.delete(1.0, tk.END)
         
-        # Clear interaction diagram
-        for widget in self.figure_frame.winfo_children():
-            widget.destroy()
+        # Clear interaction diagram (the figure itself is kept for reuse)
+        if self.pm_plot is not None:
+            for line in self.pm_plot['lines'].values():
+                line.set_data([], [])
+            self.pm_plot['title'].set_text('')
+            self.pm_plot['canvas'].draw_idle()
         
         self.last_results = None
         self.interaction_data = None
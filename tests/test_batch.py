@@ -0,0 +1,19 @@
+"""Tests for the column schedule batch runner"""
+
+from column_batch import read_schedule_csv, run_schedule
+
+
+def test_malformed_cell_fails_only_its_row(tmp_path):
+    schedule = tmp_path / "schedule.csv"
+    schedule.write_text("id,width,height,P,num_bars_x\n"
+                        "A1,400,400,1500,3\n"
+                        "A2,400,4OO,1500,3\n"
+                        "A3,400,400,1500,4\n", encoding='utf-8')
+    rows = read_schedule_csv(str(schedule))
+    assert len(rows) == 3
+    assert rows[1]['id'] == 'A2' and 'height' in rows[1]['error']
+
+    output = run_schedule(rows, workers=1)
+    assert [entry['id'] for entry in output] == ['A1', 'A2', 'A3']
+    assert output[0]['error'] is None and output[2]['error'] is None
+    assert output[1]['results'] is None and "invalid height value '4OO'" in output[1]['error']
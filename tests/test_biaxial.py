@@ -0,0 +1,62 @@
+"""Tests for the Bresler reciprocal and load-contour biaxial checks"""
+
+import math
+
+import numpy as np
+import pytest
+
+from column_biaxial import bresler_reciprocal, check_biaxial, load_contour
+from column_engine import ColumnDesignEngine, DEFAULT_INPUTS
+from column_loads import check_load_combinations
+
+# DEFAULT_INPUTS: 500 × 500 mm, 10 DB25 (As = 4,910 mm²), fc' = 30, fy = 420
+# P0 = 0.85 × 30 × (250,000 - 4,910) + 420 × 4,910 = 8,311,995 N
+PHI_P0 = 0.65 * 8311.995  # 5,402.8 kN
+PHI_P_CAP = 0.80 * PHI_P0  # 4,322.2 kN
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return ColumnDesignEngine()
+
+
+def test_bresler_reciprocal_hand_calculation():
+    # Pnx = 1000 / 0.5 = 2000, Pny = 1000 / 0.4 = 2500, P0 = 5000:
+    # 1/Pni = 1/2000 + 1/2500 - 1/5000 = 7e-4, so P / Pni = 0.7
+    assert bresler_reciprocal(0.5, 0.4, 1000.0, 5000.0) == pytest.approx(0.7)
+    assert math.isnan(bresler_reciprocal(0.5, 0.4, -10.0, 5000.0))
+
+
+def test_load_contour_hand_calculation():
+    # (0.6^1.5 + 0.5^1.5)^(1/1.5) = (0.464758 + 0.353553)^(2/3) = 0.874874
+    assert load_contour(60.0, 50.0, 100.0, 100.0, alpha=1.5) == pytest.approx(0.874874, rel=1e-5)
+    assert load_contour(10.0, 0.0, 0.0, 100.0) == math.inf
+
+
+def test_bresler_uses_the_uncapped_axial_strength(engine):
+    # Both load rays meet the curves below the cap, where capped and uncapped agree
+    loads = [[1000.0, 300.0, 250.0]]
+    biaxial = check_biaxial(engine, DEFAULT_INPUTS, loads)
+    uniaxial = check_load_combinations(engine, DEFAULT_INPUTS, loads)
+    assert biaxial['P0'] == pytest.approx(PHI_P0, rel=1e-6)
+    assert biaxial['P_cap'] == pytest.approx(PHI_P_CAP, rel=1e-6)
+
+    expected = (uniaxial['utilization_x'][0] + uniaxial['utilization_y'][0]) / 100 - 1000.0 / PHI_P0
+    assert biaxial['utilization_reciprocal'][0] == pytest.approx(expected * 100)
+
+
+def test_axial_cap_is_checked_separately(engine):
+    # Concentric loads: Pnx = Pny = P0, so Bresler gives P / φP0 and the cap governs
+    biaxial = check_biaxial(engine, DEFAULT_INPUTS, [[4000.0, 0.0, 0.0], [4500.0, 0.0, 0.0]])
+    assert biaxial['Pnx'] == pytest.approx([PHI_P0, PHI_P0], rel=1e-6)
+    assert biaxial['utilization_reciprocal'] == pytest.approx([4000.0 / PHI_P_CAP * 100, 4500.0 / PHI_P_CAP * 100], rel=1e-6)
+    assert biaxial['utilization'][0] < 100 < biaxial['utilization'][1]
+
+
+def test_unstable_cases_fail_with_infinite_utilization(engine):
+    loads = [[2000.0, np.nan, np.nan], [2000.0, 100.0, 80.0]]
+    biaxial = check_biaxial(engine, DEFAULT_INPUTS, loads, unstable=[True, False])
+    assert biaxial['utilization_contour'][0] == math.inf
+    assert biaxial['utilization'][0] == math.inf
+    assert biaxial['governing_index'] == 0
+    assert np.isfinite(biaxial['utilization'][1])
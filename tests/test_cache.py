@@ -0,0 +1,42 @@
+"""Tests for the interaction-curve cache"""
+
+from column_engine import ColumnDesignEngine, DEFAULT_INPUTS, InteractionCurveCache, section_signature
+
+
+def test_signature_ignores_loads_and_tracks_section():
+    base = section_signature(DEFAULT_INPUTS)
+    assert section_signature({**DEFAULT_INPUTS, 'P': 1.0, 'Mx': 2.0, 'length': 9.0}) == base
+    # Numbers are normalized, so 500 and 500.0 share a curve
+    assert section_signature({**DEFAULT_INPUTS, 'width': 500}) == base
+    assert section_signature({**DEFAULT_INPUTS, 'width': 600.0}) != base
+    assert section_signature({**DEFAULT_INPUTS, 'rebar_x': 'DB20'}) != base
+
+
+def test_lru_eviction_and_counters():
+    cache = InteractionCurveCache(maxsize=2)
+    assert cache.get('a') is None
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1  # 'a' becomes most recently used
+    cache.put('c', 3)  # evicts 'b'
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+    assert cache.stats() == {'size': 2, 'maxsize': 2, 'hits': 2, 'misses': 2, 'evictions': 1}
+    cache.clear()
+    assert len(cache) == 0 and cache.stats()['hits'] == 0
+
+
+def test_engine_reuses_curve_across_load_cases():
+    engine = ColumnDesignEngine()
+    first = engine.perform_calculations(dict(DEFAULT_INPUTS))
+    curve = engine.calculate_pm_interaction(first, 'x')
+    assert engine.pm_cache.stats()['misses'] == 1
+
+    second = engine.perform_calculations({**DEFAULT_INPUTS, 'P': 500.0, 'Mx': 10.0})
+    assert engine.calculate_pm_interaction(second, 'x') == curve
+    assert engine.pm_cache.stats()['hits'] == 1
+
+    engine.calculate_pm_interaction(second, 'y')
+    engine.calculate_pm_interaction({**second, 'height': 600.0}, 'x')
+    assert engine.pm_cache.stats()['misses'] == 3
+    assert len(engine.pm_cache) == 3
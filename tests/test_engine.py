@@ -0,0 +1,153 @@
+"""Tests for the headless calculation engine"""
+
+import math
+
+import pytest
+
+from column_engine import ColumnDesignEngine, DEFAULT_INPUTS, brent_root, design_tension
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return ColumnDesignEngine()
+
+
+@pytest.fixture(scope="module")
+def results(engine):
+    return engine.perform_calculations(dict(DEFAULT_INPUTS))
+
+
+@pytest.mark.parametrize("P, M", [(math.nan, 100.0), (1000.0, math.nan), (math.inf, 0.0), (1000.0, -math.inf)])
+def test_capacity_ratio_non_finite_load_fails(engine, results, P, M):
+    ratio, c, _ = engine.capacity_ratio(results, 'x', P, M)
+    assert ratio == math.inf
+    assert c is None
+
+
+def test_capacity_ratio_near_pure_bending_is_finite(engine, results):
+    # A tiny axial load on a large moment meets the curve where Pn is almost zero
+    M_zero = engine.pm_limits(results, 'x')['M_zero']
+    ratio, _, _ = engine.capacity_ratio(results, 'x', 1e-9, 2 * M_zero)
+    assert ratio == pytest.approx(2.0, rel=1e-6)
+
+
+def test_capacity_ratio_tension_side_is_not_negative(engine, results):
+    for P, M in ((-500.0, 0.0), (-500.0, 50.0), (0.0, 50.0), (-1e-9, 1e-9)):
+        ratio, _, _ = engine.capacity_ratio(results, 'x', P, M)
+        assert ratio >= 0.0
+
+
+def test_capacity_ratio_degenerate_section_fails(engine, results):
+    degenerate = {**results, 'fc': 0.0, 'fy': 0.0}
+    ratio, _, _ = engine.capacity_ratio(degenerate, 'x', 100.0, 10.0)
+    assert ratio == math.inf
+
+
+SECTIONS = [
+    dict(DEFAULT_INPUTS),
+    {**DEFAULT_INPUTS, 'width': 300.0, 'height': 600.0, 'fc': 40.0, 'rebar_x': 'DB20', 'num_bars_y': 4},
+    {**DEFAULT_INPUTS, 'width': 400.0, 'height': 400.0, 'fy': 500.0, 'corner_rebar': 'DB32', 'num_bars_x': 2},
+]
+
+
+def test_batch_calculations_match_scalar(engine):
+    np = pytest.importorskip("numpy")
+    columns = {key: np.array([section[key] for section in SECTIONS]) for key in DEFAULT_INPUTS}
+    batch = engine.perform_calculations_batch(columns)
+    for i, section in enumerate(SECTIONS):
+        scalar = engine.perform_calculations(section)
+        for key, values in batch.items():
+            assert values[i] == pytest.approx(scalar[key]), key
+
+
+@pytest.mark.parametrize("direction", ['x', 'y'])
+def test_batch_curve_matches_scalar_curve(engine, direction):
+    np = pytest.importorskip("numpy")
+    from column_loads import curve_capacity_ratio, curves_capacity_ratio
+
+    columns = {key: np.array([section[key] for section in SECTIONS]) for key in DEFAULT_INPUTS}
+    batch = {**columns, **engine.perform_calculations_batch(columns)}
+    M_curves, P_curves = engine.calculate_pm_interaction_batch(batch, direction, num_points=2000)
+
+    angles = np.linspace(-0.4 * math.pi, 0.5 * math.pi, 25)
+    P, M = 1000 * np.sin(angles), 1000 * np.cos(angles)
+    dense = curves_capacity_ratio(M_curves, P_curves, M, P, design_tension(batch['fy'], batch['As_provided']))
+    for i, section in enumerate(SECTIONS):
+        results = engine.perform_calculations(section)
+        M_curve, P_curve = engine.calculate_pm_interaction(results, direction)
+        scalar = curve_capacity_ratio(M_curve, P_curve, M, P, design_tension(results['fy'], results['As_provided']))
+        assert dense[i] == pytest.approx(scalar, rel=2e-3)
+
+
+@pytest.mark.parametrize("direction", ['x', 'y'])
+def test_capacity_ratios_match_dense_curve(engine, direction):
+    np = pytest.importorskip("numpy")
+    from column_loads import curve_capacity_ratio
+
+    angles = np.linspace(-0.45 * math.pi, 0.49 * math.pi, 40)
+    P, M = 2500 * np.sin(angles), 400 * np.cos(angles)
+    for section in SECTIONS:
+        results = engine.perform_calculations(section)
+        M_curve, P_curve = engine.calculate_pm_interaction_batch(results, direction, num_points=4000)
+        dense = curve_capacity_ratio(M_curve[0], P_curve[0], M, P,
+                                     design_tension(results['fy'], results['As_provided']))
+        exact = engine.capacity_ratios(results, direction, P, M)
+        assert exact == pytest.approx(dense, rel=1e-3)
+
+
+def test_brent_root_finds_bracketed_root():
+    root, evaluations = brent_root(lambda x: x ** 3 - 2 * x - 5, 2.0, 3.0, xtol=1e-14)
+    assert root == pytest.approx(2.0945514815423265, abs=1e-12)
+    assert evaluations < 15
+
+    with pytest.raises(ValueError):
+        brent_root(lambda x: x * x + 1, -1.0, 1.0)
+
+
+def test_array_rebar_getters_match_scalar(engine):
+    names = ['DB25', 'DB12', 'DB25', 'RB9', 'DB32']
+    assert list(engine.get_rebar_areas(names)) == [engine.get_rebar_area(name) for name in names]
+    assert list(engine.get_rebar_diameters(names)) == [engine.get_rebar_diameter(name) for name in names]
+
+
+@pytest.mark.parametrize("direction", ['x', 'y'])
+def test_capacity_ratio_is_one_on_the_curve_and_scales_along_the_ray(engine, results, direction):
+    limits = engine.pm_limits(results, direction)
+    assert engine.capacity_ratio(results, direction, 0.0, limits['M_zero'])[0] == pytest.approx(1.0, rel=1e-6)
+    assert engine.capacity_ratio(results, direction, limits['P_cap'], limits['M_cap'])[0] == pytest.approx(1.0, rel=1e-6)
+
+    # The ratio is linear along the load ray
+    P, M = 1500.0, 120.0
+    ratio = engine.capacity_ratio(results, direction, P, M)[0]
+    assert engine.capacity_ratio(results, direction, 0.5 * P, 0.5 * M)[0] == pytest.approx(0.5 * ratio, rel=1e-6)
+    assert engine.capacity_ratio(results, direction, 2 * P, -2 * M)[0] == pytest.approx(2 * ratio, rel=1e-6)
+
+
+def test_pm_sweep_matches_hand_calculation_and_broadcasts(engine):
+    np = pytest.importorskip("numpy")
+    # c = 200 mm in a 500 × 500 section: both steel layers yield
+    As = 5 * 491
+    a = (0.85 - 0.05 * 2 / 7) * 200
+    Cc = 0.85 * 30 * a * 500
+    Pn, Mn = engine.pm_sweep(30.0, 420.0, 500.0, 500.0, As, As, 50.0, 200.0)
+    assert float(Pn) == pytest.approx(Cc / 1000)
+    assert float(Mn) == pytest.approx((Cc * (250 - a / 2) + 2 * 420 * As * 200) / 1e6)
+
+    # Sections down one axis, depths along the other
+    fc = np.array([[25.0], [30.0], [40.0]])
+    c = np.geomspace(10.0, 1500.0, 50)
+    Pn, Mn = engine.pm_sweep(fc, 420.0, 500.0, 500.0, As, As, 50.0, c)
+    assert Pn.shape == Mn.shape == (3, 50)
+    assert np.all(np.diff(Pn, axis=1) > 0)
+    assert Pn[1] == pytest.approx(engine.pm_sweep(30.0, 420.0, 500.0, 500.0, As, As, 50.0, c)[0])
+
+
+def test_batch_broadcasts_scalars_and_defaults(engine):
+    np = pytest.importorskip("numpy")
+    P = np.array([500.0, 2000.0, 6000.0])
+    batch = engine.perform_calculations_batch({'P': P, 'rebar_x': 'DB20'})
+    assert batch['utilization'].shape == (3,)
+    for i, load in enumerate(P):
+        scalar = engine.perform_calculations({**DEFAULT_INPUTS, 'P': load, 'rebar_x': 'DB20'})
+        assert batch['utilization'][i] == pytest.approx(scalar['utilization'])
+        assert batch['As_provided'][i] == pytest.approx(scalar['As_provided'])
@@ -0,0 +1,76 @@
+"""Tests for the fiber-section strain-compatibility engine"""
+
+import math
+
+import pytest
+
+from column_engine import DEFAULT_INPUTS
+from column_fiber import FiberSection, bar_layout
+
+
+@pytest.fixture(scope="module")
+def two_layer():
+    # 500 × 500, fc' 30, three DB25 on each of the top and bottom faces only
+    inputs = {**DEFAULT_INPUTS, 'num_bars_x': 3, 'num_bars_y': 2}
+    return FiberSection(inputs, nx=200, ny=200)
+
+
+def test_bar_layout_matches_preview():
+    xs, ys, areas, names = bar_layout(DEFAULT_INPUTS)
+    # 4 corners, one intermediate bar on each face
+    assert len(xs) == 8
+    assert sorted(set(xs)) == [-200.0, 0.0, 200.0]
+    assert sorted(set(ys)) == [-200.0, 0.0, 200.0]
+    assert sum(areas) == 8 * 491
+    assert names.count('DB25') == 8
+
+
+def test_pure_axial_capacity(two_layer):
+    # P0 = 0.85 fc' (Ag - As) + fy As
+    As = 6 * 491
+    P0 = (0.85 * 30 * (500 * 500 - As) + 420 * As) / 1000
+    assert two_layer.P0 == pytest.approx(P0)
+    Pn, Mnx, Mny = two_layer.analyze(math.pi / 2, 1e6)
+    assert float(Pn) == pytest.approx(P0)
+    assert float(Mnx) == pytest.approx(0.0, abs=1e-6)
+    assert float(Mny) == pytest.approx(0.0, abs=1e-6)
+
+
+def test_pure_tension(two_layer):
+    Pn, Mnx, Mny = two_layer.analyze(math.pi / 2, 1e-3)
+    assert float(Pn) == pytest.approx(-420 * 6 * 491 / 1000)
+    assert float(Mnx) == pytest.approx(0.0, abs=1e-6)
+
+
+def test_uniaxial_point_matches_hand_calculation(two_layer):
+    # c = 200 mm: both layers yield (εs = 0.00375, ε's = 0.00225 > fy/Es)
+    c, As_layer = 200.0, 3 * 491
+    beta1 = 0.85 - 0.05 * (30 - 28) / 7
+    a = beta1 * c
+    Cc = 0.85 * 30 * a * 500
+    Cs = (420 - 0.85 * 30) * As_layer
+    Ts = 420 * As_layer
+    Pn = (Cc + Cs - Ts) / 1000
+    Mn = (Cc * (250 - a / 2) + (Cs + Ts) * 200) / 1e6
+
+    Pn_fiber, Mnx, Mny = two_layer.analyze(math.pi / 2, c)
+    assert float(Pn_fiber) == pytest.approx(Pn, rel=0.01)
+    assert float(Mnx) == pytest.approx(Mn, rel=0.01)
+    assert float(Mny) == pytest.approx(0.0, abs=1e-6)
+
+
+def test_symmetric_section_gives_symmetric_surface(two_layer):
+    Pn, Mnx, Mny = two_layer.interaction_surface(n_angles=8, n_depths=20)
+    assert Pn.shape == (8, 20)
+    # θ and θ + π mirror each other on a doubly symmetric section
+    assert Pn[:4] == pytest.approx(Pn[4:])
+    assert Mnx[:4] == pytest.approx(-Mnx[4:], abs=1e-9)
+    assert Mny[:4] == pytest.approx(-Mny[4:], abs=1e-9)
+
+
+
+def test_uniaxial_curve_runs_from_tension_to_compression(two_layer):
+    M, P = two_layer.uniaxial_curve('x', n_depths=40)
+    assert list(P) == sorted(P)
+    assert P[0] < 0 < P[-1] <= two_layer.P0
+    assert min(M) >= 0
@@ -0,0 +1,65 @@
+"""Tests for the GUI's analysis and report text (no Tk window is created)"""
+
+import pytest
+
+pytest.importorskip("tkinter")
+
+from column_engine import ColumnDesignEngine, DEFAULT_INPUTS
+from professional_column_design import ProfessionalColumnDesign
+
+
+@pytest.fixture(scope="module")
+def app():
+    app = ProfessionalColumnDesign.__new__(ProfessionalColumnDesign)
+    app.engine = ColumnDesignEngine()
+    app.last_results = None
+    app.report_images = None
+    app.section_preview_drawing = None
+    app.pm_diagrams_drawing = None
+    return app
+
+
+def test_bending_failure_is_not_reported_acceptable(app):
+    results = app.perform_calculations({**DEFAULT_INPUTS, 'P': 1000.0, 'Mx': 800.0, 'My': 50.0})
+    assert results['utilization'] < 100
+    assert results['utilization_x'] > 100
+    assert results['governing_utilization'] == pytest.approx(results['utilization_x'])
+
+    analysis = app.format_analysis_results(results)
+    assert 'DESIGN STATUS: ⚠️ OVER-UTILIZED' in analysis
+
+    app.last_results = results
+    report = app.format_full_report()
+    assert '❌ INADEQUATE CAPACITY' in report
+    assert 'CRITICAL ISSUES' in report
+
+
+def test_default_column_is_reported_safe(app):
+    results = app.perform_calculations(dict(DEFAULT_INPUTS))
+    assert results['governing_utilization'] <= 100
+    assert 'DESIGN STATUS: ✅ SAFE' in app.format_analysis_results(results)
+
+
+SLENDER = {**DEFAULT_INPUTS, 'width': 400.0, 'height': 400.0, 'length': 6.0, 'P': 1500.0, 'Mx': 100.0, 'My': 60.0}
+
+
+def test_interaction_check_uses_magnified_moments(app):
+    results = app.perform_calculations(SLENDER)
+    assert not results['unstable']
+    assert results['Mcx'] > results['Mx'] and results['Mcy'] > results['My']
+    ratio_x = app.engine.capacity_ratio(results, 'x', results['P'], results['Mcx'])[0]
+    assert results['utilization_x'] == pytest.approx(ratio_x * 100)
+    assert f"Mcx = {results['Mcx']:.1f}" in app.format_analysis_results(results)
+
+
+def test_unstable_column_fails(app):
+    # lu = 10 m: Pc ≈ 1,355 kN, so Pu = 2,000 kN > 0.75 Pc
+    results = app.perform_calculations({**SLENDER, 'length': 10.0, 'P': 2000.0})
+    assert results['unstable']
+    assert results['governing_utilization'] == float('inf')
+    analysis = app.format_analysis_results(results)
+    assert 'column unstable' in analysis
+    assert 'DESIGN STATUS: ⚠️ OVER-UTILIZED' in analysis
+
+    app.last_results = results
+    assert '❌ INADEQUATE CAPACITY' in app.format_full_report()
@@ -0,0 +1,53 @@
+"""Tests for the load-combination checks (design strength, φ per ACI 318M-25 21.2)"""
+
+import pytest
+
+from column_engine import ColumnDesignEngine, DEFAULT_INPUTS
+from column_loads import check_load_combinations
+
+
+# Default 500 × 500 section, bending about x: fc' = 30 MPa, fy = 420 MPa,
+# d = 450 mm, d' = 50 mm, 5 DB25 per face (As = As' = 2455 mm²),
+# β1 = 0.85 - 0.05 × 2/7 = 0.8357. In both cases below the compression
+# steel yields (fs' = fy), so the steel forces cancel and Pn = 0.85 fc' a b.
+#
+# Balanced, c = 0.003 × 450 / (0.003 + 0.0021) = 264.71 mm, εt = εty, φ = 0.65:
+#   a = 221.22 mm, Pn = 2820.5 kN
+#   Mn = 2820.5 × (250 - 110.61) + 2 × 2455 × 420 × 200 = 805.6 kN⋅m
+# Tension-controlled, c = 0.003 × 450 / (0.003 + 0.0021 + 0.003) = 166.67 mm, φ = 0.90:
+#   a = 139.29 mm, Pn = 1775.9 kN
+#   Mn = 1775.9 × (250 - 69.64) + 2 × 2455 × 420 × 200 = 732.7 kN⋅m
+DESIGN_POINTS = [
+    (0.65 * 2820.54, 0.65 * 805.597),
+    (0.90 * 1775.89, 0.90 * 732.735),
+]
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return ColumnDesignEngine()
+
+
+@pytest.mark.parametrize("phi_P, phi_M", DESIGN_POINTS)
+@pytest.mark.parametrize("exact", [True, False])
+def test_design_point_is_on_the_curve(engine, phi_P, phi_M, exact):
+    check = check_load_combinations(engine, dict(DEFAULT_INPUTS), [[phi_P, phi_M, 0.0]], exact=exact)
+    assert check['utilization_x'][0] == pytest.approx(100.0, abs=0.5 if not exact else 1e-3)
+
+
+def test_nominal_point_is_not_accepted(engine):
+    # The nominal balanced point is 1/φ beyond the design curve
+    check = check_load_combinations(engine, dict(DEFAULT_INPUTS), [[2820.54, 805.597, 0.0]], exact=True)
+    assert check['utilization_x'][0] == pytest.approx(100.0 / 0.65, rel=1e-4)
+
+
+def test_design_axial_and_tension_limits(engine):
+    results = engine.perform_calculations(dict(DEFAULT_INPUTS))
+    limits = engine.pm_limits(results, 'x')
+    P0 = (0.85 * 30 * (results['Ag'] - results['As_provided']) + 420 * results['As_provided']) / 1000
+    assert limits['P_cap'] == pytest.approx(0.80 * 0.65 * P0)
+    assert limits['P_tension'] == pytest.approx(0.90 * 420 * results['As_provided'] / 1000)
+
+    check = check_load_combinations(engine, dict(DEFAULT_INPUTS), [[limits['P_cap'], 0.0, 0.0],
+                                                                   [-limits['P_tension'], 0.0, 0.0]])
+    assert check['utilization_x'] == pytest.approx([100.0, 100.0])
@@ -0,0 +1,44 @@
+"""Tests for the reinforcement optimizer"""
+
+import numpy as np
+import pytest
+
+from column_engine import DEFAULT_INPUTS
+from column_optimizer import ColumnOptimizer, column_mass
+
+
+def brute_force(optimizer, inputs, loads):
+    """Lightest passing mass by checking every candidate of every section"""
+    loads = np.asarray(loads, dtype=float).reshape(-1, 3)
+    inputs = {**inputs, 'P': float(loads[:, 0].max())}
+    best = np.inf
+    for width, height in optimizer._sections(inputs):
+        combos, batch = optimizer._steel_candidates(inputs, float(width), float(height))
+        if not combos:
+            continue
+        utilization = optimizer._utilization(batch, np.arange(len(combos)), loads)
+        passing = utilization <= optimizer.max_utilization
+        if passing.any():
+            best = min(best, column_mass(width * height, batch['As_provided'])[passing].min())
+    return best
+
+
+@pytest.fixture(scope="module")
+def optimizer():
+    return ColumnOptimizer(sizes=[300, 350, 400, 450], bar_sizes=['DB12', 'DB20', 'DB25', 'DB32'],
+                           bar_counts=[2, 3, 4, 5])
+
+
+@pytest.mark.parametrize("loads", [
+    [[3000, 50, 300]],
+    [[800, 0, 450]],
+    [[2000, 150, 20]],
+    [[2500, 200, 0], [1200, 0, 250]],
+])
+def test_optimizer_matches_brute_force(optimizer, loads):
+    result = optimizer.optimize(dict(DEFAULT_INPUTS), loads)
+    expected = brute_force(optimizer, DEFAULT_INPUTS, loads)
+    if np.isinf(expected):
+        assert result['inputs'] is None
+    else:
+        assert result['mass_per_m'] == pytest.approx(expected)
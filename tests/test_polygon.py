@@ -0,0 +1,76 @@
+"""Tests for polygon sections"""
+
+import math
+
+import numpy as np
+import pytest
+
+from column_engine import DEFAULT_INPUTS
+from column_fiber import FiberSection, bar_layout
+from column_loads import curve_moment_capacity
+from column_polygon import PolygonSection, circle, circular_bars, rectangle, t_shape
+
+
+@pytest.fixture(scope="module")
+def tee():
+    # 800 × 150 flange on a 300 × 600 web; more steel in the flange than in the web
+    bars = ([(x, 560, 'DB25') for x in (-350, -175, 0, 175, 350)] +
+            [(x, 40, 'DB25') for x in (-110, 0, 110)])
+    return PolygonSection(t_shape(800, 150, 300, 600), bars, 30, 420)
+
+
+def test_unsymmetric_section_has_two_moment_branches(tee):
+    flange = curve_moment_capacity(*tee.pm_curve('x'), [2000.0], tee.P_tension)[0]
+    web = curve_moment_capacity(*tee.pm_curve('x', negative=True), [2000.0], tee.P_tension)[0]
+    assert web < 0.9 * flange
+
+    # Symmetric about the vertical axis, so both signs of My match
+    right = curve_moment_capacity(*tee.pm_curve('y'), [2000.0], tee.P_tension)[0]
+    left = curve_moment_capacity(*tee.pm_curve('y', negative=True), [2000.0], tee.P_tension)[0]
+    assert left == pytest.approx(right, rel=1e-6)
+
+
+def test_check_loads_uses_the_branch_for_the_moment_sign(tee):
+    flange = curve_moment_capacity(*tee.pm_curve('x'), [2000.0], tee.P_tension)[0]
+    web = curve_moment_capacity(*tee.pm_curve('x', negative=True), [2000.0], tee.P_tension)[0]
+    M = 0.5 * (flange + web)
+    check = tee.check_loads([[2000.0, M, 0.0], [2000.0, -M, 0.0]])
+    assert check['utilization_x'][0] < 100.0
+    assert check['utilization_x'][1] > 100.0
+    assert check['governing_index'] == 1
+
+
+def test_rectangle_matches_fiber_section():
+    inputs = {**DEFAULT_INPUTS, 'width': 400.0, 'height': 600.0}
+    xs, ys, areas, _ = bar_layout(inputs)
+    polygon = PolygonSection(rectangle(400, 600), list(zip(xs, ys, areas)), inputs['fc'], inputs['fy'])
+    fiber = FiberSection(inputs, nx=200, ny=200)
+    assert polygon.P0 == pytest.approx(fiber.P0)
+
+    theta = np.array([0.0, 0.3, math.pi / 2, 2.0, math.pi])[:, None]
+    c = np.geomspace(30, 1500, 12)[None, :]
+    # The fiber mesh only approximates the stress block edge; 1% of the largest value
+    for exact, meshed in zip(polygon.analyze(theta, c), fiber.analyze(theta, c)):
+        assert np.abs(exact - meshed).max() <= 0.01 * np.abs(meshed).max()
+
+
+def test_hollow_circular_spiral_section():
+    bars = circular_bars(8, 600, 50, 'DB25', bar_diameter=25)
+    section = PolygonSection(circle(600), bars, 30, 420, holes=[circle(300)], spiral=True)
+
+    Ag = math.pi / 4 * (600 ** 2 - 300 ** 2)
+    As = 8 * 491
+    assert section.Ag == pytest.approx(Ag)
+    assert section.centroid == pytest.approx((0.0, 0.0), abs=1e-9)
+    assert section.P0 == pytest.approx((0.85 * 30 * (Ag - As) + 420 * As) / 1000)
+    assert section.P_cap == pytest.approx(0.85 * section.P0)
+    assert section.design_cap == pytest.approx(0.75 * 0.85 * section.P0)
+    assert section.P_tension == pytest.approx(0.9 * 420 * As / 1000)
+
+    # Bars on a circle of radius 300 - 50 - 12.5
+    assert np.hypot(section.bar_x, section.bar_y) == pytest.approx(np.full(8, 237.5))
+
+
+def test_rejects_section_without_area():
+    with pytest.raises(ValueError):
+        PolygonSection(rectangle(400, 400), [], 30, 420, holes=[rectangle(400, 400)])
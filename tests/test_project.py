@@ -0,0 +1,78 @@
+"""Tests for project files"""
+
+import numpy as np
+import pytest
+
+from column_project import ALIGN, CATEGORY_LIMIT, ProjectFile, save_project, set_row
+
+
+@pytest.fixture
+def tables():
+    columns = [{'id': f"C{i}", 'width': 400.0 + 50 * i, 'num_bars_x': 3 + i % 2,
+                'rebar_x': 'DB25' if i % 2 else 'DB20', 'tie_spacing_ok': i != 2}
+               for i in range(5)]
+    loads = {'case': np.array(['1.4D', '1.2D+1.6L']), 'P': np.array([1500.0, 2100.0])}
+    return {'columns': columns, 'loads': loads}
+
+
+def test_save_and_read_round_trip(tmp_path, tables):
+    filename = str(tmp_path / "project.cdp")
+    save_project(filename, tables, meta={'source': 'test'})
+
+    with ProjectFile(filename) as project:
+        assert project.meta == {'source': 'test'}
+        assert project.tables() == ['columns', 'loads']
+        assert project.rows('columns') == 5 and project.rows('missing') == 0
+        assert project.page('columns', 0, 5) == tables['columns']
+        assert project.row('columns', 3) == tables['columns'][3]
+        assert project.column('columns', 'width', 1, 3).tolist() == [450.0, 500.0]
+        assert project.column('loads', 'case').tolist() == ['1.4D', '1.2D+1.6L']
+        assert project.column('loads', 'P').tolist() == [1500.0, 2100.0]
+
+
+def test_set_row_and_resave(tmp_path, tables):
+    filename = str(tmp_path / "project.cdp")
+    save_project(filename, tables)
+    with ProjectFile(filename) as project:
+        edited = project.read_all()
+
+    set_row(edited, 'columns', 1, {'width': 900.0, 'rebar_x': 'DB32'})
+    set_row(edited, 'columns', 6, {'id': 'C6', 'width': 300.0})
+    save_project(filename, edited)
+
+    with ProjectFile(filename) as project:
+        assert project.rows('columns') == 7
+        assert project.row('columns', 1)['width'] == 900.0
+        assert project.row('columns', 1)['rebar_x'] == 'DB32'
+        assert project.row('columns', 1)['id'] == 'C1'
+        added = project.row('columns', 6)
+        assert added['id'] == 'C6' and added['width'] == 300.0
+        assert project.row('columns', 5)['id'] == ''
+
+
+def test_rejects_other_files(tmp_path):
+    other = tmp_path / "other.cdp"
+    other.write_bytes(b"not a project file")
+    with pytest.raises(ValueError):
+        ProjectFile(str(other))
+
+
+def test_fields_are_aligned_typed_and_zero_copy(tmp_path, tables):
+    filename = str(tmp_path / "project.cdp")
+    ids = [f"ID{i:04d}" for i in range(CATEGORY_LIMIT + 1)]
+    save_project(filename, {**tables, 'labels': {'id': np.array(ids)}})
+
+    with ProjectFile(filename) as project:
+        fields = project.header['tables']['columns']['fields']
+        assert all(entry['offset'] % ALIGN == 0 for entry in fields.values())
+        assert fields['num_bars_x']['dtype'] == '<i4'
+        assert fields['tie_spacing_ok']['dtype'] == '|b1'
+        assert fields['rebar_x']['categories'] == ['DB20', 'DB25']
+
+        width = project.raw('columns', 'width')
+        assert not width.flags.writeable and not width.flags.owndata
+        assert project.raw('columns', 'rebar_x').tolist() == [0, 1, 0, 1, 0]
+
+        # Too many distinct strings for categories: stored as fixed-width UTF-8
+        assert 'encoding' in project.header['tables']['labels']['fields']['id']
+        assert project.column('labels', 'id', 255, 257).tolist() == ids[255:257]
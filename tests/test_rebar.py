@@ -0,0 +1,52 @@
+"""Tests for the rebar catalog and the engine's rebar getters"""
+
+import math
+
+import pytest
+
+from column_engine import ColumnDesignEngine
+from column_rebar import DEFAULT_CATALOG, RebarCatalog, make_spec
+
+
+def test_default_getters_return_ints():
+    engine = ColumnDesignEngine()
+    assert engine.get_rebar_diameter('DB25') == 25
+    assert isinstance(engine.get_rebar_diameter('DB25'), int)
+    assert isinstance(engine.get_rebar_strength('RB9'), int)
+    assert engine.get_rebar_strength('RB9') == 240
+    assert engine.get_rebar_area('DB25') == 491
+
+
+def test_loaded_catalog_keeps_whole_values_as_ints(tmp_path):
+    path = tmp_path / "metric.csv"
+    path.write_text("name,area,diameter,fy,unit_mass,longitudinal,tie\n"
+                    "D19,284,19.0,420,,1,0\n"
+                    "D10,71.3,10,420,,0,1\n", encoding='utf-8')
+    catalog = RebarCatalog.from_file(str(path))
+    engine = ColumnDesignEngine(rebar_catalog=catalog)
+
+    assert isinstance(engine.get_rebar_diameter('D19'), int)
+    assert isinstance(engine.get_rebar_strength('D19'), int)
+    assert engine.get_rebar_area('D10') == pytest.approx(71.3)
+    assert catalog['D19'].unit_mass == pytest.approx(284e-6 * 7850)
+    assert catalog.longitudinal_names() == ['D19']
+    assert catalog.tie_names() == ['D10']
+    assert list(engine.get_rebar_diameters(['D19', 'D10', 'D19'])) == [19, 10, 19]
+
+
+def test_bundles_use_equivalent_diameter():
+    catalog = DEFAULT_CATALOG.with_bundles(['DB25'], [2])
+    bundle = catalog['2-DB25']
+    assert bundle.area == 982
+    assert bundle.diameter == pytest.approx(25 * math.sqrt(2))
+    assert bundle.longitudinal and not bundle.tie
+    assert f"{bundle.diameter:g}" == "35.3553"
+
+
+def test_catalog_is_read_only_and_rejects_duplicates():
+    with pytest.raises(TypeError):
+        DEFAULT_CATALOG._specs['DB99'] = make_spec('DB99', 1, 1, 420)
+    with pytest.raises(ValueError):
+        RebarCatalog([make_spec('D10', 78.5, 10, 420), make_spec('D10', 78.5, 10, 420)])
+    assert 'DB25' in DEFAULT_CATALOG
+    assert DEFAULT_CATALOG.get('DB99') is None
@@ -0,0 +1,114 @@
+"""Tests for the report images and the schedule PDF"""
+
+import pytest
+
+from column_engine import ColumnDesignEngine, DEFAULT_INPUTS
+from column_report import (SECTION_DRAWING_SIZE, ReportImageCache, _render_column, design_status, export_schedule_pdf,
+                           image_signature, pm_drawing, section_drawing)
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return ColumnDesignEngine()
+
+
+@pytest.fixture(scope="module")
+def bending_failure(engine):
+    # Light axial load, large moment: fine axially, fails the P-Mx check
+    return engine.perform_calculations({**DEFAULT_INPUTS, 'P': 1000.0, 'Mx': 800.0, 'My': 50.0})
+
+
+def test_status_fails_on_bending_with_low_axial_utilization(engine, bending_failure):
+    assert bending_failure['utilization'] < 100
+    governing = engine.governing_utilization(bending_failure)
+    ratio_x = engine.capacity_ratio(bending_failure, 'x', 1000.0, 800.0)[0]
+    assert governing == pytest.approx(ratio_x * 100)
+    assert governing > 100
+    assert not design_status(bending_failure, engine)
+
+
+def test_status_passes_default_column(engine):
+    results = engine.perform_calculations(dict(DEFAULT_INPUTS))
+    assert engine.governing_utilization(results) <= 100
+    assert design_status(results, engine)
+
+
+def test_schedule_row_and_drawing_report_bending_failure(engine, bending_failure):
+    row = {'id': 'C1', 'P': 1000.0, 'Mx': 800.0, 'My': 50.0}
+    results, _, _, error = _render_column(row)
+    assert error is None
+    assert results['governing_utilization'] > 100
+    assert not design_status(results)
+
+    pytest.importorskip("reportlab")
+    title = pm_drawing(bending_failure, engine).contents[0].text
+    assert 'UNSAFE' in title
+
+
+def test_image_cache_renders_each_image_once(engine):
+    pytest.importorskip("matplotlib")
+    images = ReportImageCache(engine=engine, dpi=50)
+    results = engine.perform_calculations(dict(DEFAULT_INPUTS))
+
+    section = images.section_png(results)
+    pm = images.pm_png(results)
+    assert section.startswith(b'\x89PNG') and pm.startswith(b'\x89PNG')
+    assert images.section_png(dict(results)) is section
+    assert images.pm_png(dict(results)) is pm
+    assert images.stats()['renders'] == 2
+
+    # A new load redraws the P-M diagrams but not the section
+    loaded = engine.perform_calculations({**DEFAULT_INPUTS, 'P': 3000.0})
+    assert images.section_png(loaded) is section
+    assert images.pm_png(loaded) is not pm
+    assert images.stats()['renders'] == 3
+
+
+def test_image_signature_depends_on_kind_and_values():
+    results = {'width': 500.0, 'height': 500.0}
+    keys = ('width', 'height')
+    assert image_signature('section', results, keys) == image_signature('section', {'width': 500, 'height': 500}, keys)
+    assert image_signature('section', results, keys) != image_signature('pm', results, keys)
+    assert image_signature('section', results, keys) != image_signature('section', {**results, 'width': 600}, keys)
+    assert image_signature('section', results, keys) != image_signature('section', results, keys, dpi=300)
+
+
+def test_schedule_pdf_lists_errors_and_reports_progress(engine, tmp_path):
+    pytest.importorskip("reportlab")
+    rows = [{'id': 'C1'}, {'id': 'C2', 'P': 3000.0}, {'id': 'C3', 'error': 'unstable'}]
+    fractions = []
+    filename = tmp_path / "schedule.pdf"
+    info = export_schedule_pdf(rows, str(filename), workers=1, engine=engine, progress=fractions.append)
+
+    assert info['columns'] == 3
+    assert info['errors'] == 1
+    assert info['pages'] >= 3
+    assert filename.read_bytes().startswith(b'%PDF')
+    assert fractions == [0.0, 1 / 3, 2 / 3]
+
+
+def test_section_drawing_draws_every_bar(engine):
+    pytest.importorskip("reportlab")
+    from reportlab.graphics.shapes import Circle, Drawing
+
+    results = engine.perform_calculations(dict(DEFAULT_INPUTS))
+    drawing = section_drawing(results, engine)
+    assert isinstance(drawing, Drawing)
+    assert (drawing.width, drawing.height) == SECTION_DRAWING_SIZE
+    circles = [shape for shape in drawing.contents if isinstance(shape, Circle)]
+    # 4 corners and one intermediate bar per face, plus 3 legend markers
+    assert len(circles) == 8 + 3
+
+
+def test_pm_drawing_marks_the_design_moments(engine):
+    pytest.importorskip("reportlab")
+    from reportlab.graphics.charts.lineplots import LinePlot
+
+    results = engine.perform_calculations(dict(DEFAULT_INPUTS))
+    results.update({'Mcx': 150.0, 'Mcy': 90.0, 'governing_utilization': 50.0})
+    curves = ([0.0, 300.0, 0.0], [-1000.0, 1000.0, 4000.0]) * 2
+    drawing = pm_drawing(results, engine, curves=curves)
+    plots = [shape for shape in drawing.contents if isinstance(shape, LinePlot)]
+    assert [plot.data[1] for plot in plots] == [[(150.0, 2000.0)], [(90.0, 2000.0)]]
+    assert plots[0].data[0] == [(0.0, -1000.0), (300.0, 1000.0), (0.0, 4000.0)]
+    assert 'SAFE (Utilization: 50.0%)' in drawing.contents[0].text
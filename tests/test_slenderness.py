@@ -0,0 +1,48 @@
+"""Tests for slenderness moment magnification against hand calculations"""
+
+import math
+
+import pytest
+
+from column_slenderness import magnify_storey
+
+# 400 × 400 mm, fc' = 30 MPa, βdns = 0.6, k = 1:
+# Ec = 4700 √30 = 25,742.96 MPa, Ig = 400⁴ / 12 = 2.1333e9 mm⁴
+# EI_eff = 0.4 Ec Ig / 1.6 = 1.37296e13 N⋅mm²
+EI_EFF = 0.4 * 4700 * math.sqrt(30) * 400 ** 4 / 12 / 1.6
+SECTION = {'width': 400.0, 'height': 400.0, 'fc': 30.0}
+
+
+def test_cm_uses_the_aci_sign_convention():
+    # lu = 6 m: klu/r = 6000 / 115.47 = 52.0 > 40, slender for any M1/M2
+    Pc = math.pi ** 2 * EI_EFF / 6000 ** 2 / 1000  # 3,764 kN
+    P, M = 2000.0, 100.0  # M above M2,min = 2000 (15 + 12) / 1000 = 54 kN⋅m
+    denominator = 1 - P / (0.75 * Pc)
+
+    single = magnify_storey({**SECTION, 'length': 6.0}, [P], [M], [M], M1_M2_x=-0.5, M1_M2_y=-0.5)
+    double = magnify_storey({**SECTION, 'length': 6.0}, [P], [M], [M], M1_M2_x=0.5, M1_M2_y=0.5)
+
+    # Single curvature: Cm = 0.6 - 0.4 (-0.5) = 0.8; double: Cm = 0.6 - 0.4 (0.5) = 0.4
+    assert single['Pc_x'][0] == pytest.approx(Pc)
+    assert single['delta_x'][0] == pytest.approx(0.8 / denominator)
+    assert double['delta_x'][0] == pytest.approx(0.4 / denominator)
+    assert single['Mx'][0] == pytest.approx(0.8 / denominator * M)
+    assert single['delta_x'][0] > double['delta_x'][0]
+
+
+def test_default_ratio_is_single_curvature_with_unit_cm():
+    Pc = math.pi ** 2 * EI_EFF / 6000 ** 2 / 1000
+    magnified = magnify_storey({**SECTION, 'length': 6.0}, [2000.0], [100.0], [100.0])
+    assert magnified['delta_x'][0] == pytest.approx(1.0 / (1 - 2000.0 / (0.75 * Pc)))
+
+
+def test_slenderness_limit_uses_the_aci_sign_convention():
+    # lu = 3.5 m: klu/r = 3500 / 115.47 = 30.3
+    # Single curvature: 34 + 12 (-0.5) = 28 < 30.3, slender
+    # Double curvature: 34 + 12 (0.5) = 40 > 30.3, short
+    columns = {**SECTION, 'length': 3.5}
+    single = magnify_storey(columns, [2000.0], [100.0], [100.0], M1_M2_x=-0.5, M1_M2_y=-0.5)
+    double = magnify_storey(columns, [2000.0], [100.0], [100.0], M1_M2_x=0.5, M1_M2_y=0.5)
+    assert single['slender_x'][0] and not double['slender_x'][0]
+    assert double['delta_x'][0] == 1.0
+    assert double['Mx'][0] == 100.0
@@ -0,0 +1,110 @@
+"""Tests for the SQLite result store"""
+
+import pytest
+
+from column_batch import run_schedule
+from column_engine import ColumnDesignEngine, DEFAULT_INPUTS
+from column_store import ResultStore
+
+
+@pytest.fixture
+def store():
+    with ResultStore() as store:
+        yield store
+
+
+@pytest.fixture
+def schedule():
+    rows = [{'id': f"C{i % 4}", 'storey': str(1 + i // 4), 'case': '1.2D+1.6L',
+             'width': 400.0, 'height': 400.0, 'P': 1000.0 + 300 * i, 'Mx': 60.0, 'My': 40.0}
+            for i in range(12)]
+    rows[5]['tie_spacing'] = 500.0
+    rows[7]['error'] = "Line 9: invalid height value '4OO'"
+    return rows, run_schedule(rows, workers=1)
+
+
+def test_run_round_trip(store, schedule):
+    rows, output = schedule
+    run_id = store.add_run(rows, output, source='test.csv')
+    assert store.runs()[0]['id'] == run_id and store.runs()[0]['rows'] == 12
+    assert store.count(run_id=run_id) == 12
+
+    stored = {row['row_index']: row for row in store.query(limit=100, run_id=run_id)}
+    for entry in output:
+        row = stored[entry['index']]
+        assert row['section_id'] == entry['id']
+        assert row['error'] == entry['error']
+        if entry['results'] is not None:
+            assert row['governing_utilization'] == pytest.approx(entry['results']['governing_utilization'])
+            assert row['P'] == rows[entry['index']]['P']
+
+
+def test_filters_and_paging(store, schedule):
+    rows, output = schedule
+    run_id = store.add_run(rows, output)
+    assert store.count(errors=True) == 1
+    assert store.count(tie_failures=True) == 1
+    assert store.count(level_from=2, level_to=3) == 8
+    assert store.count(section_id='C1') == 3
+    assert store.count(section_id='C*') == 12
+
+    utilization = sorted((entry['results']['governing_utilization'] for entry in output if entry['results']),
+                         reverse=True)
+    assert store.count(min_utilization=utilization[2]) == 3
+    pages = store.query(limit=5, errors=False) + store.query(limit=5, offset=5, errors=False)
+    assert [row['governing_utilization'] for row in pages] == pytest.approx(utilization[:10])
+
+    with pytest.raises(ValueError):
+        store.query(order_by='P; DROP TABLE results')
+    store.delete_run(run_id)
+    assert store.count() == 0 and store.runs() == []
+
+
+def test_magnified_run_stores_first_order_inputs(store):
+    from column_batch import magnify_rows
+    rows = [{'id': 'S1', 'width': 400.0, 'height': 400.0, 'length': 6.0,
+             'P': 1500.0, 'Mx': 100.0, 'My': 60.0}]
+    magnified = magnify_rows(rows)
+    assert magnified[0]['Mx'] == 100.0 and magnified[0]['Mcx'] > 100.0
+
+    run_id = store.add_run(magnified, run_schedule(magnified, workers=1))
+    stored = store.query(run_id=run_id)[0]
+    assert stored['Mx'] == 100.0 and stored['My'] == 60.0
+    assert stored['Mcx'] == pytest.approx(magnified[0]['Mcx'])
+    assert stored['Mcy'] == pytest.approx(magnified[0]['Mcy'])
+
+
+def test_old_store_gains_design_moment_columns(tmp_path):
+    import sqlite3
+    path = str(tmp_path / "old.db")
+    with ResultStore(path):
+        pass
+    connection = sqlite3.connect(path)
+    connection.execute("ALTER TABLE results DROP COLUMN Mcx")
+    connection.commit()
+    connection.close()
+
+    with ResultStore(path) as store:
+        columns = {row['name'] for row in store.connection.execute("PRAGMA table_info(results)")}
+        assert 'Mcx' in columns
+
+
+def test_single_result_persists_on_disk(tmp_path):
+    path = str(tmp_path / "results.db")
+    inputs = {**DEFAULT_INPUTS, 'P': 1000.0, 'Mx': 800.0}
+    engine = ColumnDesignEngine()
+    results = engine.perform_calculations(inputs)
+    results['governing_utilization'] = engine.governing_utilization(results)
+
+    with ResultStore(path) as store:
+        run_id = store.add_result(inputs, results, section_id='C7', level='3', load_case='1.4D', source='gui')
+
+    with ResultStore(path) as store:
+        assert store.runs()[0]['source'] == 'gui'
+        (row,) = store.query(run_id=run_id)
+        assert (row['section_id'], row['level'], row['load_case']) == ('C7', 3, '1.4D')
+        assert row['Mx'] == 800.0
+        # The governing (P-M) utilization, not the axial one
+        assert row['governing_utilization'] == pytest.approx(results['governing_utilization'])
+        assert row['governing_utilization'] > 100 > results['utilization']
+        assert store.count(min_utilization=100) == 1
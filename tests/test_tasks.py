@@ -0,0 +1,122 @@
+"""Tests for the background task runner (driven by a stand-in for the Tk root)"""
+
+import threading
+
+import pytest
+
+from column_tasks import POLL_MS, BackgroundTask, TaskCancelled
+
+
+class FakeRoot:
+    """Collects root.after callbacks so the test runs them as the main loop would"""
+
+    def __init__(self):
+        self.pending = []
+
+    def after(self, ms, callback):
+        assert ms == POLL_MS
+        self.pending.append(callback)
+
+    def run(self, task):
+        task._thread.join(timeout=5)
+        while self.pending and not task.finished:
+            self.pending.pop(0)()
+
+
+def test_result_reaches_main_thread_and_supersedes_progress():
+    root = FakeRoot()
+    events = []
+    main = threading.current_thread()
+
+    def work(task):
+        task.progress(0.5, "half")
+        task.progress(1.0, "all")
+        return 42
+
+    def on_done(result):
+        events.append(('done', result, threading.current_thread() is main))
+
+    task = BackgroundTask(root, work, on_done=on_done,
+                          on_progress=lambda fraction, message: events.append(('progress', fraction, message)))
+    task.start()
+    task._thread.join(timeout=5)
+    root.pending.pop(0)()
+    assert events == [('done', 42, True)]
+    assert task.finished
+
+
+def test_progress_is_delivered_while_running():
+    root = FakeRoot()
+    reported, release = threading.Event(), threading.Event()
+    progress = []
+
+    def work(task):
+        task.progress(0.25, "quarter")
+        reported.set()
+        release.wait(timeout=5)
+
+    task = BackgroundTask(root, work, on_progress=lambda *args: progress.append(args)).start()
+    reported.wait(timeout=5)
+    root.pending.pop(0)()
+    assert progress == [(0.25, "quarter")]
+    assert not task.finished and len(root.pending) == 1
+
+    release.set()
+    root.run(task)
+    assert task.finished
+
+
+def test_cancel_stops_work_at_next_progress():
+    root = FakeRoot()
+    started, release = threading.Event(), threading.Event()
+    events = []
+
+    def work(task):
+        started.set()
+        release.wait(timeout=5)
+        task.progress(0.5)
+        events.append('not reached')
+
+    task = BackgroundTask(root, work, on_done=lambda result: events.append('done'),
+                          on_cancel=lambda: events.append('cancelled')).start()
+    started.wait(timeout=5)
+    task.cancel()
+    release.set()
+    root.run(task)
+    assert task.cancelled
+    assert events == ['cancelled']
+
+
+def test_cancel_after_last_step_discards_result():
+    root = FakeRoot()
+    release = threading.Event()
+    events = []
+
+    def work(task):
+        release.wait(timeout=5)
+        return 'result'
+
+    task = BackgroundTask(root, work, on_done=events.append, on_cancel=lambda: events.append('cancelled')).start()
+    task.cancel()
+    release.set()
+    root.run(task)
+    assert events == ['cancelled']
+
+
+def test_errors_go_to_on_error():
+    root = FakeRoot()
+    errors = []
+
+    def work(task):
+        raise ValueError("bad input")
+
+    task = BackgroundTask(root, work, on_error=errors.append).start()
+    root.run(task)
+    assert len(errors) == 1 and isinstance(errors[0], ValueError)
+
+
+def test_progress_raises_once_cancelled():
+    task = BackgroundTask(FakeRoot(), lambda task: None)
+    task.cancel()
+    with pytest.raises(TaskCancelled):
+        task.progress(0.1)